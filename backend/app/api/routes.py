@@ -2,6 +2,7 @@ import asyncio
 import re
 import json as _json
 from fastapi import APIRouter, Body, Depends, Query
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, desc
 from typing import List, Optional
@@ -66,6 +67,22 @@ briefing_service = BriefingService()
 tech_signals_service = TechnicalSignalsService()
 daily_analysis_service = DailyAnalysisService()
 
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson-rendered response (numpy scalars, non-str keys); stdlib json fallback.
+    Return it directly from an endpoint to skip FastAPI's jsonable_encoder pass."""
+
+    def render(self, content) -> bytes:
+        if _orjson is None:
+            return super().render(content)
+        return _orjson.dumps(content, option=_orjson.OPT_NON_STR_KEYS | _orjson.OPT_SERIALIZE_NUMPY)
+
+
 # Response-level cache for heavy endpoints
 import time as _time
 _response_cache: dict = {}
@@ -968,6 +985,10 @@ async def get_daily_briefing(
     Daily briefing: top stocks scored by earnings beat + RSI + momentum.
     Cached 30 min in memory + on disk (survives restarts).
     """
+    return FastJSONResponse(await _daily_briefing_payload(force, min_market_cap))
+
+
+async def _daily_briefing_payload(force: bool, min_market_cap: int) -> dict:
     cache_key = "briefing_daily"
     now = _time.time()
 
@@ -1003,6 +1024,7 @@ async def get_daily_briefing(
             result = await asyncio.wait_for(
                 briefing_service.get_daily_briefing(
                     min_market_cap=min_market_cap,
+                    force=force,
                 ),
                 timeout=120
             )
@@ -1629,8 +1651,8 @@ async def ib_account():
 
 
 @router.get("/ib/positions")
-async def ib_positions():
-    return await ib_service.get_positions()
+async def ib_positions(top: Optional[int] = Query(None, ge=1)):
+    return await ib_service.get_positions(top=top)
 
 
 @router.get("/ib/orders")
@@ -1,4 +1,8 @@
+import logging
+import logging.handlers
 import os
+import queue
+import sys
 import traceback
 from pathlib import Path
 
@@ -18,6 +22,24 @@ from app.services.normalization import NormalizationService
 from app.services.signal_engine import SignalEngine
 from app.config import settings
 
+
+def _setup_logging() -> logging.handlers.QueueListener:
+    """Send app.* logs through a queue; a QueueListener thread does the stdout writes,
+    so logging from coroutines never stalls the event loop on the stream lock."""
+    log_queue = queue.SimpleQueue()
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+    app_log = logging.getLogger("app")
+    app_log.setLevel(logging.INFO)
+    app_log.addHandler(logging.handlers.QueueHandler(log_queue))
+    app_log.propagate = False
+    listener = logging.handlers.QueueListener(log_queue, stream)
+    listener.start()
+    return listener
+
+
+_log_listener = _setup_logging()
+
 # Scheduler
 scheduler = AsyncIOScheduler()
 
@@ -100,6 +122,17 @@ async def lifespan(app: FastAPI):
             print(f'[Startup] Sector pre-warm failed (non-critical): {e}')
     asyncio.create_task(_prewarm_sectors())
 
+    # Pre-warm FDA + tech catalyst caches in one combined pass (shared Finviz/news fetch)
+    async def _prewarm_catalysts():
+        await asyncio.sleep(20)
+        try:
+            from app.api.routes import catalyst_tracker
+            await asyncio.wait_for(catalyst_tracker.refresh_all(), timeout=180)
+            print('[Startup] Catalyst caches warmed up')
+        except Exception as e:
+            print(f'[Startup] Catalyst pre-warm failed (non-critical): {e}')
+    asyncio.create_task(_prewarm_catalysts())
+
     # Smart Portfolio AI Brain — runs every 5 minutes during all trading sessions
     async def _smart_portfolio_tick():
         from datetime import datetime, timezone, timedelta
@@ -858,7 +891,11 @@ async def lifespan(app: FastAPI):
     print("Shutting down scheduler...")
     scheduler.shutdown()
 
+    from app.api.routes import catalyst_tracker
+    await catalyst_tracker.close()
+
     print("Cleanup complete.")
+    _log_listener.stop()
 
 
 # Create FastAPI app
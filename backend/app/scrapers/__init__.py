@@ -1,9 +1,23 @@
-from typing import List, Dict
+from contextlib import nullcontext
+from typing import List, Dict, Optional
 from datetime import datetime
 
+import aiohttp
+
+
+def http_session(shared: Optional[aiohttp.ClientSession] = None):
+    """`async with http_session(shared) as session:` — borrows a caller-owned
+    session (left open on exit) or opens a throwaway one that is closed."""
+    if shared is not None and not shared.closed:
+        return nullcontext(shared)
+    return aiohttp.ClientSession()
+
 
 class ScraperResult:
     """Standard format for scraper results"""
+    # Thousands are built per scan — slots drop the per-instance __dict__
+    __slots__ = ("source", "title", "url", "published_at", "summary", "tickers")
+
     def __init__(
         self,
         source: str,
@@ -14,6 +14,7 @@ Cache TTL: 15 minutes (FDA data changes infrequently).
 """
 
 import aiohttp
+import logging
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
@@ -22,6 +23,10 @@ import asyncio
 import json
 import time
 
+from app.scrapers import http_session
+
+log = logging.getLogger(__name__)
+
 
 # ─── Comprehensive company-to-ticker mapping ────────────────────────────
 COMPANY_TICKER_MAP = {
@@ -131,19 +136,21 @@ class FDACalendarScraper:
         self._cache: List[Dict] = []
         self._cache_time: float = 0
 
-    async def get_fda_events(self, days_forward: int = 90, days_back: int = 30) -> List[Dict]:
-        """Main entry point. Returns cached data if fresh, otherwise scrapes all sources."""
+    async def get_fda_events(self, days_forward: int = 90, days_back: int = 30,
+                             session: Optional[aiohttp.ClientSession] = None) -> List[Dict]:
+        """Main entry point. Returns cached data if fresh, otherwise scrapes all sources.
+        `session` — optional caller-owned session shared by every source."""
         now = time.time()
         if self._cache and (now - self._cache_time) < self.CACHE_TTL:
             return self._cache
 
         tasks = [
-            self._scrape_biopharmcatalyst(),
-            self._scrape_rttnews_fda(),
-            self._scrape_drugs_com(),
-            self._scrape_clinicaltrials_gov(),
-            self._scrape_checkrare(),
-            self._scrape_fdatracker(),
+            self._scrape_biopharmcatalyst(session),
+            self._scrape_rttnews_fda(session),
+            self._scrape_drugs_com(session),
+            self._scrape_clinicaltrials_gov(session),
+            self._scrape_checkrare(session),
+            self._scrape_fdatracker(session),
         ]
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -153,9 +160,9 @@ class FDACalendarScraper:
         for i, result in enumerate(results):
             if isinstance(result, list):
                 all_events.extend(result)
-                print(f"  FDA source {source_names[i]}: {len(result)} events")
+                log.info("FDA source %s: %s events", source_names[i], len(result))
             elif isinstance(result, Exception):
-                print(f"  FDA source {source_names[i]} error: {result}")
+                log.warning("FDA source %s error: %s", source_names[i], result)
 
         merged = self._merge_and_deduplicate(all_events)
 
@@ -187,21 +194,21 @@ class FDACalendarScraper:
 
         self._cache = filtered
         self._cache_time = time.time()
-        print(f"FDA Calendar: {len(filtered)} total events (from {len(all_events)} raw)")
+        log.info("FDA Calendar: %s total events (from %s raw)", len(filtered), len(all_events))
         return filtered
 
     # ─── Source 1: BioPharmCatalyst ──────────────────────────────────────
 
-    async def _scrape_biopharmcatalyst(self) -> List[Dict]:
+    async def _scrape_biopharmcatalyst(self, shared: Optional[aiohttp.ClientSession] = None) -> List[Dict]:
         """Scrape BioPharmCatalyst FDA calendar."""
         events = []
         url = "https://www.biopharmcatalyst.com/calendars/fda-calendar"
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with http_session(shared) as session:
                 async with session.get(url, headers=self.headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
                     if response.status != 200:
-                        print(f"BioPharmCatalyst returned {response.status}")
+                        log.warning("BioPharmCatalyst returned %s", response.status)
                         return events
 
                     html = await response.text()
@@ -253,7 +260,7 @@ class FDACalendarScraper:
                         events.extend(self._parse_biopharm_cards(soup))
 
         except Exception as e:
-            print(f"BioPharmCatalyst error: {e}")
+            log.warning("BioPharmCatalyst error: %s", e)
 
         return events
 
@@ -288,7 +295,7 @@ class FDACalendarScraper:
                         'source_url': 'https://www.biopharmcatalyst.com/calendars/fda-calendar',
                     })
         except Exception as e:
-            print(f"Error parsing BioPharmCatalyst NEXT_DATA: {e}")
+            log.warning("Error parsing BioPharmCatalyst NEXT_DATA: %s", e)
 
         return events
 
@@ -377,13 +384,13 @@ class FDACalendarScraper:
 
     # ─── Source 2: RTTNews ───────────────────────────────────────────────
 
-    async def _scrape_rttnews_fda(self) -> List[Dict]:
+    async def _scrape_rttnews_fda(self, shared: Optional[aiohttp.ClientSession] = None) -> List[Dict]:
         """Scrape RTTNews FDA Calendar — robust multi-strategy parsing."""
         events = []
         url = "https://www.rttnews.com/CorpInfo/FDACalendar.aspx"
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with http_session(shared) as session:
                 async with session.get(url, headers=self.headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
                     if response.status != 200:
                         return events
@@ -412,7 +419,7 @@ class FDACalendarScraper:
                         events.extend(self._parse_rttnews_links(soup, url))
 
         except Exception as e:
-            print(f"RTTNews FDA error: {e}")
+            log.warning("RTTNews FDA error: %s", e)
 
         return events
 
@@ -669,13 +676,13 @@ class FDACalendarScraper:
 
     # ─── Source 3: Drugs.com ─────────────────────────────────────────────
 
-    async def _scrape_drugs_com(self) -> List[Dict]:
+    async def _scrape_drugs_com(self, shared: Optional[aiohttp.ClientSession] = None) -> List[Dict]:
         """Scrape Drugs.com new drug approvals."""
         events = []
         url = "https://www.drugs.com/newdrugs.html"
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with http_session(shared) as session:
                 async with session.get(url, headers=self.headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
                     if response.status != 200:
                         return events
@@ -731,13 +738,13 @@ class FDACalendarScraper:
                             continue
 
         except Exception as e:
-            print(f"Drugs.com error: {e}")
+            log.warning("Drugs.com error: %s", e)
 
         return events
 
     # ─── Source 4: ClinicalTrials.gov ────────────────────────────────────
 
-    async def _scrape_clinicaltrials_gov(self) -> List[Dict]:
+    async def _scrape_clinicaltrials_gov(self, shared: Optional[aiohttp.ClientSession] = None) -> List[Dict]:
         """Query ClinicalTrials.gov API for Phase 3 biotech trials nearing completion."""
         events = []
         base_url = "https://clinicaltrials.gov/api/v2/studies"
@@ -752,11 +759,11 @@ class FDACalendarScraper:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with http_session(shared) as session:
                 async with session.get(base_url, params=params, headers=self.headers,
                                        timeout=aiohttp.ClientTimeout(total=10)) as response:
                     if response.status != 200:
-                        print(f"ClinicalTrials.gov returned {response.status}")
+                        log.warning("ClinicalTrials.gov returned %s", response.status)
                         return events
 
                     data = await response.json()
@@ -812,13 +819,13 @@ class FDACalendarScraper:
                             continue
 
         except Exception as e:
-            print(f"ClinicalTrials.gov error: {e}")
+            log.warning("ClinicalTrials.gov error: %s", e)
 
         return events
 
     # ─── Source 5: CheckRare Orphan Drug PDUFA Dates ─────────────────────
 
-    async def _scrape_checkrare(self) -> List[Dict]:
+    async def _scrape_checkrare(self, shared: Optional[aiohttp.ClientSession] = None) -> List[Dict]:
         """Scrape CheckRare orphan drug PDUFA dates — well-structured HTML tables."""
         events = []
         current_year = datetime.now().year
@@ -829,7 +836,7 @@ class FDACalendarScraper:
 
         for url in urls:
             try:
-                async with aiohttp.ClientSession() as session:
+                async with http_session(shared) as session:
                     async with session.get(url, headers=self.headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
                         if response.status != 200:
                             continue
@@ -868,7 +875,7 @@ class FDACalendarScraper:
                             events.extend(self._parse_checkrare_article(soup, url))
 
             except Exception as e:
-                print(f"CheckRare error ({url}): {e}")
+                log.warning("CheckRare error (%s): %s", url, e)
 
         return events
 
@@ -995,7 +1002,7 @@ class FDACalendarScraper:
 
     # ─── Source 6: FDATracker.com ────────────────────────────────────────
 
-    async def _scrape_fdatracker(self) -> List[Dict]:
+    async def _scrape_fdatracker(self, shared: Optional[aiohttp.ClientSession] = None) -> List[Dict]:
         """
         Scrape FDATracker.com FDA Calendar page.
         The standard calendar is a Google Calendar embed; we parse any available
@@ -1010,7 +1017,7 @@ class FDACalendarScraper:
 
         for url in urls:
             try:
-                async with aiohttp.ClientSession() as session:
+                async with http_session(shared) as session:
                     async with session.get(url, headers=self.headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
                         if response.status != 200:
                             continue
@@ -1023,7 +1030,7 @@ class FDACalendarScraper:
                         for iframe in iframes:
                             src = iframe.get('src', '')
                             if 'calendar.google.com' in src:
-                                cal_events = await self._scrape_google_calendar_embed(src)
+                                cal_events = await self._scrape_google_calendar_embed(src, shared)
                                 events.extend(cal_events)
 
                         # Strategy 2: Parse any tables on the page
@@ -1088,11 +1095,12 @@ class FDACalendarScraper:
                                 })
 
             except Exception as e:
-                print(f"FDATracker error ({url}): {e}")
+                log.warning("FDATracker error (%s): %s", url, e)
 
         return events
 
-    async def _scrape_google_calendar_embed(self, embed_url: str) -> List[Dict]:
+    async def _scrape_google_calendar_embed(self, embed_url: str,
+                                            shared: Optional[aiohttp.ClientSession] = None) -> List[Dict]:
         """Try to extract events from a Google Calendar embed URL."""
         events = []
         try:
@@ -1109,7 +1117,7 @@ class FDACalendarScraper:
             # Try to fetch public iCal feed
             ical_url = f"https://calendar.google.com/calendar/ical/{urllib.parse.quote(calendar_id)}/public/basic.ics"
 
-            async with aiohttp.ClientSession() as session:
+            async with http_session(shared) as session:
                 async with session.get(ical_url, timeout=aiohttp.ClientTimeout(total=10)) as response:
                     if response.status != 200:
                         return events
@@ -1118,7 +1126,7 @@ class FDACalendarScraper:
                     events.extend(self._parse_ical_events(ical_text))
 
         except Exception as e:
-            print(f"Google Calendar embed error: {e}")
+            log.warning("Google Calendar embed error: %s", e)
 
         return events
 
@@ -10,12 +10,17 @@ Per-ticker cache: 300s TTL.
 """
 
 import aiohttp
+import logging
 from bs4 import BeautifulSoup
 from typing import Dict, List, Optional
 import re
 import asyncio
 import time
 
+from app.scrapers import http_session
+
+log = logging.getLogger(__name__)
+
 
 class FinvizFundamentals:
     QUOTE_URL = "https://finviz.com/quote.ashx"
@@ -235,7 +240,7 @@ class FinvizFundamentals:
                 self._price_cache_time = now
 
         except Exception as e:
-            print(f"Finviz get_prices_batch error: {e}")
+            log.warning("Finviz get_prices_batch error: %s", e)
 
         return results if results else self._price_cache_fallback(tickers)
 
@@ -256,8 +261,10 @@ class FinvizFundamentals:
         except (ValueError, TypeError):
             return 0
 
-    async def get_fundamentals_batch(self, tickers: List[str]) -> Dict[str, Dict]:
-        """Fetch fundamentals for a batch of tickers with bounded concurrency."""
+    async def get_fundamentals_batch(self, tickers: List[str],
+                                     session: Optional[aiohttp.ClientSession] = None) -> Dict[str, Dict]:
+        """Fetch fundamentals for a batch of tickers with bounded concurrency.
+        `session` — optional caller-owned session reused across the batch."""
         sem = asyncio.Semaphore(self.MAX_CONCURRENT)
         now = time.time()
         results = {}
@@ -273,13 +280,13 @@ class FinvizFundamentals:
                 await asyncio.sleep((idx % self.MAX_CONCURRENT) * 0.05)
 
                 try:
-                    data = await self._fetch_fundamentals(ticker)
+                    data = await self._fetch_fundamentals(ticker, session)
                     if data:
                         self._ticker_cache[ticker] = data
                         self._ticker_cache_time[ticker] = time.time()
                     return ticker, data
                 except Exception as e:
-                    print(f"Finviz fundamentals error {ticker}: {e}")
+                    log.warning("Finviz fundamentals error %s: %s", ticker, e)
                     return ticker, None
 
         try:
@@ -295,11 +302,12 @@ class FinvizFundamentals:
                     if data:
                         results[ticker] = data
         except asyncio.TimeoutError:
-            print("Finviz fundamentals OVERALL TIMEOUT (>35s) — returning partial")
+            log.warning("Finviz fundamentals OVERALL TIMEOUT (>35s) — returning partial")
 
         return results
 
-    async def _fetch_fundamentals(self, ticker: str) -> Optional[Dict]:
+    async def _fetch_fundamentals(self, ticker: str,
+                                  shared: Optional[aiohttp.ClientSession] = None) -> Optional[Dict]:
         """Fetch and parse fundamentals for a single ticker."""
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -315,7 +323,7 @@ class FinvizFundamentals:
 
         try:
             html = None
-            async with aiohttp.ClientSession() as session:
+            async with http_session(shared) as session:
                 for _attempt in range(3):
                     async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
                         if response.status == 429:
@@ -350,7 +358,7 @@ class FinvizFundamentals:
             return data
 
         except Exception as e:
-            print(f"Finviz fetch error {ticker}: {e}")
+            log.warning("Finviz fetch error %s: %s", ticker, e)
             return None
 
     def _parse_snapshot_table(self, soup: BeautifulSoup) -> Dict:
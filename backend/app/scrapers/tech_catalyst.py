@@ -6,6 +6,7 @@ Returns events in the same shape as FDA calendar events for unified handling.
 """
 
 import aiohttp
+import logging
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
@@ -15,6 +16,10 @@ import time
 import yfinance as yf
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
 
+from app.scrapers import http_session
+
+log = logging.getLogger(__name__)
+
 
 # Major tech stocks to track for catalysts
 TECH_WATCHLIST = [
@@ -42,7 +47,8 @@ class TechCatalystScraper:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         }
 
-    async def get_tech_catalyst_events(self, days_forward: int = 90) -> List[Dict]:
+    async def get_tech_catalyst_events(self, days_forward: int = 90,
+                                       session: Optional[aiohttp.ClientSession] = None) -> List[Dict]:
         """Main entry point. Returns tech stock catalyst events."""
         now = time.time()
         if self._cache and (now - self._cache_time) < self.CACHE_TTL:
@@ -50,7 +56,7 @@ class TechCatalystScraper:
 
         tasks = [
             self._get_earnings_dates(),
-            self._scrape_yahoo_earnings_calendar(),
+            self._scrape_yahoo_earnings_calendar(session),
         ]
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -96,7 +102,7 @@ class TechCatalystScraper:
 
         self._cache = filtered
         self._cache_time = time.time()
-        print(f"Tech Catalysts: {len(filtered)} events")
+        log.info("Tech Catalysts: %s events", len(filtered))
         return filtered
 
     async def _get_earnings_dates(self) -> List[Dict]:
@@ -126,7 +132,7 @@ class TechCatalystScraper:
                     return []
 
         try:
-            print(f"Tech: Fetching earnings for {len(TECH_WATCHLIST)} tickers...")
+            log.info("Tech: Fetching earnings for %s tickers...", len(TECH_WATCHLIST))
             tasks = [fetch_one(t, i) for i, t in enumerate(TECH_WATCHLIST)]
             results = await asyncio.wait_for(
                 asyncio.gather(*tasks, return_exceptions=True),
@@ -136,9 +142,9 @@ class TechCatalystScraper:
             for result in results:
                 if isinstance(result, list):
                     events.extend(result)
-            print(f"Tech: Found {found_count} earnings events from yfinance")
+            log.info("Tech: Found %s earnings events from yfinance", found_count)
         except asyncio.TimeoutError:
-            print(f"Tech earnings fetch OVERALL TIMEOUT (got {found_count} so far)")
+            log.warning("Tech earnings fetch OVERALL TIMEOUT (got %s so far)", found_count)
 
         return events
 
@@ -199,14 +205,14 @@ class TechCatalystScraper:
                                     'source_url': f'https://finance.yahoo.com/quote/{ticker}',
                                 })
             except Exception as e:
-                print(f"  Tech calendar error {ticker}: {e}")
+                log.warning("Tech calendar error %s: %s", ticker, e)
 
         except Exception as e:
-            print(f"  Tech ticker error {ticker}: {e}")
+            log.warning("Tech ticker error %s: %s", ticker, e)
 
         return events
 
-    async def _scrape_yahoo_earnings_calendar(self) -> List[Dict]:
+    async def _scrape_yahoo_earnings_calendar(self, shared: Optional[aiohttp.ClientSession] = None) -> List[Dict]:
         """Scrape Yahoo Finance earnings calendar for upcoming tech earnings."""
         events = []
         # Check next 7 days of earnings
@@ -218,7 +224,7 @@ class TechCatalystScraper:
 
             try:
                 url = f"https://finance.yahoo.com/calendar/earnings?day={date_str}"
-                async with aiohttp.ClientSession() as session:
+                async with http_session(shared) as session:
                     async with session.get(url, headers=self.headers,
                                            timeout=aiohttp.ClientTimeout(total=10)) as response:
                         if response.status != 200:
@@ -10,10 +10,17 @@ Logic:
 """
 
 import asyncio
+import copy
 import functools
+import re
+import time
+from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
 from datetime import datetime, timedelta
+from itertools import chain
 from typing import List, Dict, Optional
+from zoneinfo import ZoneInfo
+import numpy as np
 import yfinance as yf
 import aiohttp
 from bs4 import BeautifulSoup
@@ -46,18 +53,18 @@ def _translate_batch(texts: list[str]) -> list[str]:
 
 # ── RSI calculation (Wilder's smoothing) ──────────────────────────────────────
 
-def _calc_rsi(prices: list, period: int = 14) -> Optional[float]:
-    if not prices or len(prices) < period + 1:
+def _calc_rsi(prices, period: int = 14) -> Optional[float]:
+    """prices: list or ndarray of closes, oldest first."""
+    if prices is None or len(prices) < period + 1:
         return None
-    p = prices[-(period * 3):]
-    deltas = [p[i + 1] - p[i] for i in range(len(p) - 1)]
-    gains = [max(d, 0.0) for d in deltas]
-    losses = [max(-d, 0.0) for d in deltas]
-    avg_gain = sum(gains[:period]) / period
-    avg_loss = sum(losses[:period]) / period
-    for i in range(period, len(gains)):
-        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+    deltas = np.diff(np.asarray(prices[-(period * 3):], dtype=np.float64))
+    gains = np.maximum(deltas, 0.0)
+    losses = np.maximum(-deltas, 0.0)
+    avg_gain = float(gains[:period].mean())
+    avg_loss = float(losses[:period].mean())
+    for g, l in zip(gains[period:].tolist(), losses[period:].tolist()):
+        avg_gain = (avg_gain * (period - 1) + g) / period
+        avg_loss = (avg_loss * (period - 1) + l) / period
     if avg_loss == 0:
         return 100.0 if avg_gain > 0 else 50.0
     rs = avg_gain / avg_loss
@@ -293,6 +300,15 @@ def _watch_level_text(price: float, resistance: float, support: float) -> str:
 
 # ── Per-ticker yfinance fetch ─────────────────────────────────────────────────
 
+def _call_with_timeout(executor: Optional[ThreadPoolExecutor], fn, timeout: float):
+    """Run a blocking yfinance accessor on the given pool, bounded by timeout.
+    Without a pool the call runs inline. The pool must not be the one the caller
+    itself is running on, or the call can starve behind its own caller."""
+    if executor is None:
+        return fn()
+    return executor.submit(fn).result(timeout=timeout)
+
+
 def _compute_score(surprise_pct: Optional[float], rsi: Optional[float],
                    price_change_since_earnings: float, has_8k: bool) -> float:
     """Composite score 0-100. Higher = more interesting for briefing."""
@@ -350,7 +366,8 @@ def _fetch_ticker_data_sync(ticker: str, min_surprise_pct: float = 0.0,
                             rsi_min: float = 20.0,
                             rsi_max: float = 90.0,
                             min_market_cap: int = 500_000_000,
-                            qqq_20d_pct: float = 0.0) -> Optional[Dict]:
+                            qqq_20d_pct: float = 0.0,
+                            executor: Optional[ThreadPoolExecutor] = None) -> Optional[Dict]:
     """Fetch price/RSI/earnings for one ticker. Returns scored dict or None if no price data.
     Uses composite scoring — no hard reject on earnings/RSI alone.
     """
@@ -365,8 +382,7 @@ def _fetch_ticker_data_sync(ticker: str, min_surprise_pct: float = 0.0,
         earnings_history: list = []   # last 4 quarters
         next_earnings_date = None
         try:
-            with ThreadPoolExecutor(max_workers=1) as ex:
-                ed = ex.submit(lambda: stock.earnings_dates).result(timeout=4)
+            ed = _call_with_timeout(executor, lambda: stock.earnings_dates, 4)
             if ed is not None and not ed.empty:
                 import pandas as pd
                 now = datetime.now()
@@ -438,24 +454,24 @@ def _fetch_ticker_data_sync(ticker: str, min_surprise_pct: float = 0.0,
             hist = stock.history(period='60d', interval='1d', timeout=4)
             if hist is None or hist.empty:
                 return None
-            closes = list(hist['Close'])
+            closes = hist['Close'].to_numpy()
             rsi = _calc_rsi(closes, period=14)
-            price = float(hist['Close'].iloc[-1])
+            price = float(closes[-1])
             if price < 1.0:
                 return None  # reject penny stocks
-            resistance = float(hist['High'].tail(20).max())
-            support = float(hist['Low'].tail(10).min())
+            resistance = float(hist['High'].to_numpy()[-20:].max())
+            support = float(hist['Low'].to_numpy()[-10:].min())
             atr_pct = _calc_atr(hist)
-            today_pct = round((closes[-1] - closes[-2]) / closes[-2] * 100, 2) if len(closes) >= 2 else None
-            price_history = [round(float(c), 2) for c in closes[-20:]]
+            today_pct = round(float((closes[-1] - closes[-2]) / closes[-2] * 100), 2) if len(closes) >= 2 else None
+            price_history = [round(c, 2) for c in closes[-20:].tolist()]
 
             if earnings_date:
-                for idx, row in hist.iterrows():
+                for idx, close in zip(hist.index, closes.tolist()):
                     idx_date = idx.date() if hasattr(idx, 'date') else idx
                     if hasattr(idx_date, 'date'):
                         idx_date = idx_date.date()
                     if str(idx_date) >= earnings_date:
-                        price_at_earnings = float(row['Close'])
+                        price_at_earnings = close
                         break
                 if price_at_earnings and price_at_earnings > 0:
                     price_change_since_earnings = round(
@@ -479,7 +495,7 @@ def _fetch_ticker_data_sync(ticker: str, min_surprise_pct: float = 0.0,
             week52_high = float(getattr(fi, 'year_high', 0) or 0)
             week52_low = float(getattr(fi, 'year_low', 0) or 0)
             avg_volume = int(getattr(fi, 'three_month_average_volume', 0) or 0)
-            today_vol = int(hist['Volume'].iloc[-1]) if not hist.empty else 0
+            today_vol = int(hist['Volume'].to_numpy()[-1]) if not hist.empty else 0
             if avg_volume > 0 and today_vol > 0:
                 volume_ratio = round(today_vol / avg_volume, 1)
         except Exception:
@@ -493,14 +509,13 @@ def _fetch_ticker_data_sync(ticker: str, min_surprise_pct: float = 0.0,
         rs_vs_qqq = None
         if qqq_20d_pct and len(closes) >= 20:
             try:
-                stock_20d = (closes[-1] - closes[-20]) / closes[-20] * 100
+                stock_20d = float((closes[-1] - closes[-20]) / closes[-20] * 100)
                 rs_vs_qqq = round(stock_20d - qqq_20d_pct, 1)
             except Exception:
                 pass
 
         try:
-            with ThreadPoolExecutor(max_workers=1) as ex:
-                info = ex.submit(lambda: stock.info or {}).result(timeout=2)
+            info = _call_with_timeout(executor, lambda: stock.info or {}, 2)
             company = str(info.get('longName') or info.get('shortName') or ticker)
             sector = str(info.get('sector') or '')
             if market_cap == 0:
@@ -513,8 +528,7 @@ def _fetch_ticker_data_sync(ticker: str, min_surprise_pct: float = 0.0,
         # ── News: yfinance (new nested content structure) ──────────────────
         recent_news = []
         try:
-            with ThreadPoolExecutor(max_workers=1) as ex:
-                raw_news = ex.submit(lambda: stock.news or []).result(timeout=4)
+            raw_news = _call_with_timeout(executor, lambda: stock.news or [], 4)
             parsed = []
             for n in raw_news[:5]:
                 content = n.get('content', n)  # new API has nested 'content', old API is flat
@@ -737,44 +751,88 @@ def fetch_single_ticker_briefing(ticker: str) -> Dict:
 
 # ── Market status (SPY + QQQ) ─────────────────────────────────────────────────
 
-def _fetch_market_status_sync() -> Dict:
+# SPY daily closes before the latest bar, as a prefix sum with a leading 0.
+# Valid for one trading day: (date, latest_bar_date, cumsum). Warm calls fetch
+# only 5d of SPY and get MA50/MA200 from two subtractions.
+_SPY_CLOSE_CACHE: Optional[tuple] = None
+
+
+def _spy_close_cumsum(ticker: yf.Ticker, daily_5d) -> Optional[np.ndarray]:
+    """Prefix sum of SPY closes preceding daily_5d's last bar (1y lookback)."""
+    global _SPY_CLOSE_CACHE
+    today = datetime.now().date()
+    last_bar = daily_5d.index[-1]
+    cached = _SPY_CLOSE_CACHE
+    if cached is not None and cached[0] == today and cached[1] == last_bar:
+        return cached[2]
+    daily = ticker.history(period='1y', interval='1d', timeout=5)
+    if daily is None or daily.empty or daily.index[-1] != last_bar:
+        return None
+    closes = daily['Close'].to_numpy()[:-1]
+    cs = np.concatenate(([0.0], np.cumsum(closes, dtype=np.float64)))
+    _SPY_CLOSE_CACHE = (today, last_bar, cs)
+    return cs
+
+
+def _window_mean(cs: np.ndarray, last: float, window: int) -> Optional[float]:
+    """Mean of the last `window` closes: cached prefix sum plus the live bar."""
+    m = len(cs) - 1
+    if m + 1 < window:
+        return None
+    return float((cs[m] - cs[m - window + 1] + last) / window)
+
+
+@dataclass(slots=True)
+class _IdxQuote:
+    price: float
+    change_pct: float
+
+
+def _fetch_market_status_sync(executor: Optional[ThreadPoolExecutor] = None) -> Dict:
     try:
-        data = {}
+        quotes: Dict[str, _IdxQuote] = {}
         spy_daily = None
+        spy_ticker = None
 
         for sym in ['SPY', 'QQQ']:
             try:
                 t = yf.Ticker(sym)
                 intra = t.history(period='1d', interval='5m', timeout=5, prepost=True)
-                # Fetch 1y daily for SPY (MA200), 5d for QQQ
-                period_str = '1y' if sym == 'SPY' else '5d'
-                daily = t.history(period=period_str, interval='1d', timeout=5)
+                # 5d daily for prev close; SPY's 1y history for MA200 is cached per day
+                daily = t.history(period='5d', interval='1d', timeout=5)
                 if intra is not None and not intra.empty and daily is not None and len(daily) >= 2:
                     last = float(intra['Close'].iloc[-1])
                     prev_close = float(daily['Close'].iloc[-2])
                     pct = round((last - prev_close) / prev_close * 100, 2)
-                    data[sym] = {'price': round(last, 2), 'change_pct': pct}
+                    quotes[sym] = _IdxQuote(round(last, 2), pct)
                     if sym == 'SPY':
-                        spy_daily = daily
+                        spy_daily, spy_ticker = daily, t
                 elif daily is not None and len(daily) >= 2:
                     prev = float(daily['Close'].iloc[-2])
                     last = float(daily['Close'].iloc[-1])
                     pct = round((last - prev) / prev * 100, 2)
-                    data[sym] = {'price': round(last, 2), 'change_pct': pct}
+                    quotes[sym] = _IdxQuote(round(last, 2), pct)
                     if sym == 'SPY':
-                        spy_daily = daily
+                        spy_daily, spy_ticker = daily, t
             except Exception:
-                data[sym] = {'price': 0, 'change_pct': 0}
+                quotes[sym] = _IdxQuote(0, 0)
 
         # SPY Moving Averages (50 / 200) + market timing signal
         spy_ma50 = spy_ma200 = spy_vs_200_pct = ma_signal = None
+        cs = None
         if spy_daily is not None:
-            closes_spy = spy_daily['Close'].values
-            spy_price = float(closes_spy[-1])
-            if len(closes_spy) >= 50:
-                spy_ma50 = round(float(closes_spy[-50:].mean()), 2)
-            if len(closes_spy) >= 200:
-                spy_ma200 = round(float(closes_spy[-200:].mean()), 2)
+            try:
+                cs = _spy_close_cumsum(spy_ticker, spy_daily)
+            except Exception:
+                cs = None
+        if cs is not None:
+            spy_price = float(spy_daily['Close'].to_numpy()[-1])
+            ma50 = _window_mean(cs, spy_price, 50)
+            ma200 = _window_mean(cs, spy_price, 200)
+            if ma50 is not None:
+                spy_ma50 = round(ma50, 2)
+            if ma200 is not None:
+                spy_ma200 = round(ma200, 2)
                 spy_vs_200_pct = round((spy_price - spy_ma200) / spy_ma200 * 100, 1)
                 if spy_price > spy_ma200 * 1.03:
                     ma_signal = 'bullish'    # >3% above 200 MA — healthy uptrend
@@ -791,20 +849,31 @@ def _fetch_market_status_sync() -> Dict:
             pass
 
         # Sector ETF performance (parallel)
-        sector_perf = {}
-        with ThreadPoolExecutor(max_workers=4) as ex:
+        perf_syms: List[str] = []
+        perf_names: List[str] = []
+        perf_pcts: List[float] = []
+        own_pool = executor is None
+        ex = ThreadPoolExecutor(max_workers=4) if own_pool else executor
+        try:
             futs = {ex.submit(_fetch_sector_etf_sync, sym): (sym, name)
                     for sym, name in SECTOR_ETFS.items()}
             for fut, (sym, name) in futs.items():
                 try:
                     _, pct = fut.result(timeout=8)
                     if pct is not None:
-                        sector_perf[sym] = {'name': name, 'pct': pct}
+                        perf_syms.append(sym)
+                        perf_names.append(name)
+                        perf_pcts.append(pct)
                 except Exception:
                     pass
+        finally:
+            if own_pool:
+                ex.shutdown(wait=False)
 
-        spy_pct = data.get('SPY', {}).get('change_pct', 0)
-        qqq_pct = data.get('QQQ', {}).get('change_pct', 0)
+        spy = quotes.get('SPY')
+        qqq = quotes.get('QQQ')
+        spy_pct = spy.change_pct if spy else 0
+        qqq_pct = qqq.change_pct if qqq else 0
 
         if spy_pct > 0.5 and qqq_pct > 0.5:
             mood = "סביבת שוק חיובית — רוח גב למניות צמיחה"
@@ -817,15 +886,18 @@ def _fetch_market_status_sync() -> Dict:
         qqq_str = f"QQQ {'+' if qqq_pct >= 0 else ''}{qqq_pct}%"
 
         return {
-            'spy': data.get('SPY', {}),
-            'qqq': data.get('QQQ', {}),
+            'spy': {'price': spy.price, 'change_pct': spy.change_pct} if spy else {},
+            'qqq': {'price': qqq.price, 'change_pct': qqq.change_pct} if qqq else {},
             'summary': f"{spy_str}, {qqq_str} — {mood}",
             'vix': vix,
             'spy_ma50': spy_ma50,
             'spy_ma200': spy_ma200,
             'spy_vs_200_pct': spy_vs_200_pct,
             'ma_signal': ma_signal,
-            'sector_perf': sector_perf,
+            'sector_perf': {
+                sym: {'name': name, 'pct': pct}
+                for sym, name, pct in zip(perf_syms, perf_names, perf_pcts)
+            },
         }
     except Exception:
         return {'spy': {}, 'qqq': {}, 'summary': 'נתוני שוק לא זמינים'}
@@ -833,6 +905,48 @@ def _fetch_market_status_sync() -> Dict:
 
 # ── Candidate universe from Finviz ────────────────────────────────────────────
 
+# Sector-diverse anchors — guaranteed healthcare + other sectors.
+# Interleaved so the cap doesn't cut any sector out.
+_SECTOR_ANCHORS = (
+    # Tech
+    'NVDA', 'META', 'MSFT', 'AAPL', 'GOOGL', 'AMZN',
+    'CRM', 'SNOW', 'MDB', 'NET', 'PANW', 'CRWD',
+    'DDOG', 'ZS', 'APP', 'PLTR', 'SMCI', 'AMD',
+    'COIN', 'RBLX', 'ROKU', 'PYPL', 'ZM', 'SPOT',
+    'CELH', 'BILL', 'HUBS', 'RBRK', 'DKNG', 'ABNB',
+    # Healthcare (large-cap)
+    'LLY', 'UNH', 'ABBV', 'JNJ', 'MRK', 'PFE',
+    'AMGN', 'BMY', 'CI', 'CVS', 'ISRG', 'HUM',
+    'MDT', 'EW', 'SYK', 'BSX',
+    # Financials
+    'GS', 'JPM', 'MS', 'V', 'MA', 'AXP',
+    'BLK', 'SCHW', 'SPGI', 'MCO',
+    # Consumer / Retail
+    'COST', 'WMT', 'HD', 'NKE', 'SBUX', 'MCD',
+    'CMG', 'BURL', 'TJX', 'ROST',
+    # Industrials / Energy
+    'CAT', 'GE', 'HON', 'RTX', 'AXON',
+    'XOM', 'CVX', 'COP',
+    # Semiconductors
+    'AVGO', 'QCOM', 'MU', 'AMAT', 'LRCX', 'TXN',
+    # Real Estate / Utilities
+    'AMT', 'EQIX', 'PLD',
+)
+
+# Biotech tickers — always added
+_BIOTECH_TICKERS = (
+    'MRNA', 'REGN', 'VRTX', 'GILD', 'ALNY', 'ARQT', 'ACAD',
+    'NBIX', 'INSM', 'NUVL', 'APLS', 'TGTX', 'RCKT', 'RVMD',
+)
+
+
+# Every cell in a screener row is an <a class="tab-link" href="quote.ashx?t=TICKER…">,
+# so the ticker is read from the href and deduped per row.
+_FINVIZ_TAB_LINK_RE = re.compile(
+    r'<a\b(?=[^>]*\bclass="[^"]*\btab-link\b)[^>]*\bhref="[^"]*quote\.ashx\?t=([A-Z][A-Z.\-]{0,6})[&"]'
+)
+
+
 async def _scrape_finviz_tickers(session: aiohttp.ClientSession, url: str) -> List[str]:
     """Scrape tickers from a Finviz screener URL."""
     headers = {'User-Agent': 'Mozilla/5.0 (compatible; StockScanner/1.0)'}
@@ -842,6 +956,10 @@ async def _scrape_finviz_tickers(session: aiohttp.ClientSession, url: str) -> Li
             if resp.status != 200:
                 return []
             html = await resp.text()
+        # Fast path: regex over raw HTML; fall back to a DOM parse on layout drift
+        tickers = list(dict.fromkeys(_FINVIZ_TAB_LINK_RE.findall(html)))
+        if tickers:
+            return tickers
         soup = BeautifulSoup(html, 'html.parser')
         rows = soup.select('tr.styled-row-light, tr.styled-row-dark, tr[id^="row"]')
         for row in rows:
@@ -868,18 +986,22 @@ def _fetch_volume_ticker_sync(ticker: str) -> Optional[Dict]:
         if hist is None or hist.empty or len(hist) < 2:
             return None
 
-        price = float(hist['Close'].iloc[-1])
+        closes = hist['Close'].to_numpy()
+        volumes = hist['Volume'].to_numpy()
+        n = len(closes)
+
+        price = float(closes[-1])
         if price < 1.0:
             return None
 
         # Price changes
-        prev_close = float(hist['Close'].iloc[-2])
+        prev_close = float(closes[-2])
         chg_1d = round((price / prev_close - 1) * 100, 2) if prev_close > 0 else 0
-        chg_5d = round((price / float(hist['Close'].iloc[max(-6, -len(hist))]) - 1) * 100, 2) if len(hist) >= 5 else chg_1d
+        chg_5d = round((price / float(closes[max(-6, -n)]) - 1) * 100, 2) if n >= 5 else chg_1d
 
         # Relative volume (today vs average of prior days)
-        today_vol = float(hist['Volume'].iloc[-1])
-        avg_vol = float(hist['Volume'].iloc[:-1].mean()) if len(hist) > 1 else today_vol
+        today_vol = float(volumes[-1])
+        avg_vol = float(volumes[:-1].mean()) if n > 1 else today_vol
         rel_vol = round(today_vol / avg_vol, 2) if avg_vol > 0 else 1.0
 
         # Only include if there's meaningful volume surge or price move
@@ -887,7 +1009,6 @@ def _fetch_volume_ticker_sync(ticker: str) -> Optional[Dict]:
             return None
 
         # RSI
-        closes = list(hist['Close'])
         rsi = _calc_rsi(closes, period=14)
 
         # Market cap (fast, no hang)
@@ -898,12 +1019,11 @@ def _fetch_volume_ticker_sync(ticker: str) -> Optional[Dict]:
         except Exception:
             pass
 
-        # Company name + sector — quick, with timeout
+        # Company name + sector — bounded by the caller's wait_for
         company = ticker
         sector = ''
         try:
-            with ThreadPoolExecutor(max_workers=1) as ex:
-                info = ex.submit(lambda: stock.info or {}).result(timeout=2)
+            info = stock.info or {}
             company = str(info.get('longName') or info.get('shortName') or ticker)
             sector = str(info.get('sector') or '')
             if market_cap == 0:
@@ -911,8 +1031,8 @@ def _fetch_volume_ticker_sync(ticker: str) -> Optional[Dict]:
         except Exception:
             pass
 
-        resistance = float(hist['High'].tail(10).max())
-        support = float(hist['Low'].tail(5).min())
+        resistance = float(hist['High'].to_numpy()[-10:].max())
+        support = float(hist['Low'].to_numpy()[-5:].min())
 
         return {
             'ticker': ticker,
@@ -955,91 +1075,87 @@ async def _get_candidate_tickers(session: aiohttp.ClientSession) -> tuple:
     all_tasks = [_scrape_finviz_tickers(session, u) for u in earnings_urls + volume_urls]
     results = await asyncio.gather(*all_tasks, return_exceptions=True)
 
-    tickers = []
-    for r in results[:2]:
-        if isinstance(r, list):
-            tickers.extend(r)
-
-    # Deduplicate earnings tickers, cap at 30
-    seen = set()
-    result = []
-    for t in tickers:
-        if t not in seen:
-            seen.add(t)
-            result.append(t)
-        if len(result) >= 30:
-            break
+    # Earnings tickers: order-preserving dedupe, cap at 30
+    earnings_flat = [t for r in results[:2] if isinstance(r, list) for t in r]
+    earnings = list(dict.fromkeys(earnings_flat))[:30]
 
     # Volume tickers (separate pool, cap at 20, no overlap with earnings)
-    volume_tickers = []
-    vol_seen = set(result)
-    for r in results[2:]:
-        if isinstance(r, list):
-            for t in r:
-                if t not in vol_seen:
-                    vol_seen.add(t)
-                    volume_tickers.append(t)
-                if len(volume_tickers) >= 20:
-                    break
-    volume_tickers = volume_tickers[:20]
-
-    # Track how many tickers came from Finviz (before adding biotech/fallback)
-    finviz_count = len(result)
-    seen_set = set(result)
-
-    # Always add sector-diverse anchors — guaranteed healthcare + other sectors
-    # Interleaved so the cap doesn't cut any sector out
-    sector_anchors = [
-        # Tech
-        'NVDA', 'META', 'MSFT', 'AAPL', 'GOOGL', 'AMZN',
-        'CRM', 'SNOW', 'MDB', 'NET', 'PANW', 'CRWD',
-        'DDOG', 'ZS', 'APP', 'PLTR', 'SMCI', 'AMD',
-        'COIN', 'RBLX', 'ROKU', 'PYPL', 'ZM', 'SPOT',
-        'CELH', 'BILL', 'HUBS', 'RBRK', 'DKNG', 'ABNB',
-        # Healthcare (large-cap)
-        'LLY', 'UNH', 'ABBV', 'JNJ', 'MRK', 'PFE',
-        'AMGN', 'BMY', 'CI', 'CVS', 'ISRG', 'HUM',
-        'MDT', 'EW', 'SYK', 'BSX',
-        # Financials
-        'GS', 'JPM', 'MS', 'V', 'MA', 'AXP',
-        'BLK', 'SCHW', 'SPGI', 'MCO',
-        # Consumer / Retail
-        'COST', 'WMT', 'HD', 'NKE', 'SBUX', 'MCD',
-        'CMG', 'BURL', 'TJX', 'ROST',
-        # Industrials / Energy
-        'CAT', 'GE', 'HON', 'RTX', 'AXON',
-        'XOM', 'CVX', 'COP',
-        # Semiconductors
-        'AVGO', 'QCOM', 'MU', 'AMAT', 'LRCX', 'TXN',
-        # Real Estate / Utilities
-        'AMT', 'EQIX', 'PLD',
-    ]
-    for t in sector_anchors:
-        if t not in seen_set:
-            result.append(t)
-            seen_set.add(t)
-
-    if finviz_count < 10:
-        print(f"Briefing: Finviz returned {finviz_count} tickers, added sector anchors ({len(result)} total)")
-
-    # Biotech tickers — always added
-    biotech_tickers = [
-        'MRNA', 'REGN', 'VRTX', 'GILD', 'ALNY', 'ARQT', 'ACAD',
-        'NBIX', 'INSM', 'NUVL', 'APLS', 'TGTX', 'RCKT', 'RVMD',
-    ]
-    for bt in biotech_tickers:
-        if bt not in seen_set:
-            result.append(bt)
-            seen_set.add(bt)
+    earn_set = set(earnings)
+    volume_flat = [t for r in results[2:] if isinstance(r, list) for t in r]
+    volume_tickers = [t for t in dict.fromkeys(volume_flat) if t not in earn_set][:20]
+
+    # Sector anchors + biotech are always appended after the Finviz earnings set
+    result = list(dict.fromkeys(chain(earnings, _SECTOR_ANCHORS, _BIOTECH_TICKERS)))
+
+    if len(earnings) < 10:
+        print(f"Briefing: Finviz returned {len(earnings)} tickers, added sector anchors ({len(result)} total)")
 
     # Hard cap — never scan more than 70 tickers total
     return result[:70], volume_tickers
 
 
+# ── Ranking ───────────────────────────────────────────────────────────────────
+
+def _top_by_score_sector_capped(stocks: List[Dict], top_n: int, per_sector: int = 4) -> List[Dict]:
+    """Highest scores first, at most per_sector stocks from any one sector."""
+    if not stocks:
+        return []
+    scores = np.fromiter((s.get('score', 0) for s in stocks), dtype=np.float64, count=len(stocks))
+    sectors = [s.get('sector') or 'Other' for s in stocks]
+    order = np.argsort(-scores, kind='stable')
+    counts: Dict[str, int] = {}
+    top: List[Dict] = []
+    for i in order.tolist():
+        sec = sectors[i]
+        n = counts.get(sec, 0)
+        if n < per_sector:
+            top.append(stocks[i])
+            counts[sec] = n + 1
+            if len(top) >= top_n:
+                break
+    return top
+
+
+def _top_volume_movers(movers: List[Dict], limit: int = 8) -> List[Dict]:
+    """Rank by relative volume weighted by the size of today's move."""
+    if not movers:
+        return []
+    rel_vol = np.fromiter((m.get('rel_volume', 1) for m in movers), dtype=np.float64, count=len(movers))
+    chg_1d = np.fromiter((m.get('chg_1d', 0) for m in movers), dtype=np.float64, count=len(movers))
+    order = np.argsort(-(rel_vol * (1 + np.abs(chg_1d) / 10)), kind='stable')
+    return [movers[i] for i in order[:limit].tolist()]
+
+
 # ── Main briefing function ────────────────────────────────────────────────────
 
+_ET = ZoneInfo('America/New_York')
+_BRIEFING_TTL_OPEN = 90          # seconds — market hours (pre/regular/after)
+_BRIEFING_TTL_CLOSED = 30 * 60   # seconds — overnight / weekend
+_BRIEFING_CACHE_MAX = 8          # parameter sets kept at once
+
+
+def _briefing_ttl() -> int:
+    now = datetime.now(_ET)
+    if now.weekday() < 5 and 4 <= now.hour < 20:
+        return _BRIEFING_TTL_OPEN
+    return _BRIEFING_TTL_CLOSED
+
+
 class BriefingService:
 
+    def __init__(self):
+        # One pool for the service lifetime — yfinance calls are blocking
+        self._executor = ThreadPoolExecutor(max_workers=12, thread_name_prefix='briefing')
+        # Bounded sub-calls made *from* jobs on _executor (earnings/info/news, sector ETFs).
+        # Separate pool so they never queue behind the outer jobs that are waiting on them.
+        self._io_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='briefing-io')
+        # params → (expires_at, result), bounded (min_market_cap comes straight from the
+        # query string). The /briefing/daily route has its own 30-min cache and lock in
+        # front of this; what this covers is the route giving up after 120s — the shielded
+        # scan keeps running, and the next request joins it or picks up its result here.
+        self._cache: Dict[tuple, tuple] = {}
+        self._in_flight: Dict[tuple, asyncio.Task] = {}
+
     async def get_daily_briefing(
         self,
         min_surprise_pct: float = 0.0,   # no hard earnings floor — use scoring
@@ -1047,16 +1163,60 @@ class BriefingService:
         rsi_max: float = 90.0,
         top_n: int = 25,
         min_market_cap: int = 500_000_000,  # 500M — include mid-caps
+        force: bool = False,
     ) -> Dict:
         """
         Build daily briefing: top stocks scored by earnings beat + RSI + momentum.
         Always returns at least top_n stocks when enough candidates exist.
+        Results are cached briefly per parameter set (force skips the cache but
+        still joins a scan already in flight); callers get their own copy.
         """
-        # 1. Fetch candidate tickers + SEC 8-K data concurrently
+        key = (min_surprise_pct, rsi_min, rsi_max, top_n, min_market_cap)
+        hit = self._cache.get(key)
+        if not force and hit and hit[0] > time.time():
+            return copy.deepcopy(hit[1])
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._build_daily_briefing(*key))
+            self._in_flight[key] = task
+            task.add_done_callback(functools.partial(self._on_briefing_done, key))
+        # shield: a caller timing out must not cancel the scan others are waiting on
+        result = await asyncio.shield(task)
+        return copy.deepcopy(result)
+
+    def _on_briefing_done(self, key: tuple, task: asyncio.Task) -> None:
+        self._in_flight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        now = time.time()
+        # Drop expired entries, then the oldest ones, so the dict stays bounded
+        for k in [k for k, (expires_at, _) in self._cache.items() if expires_at <= now]:
+            del self._cache[k]
+        self._cache.pop(key, None)
+        while len(self._cache) >= _BRIEFING_CACHE_MAX:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = (now + _briefing_ttl(), task.result())
+
+    async def _build_daily_briefing(
+        self,
+        min_surprise_pct: float,
+        rsi_min: float,
+        rsi_max: float,
+        top_n: int,
+        min_market_cap: int,
+    ) -> Dict:
+        # 1. Candidate tickers, SEC 8-K data, QQQ 20d return and market status
+        #    are independent — fetch them all concurrently
+        loop = asyncio.get_running_loop()
+        executor = self._executor
+        io_executor = self._io_executor
         async with aiohttp.ClientSession() as session:
-            ticker_result, sec_8k_dates = await asyncio.gather(
+            ticker_result, sec_8k_dates, qqq_20d_pct, market_status = await asyncio.gather(
                 _get_candidate_tickers(session),
                 get_recent_8k_tickers(session, days=7),
+                loop.run_in_executor(executor, _get_qqq_20d_pct),
+                loop.run_in_executor(executor, functools.partial(_fetch_market_status_sync, io_executor)),
                 return_exceptions=True,
             )
         if isinstance(ticker_result, Exception) or not isinstance(ticker_result, tuple):
@@ -1066,6 +1226,10 @@ class BriefingService:
             candidates, volume_candidates = ticker_result
         if isinstance(sec_8k_dates, Exception):
             sec_8k_dates = {}
+        if isinstance(qqq_20d_pct, Exception):
+            qqq_20d_pct = 0.0
+        if isinstance(market_status, Exception):
+            market_status = {'spy': {}, 'qqq': {}, 'summary': 'נתוני שוק לא זמינים'}
 
         # Add SEC 8-K tickers not already in candidates (cap at 30 extra)
         # Exclude tickers with clearly bearish signals (bankruptcy, restatement, delisting)
@@ -1075,8 +1239,7 @@ class BriefingService:
         for t, info in list(sec_8k_dates.items()):
             # Skip bearish-flagged filings (e.g. bankruptcy 1.03, restatement 4.02, delisting 3.01)
             if isinstance(info, dict):
-                bad_items = set(info.get('items', [])) & BEARISH_EXCLUDE_ITEMS
-                if bad_items:
+                if any(item in BEARISH_EXCLUDE_ITEMS for item in info.get('items', ())):
                     sec_skipped_bearish += 1
                     continue
             if t not in seen_candidates and sec_added < 10:
@@ -1092,14 +1255,10 @@ class BriefingService:
         print(f"Briefing: scanning {len(candidates)} candidates "
               f"({len(sec_8k_dates)} with recent 8-K), top_n={top_n}...")
 
-        # 1b. Pre-fetch QQQ 20d return for RS line (fast, ~1s)
-        loop = asyncio.get_running_loop()
-        qqq_20d_pct = await loop.run_in_executor(None, _get_qqq_20d_pct)
         print(f"Briefing: QQQ 20d return = {qqq_20d_pct}%")
 
         # 2. Batch-process tickers via thread pool (yfinance is blocking)
         sem = asyncio.Semaphore(6)
-        executor = ThreadPoolExecutor(max_workers=8)
 
         async def process_one(ticker: str) -> Optional[Dict]:
             async with sem:
@@ -1107,7 +1266,7 @@ class BriefingService:
                     fn = functools.partial(
                         _fetch_ticker_data_sync, ticker, min_surprise_pct,
                         sec_8k_dates, rsi_min, rsi_max, min_market_cap,
-                        qqq_20d_pct
+                        qqq_20d_pct, io_executor
                     )
                     return await asyncio.wait_for(
                         loop.run_in_executor(executor, fn),
@@ -1136,31 +1295,18 @@ class BriefingService:
 
         vol_tasks = [process_vol(t) for t in volume_candidates]
         vol_results = await asyncio.gather(*vol_tasks, return_exceptions=True)
-        executor.shutdown(wait=False)
 
         qualified = [r for r in results if isinstance(r, dict) and r is not None]
         print(f"Briefing: {len(qualified)} stocks with price data (from {len(candidates)} candidates)")
 
         # Volume movers: sort by relative volume * abs(chg_1d), take top 8
-        volume_movers = [r for r in vol_results if isinstance(r, dict) and r is not None]
-        volume_movers.sort(key=lambda x: x.get('rel_volume', 1) * (1 + abs(x.get('chg_1d', 0)) / 10), reverse=True)
-        volume_movers = volume_movers[:8]
+        volume_movers = _top_volume_movers(
+            [r for r in vol_results if isinstance(r, dict) and r is not None], limit=8
+        )
         print(f"Briefing: {len(volume_movers)} volume movers (from {len(volume_candidates)} candidates)")
 
         # 3. Sort by composite score, apply sector diversity cap (max 4 per sector)
-        qualified.sort(key=lambda x: x.get('score', 0), reverse=True)
-        _sector_counts: Dict[str, int] = {}
-        top_stocks = []
-        for s in qualified:
-            sec = s.get('sector') or 'Other'
-            if _sector_counts.get(sec, 0) < 4:
-                top_stocks.append(s)
-                _sector_counts[sec] = _sector_counts.get(sec, 0) + 1
-            if len(top_stocks) >= top_n:
-                break
-
-        # 4. Market status (run concurrently — no SEC highlights to keep it fast)
-        market_status = await loop.run_in_executor(None, _fetch_market_status_sync)
+        top_stocks = _top_by_score_sector_capped(qualified, top_n, per_sector=4)
 
         return {
             'stocks': top_stocks,
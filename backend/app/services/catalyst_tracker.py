@@ -13,15 +13,36 @@ Uses BIO/PMC clinical trial success rate data (2015-2023) for approval probabili
 """
 
 import asyncio
+import json
+import logging
+import re
 import time
+from collections import defaultdict
+from functools import lru_cache
+import aiohttp
+import numpy as np
+import pandas as pd
 import yfinance as yf
 from typing import List, Dict, Optional
 from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from app.scrapers.fda_calendar import FDACalendarScraper
 from app.scrapers.finviz_fundamentals import FinvizFundamentals
 from app.scrapers.tech_catalyst import TechCatalystScraper
+from app.services.ttl_cache import TTLCache
+
+log = logging.getLogger(__name__)
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+try:
+    from lxml import html as _lxml_html
+except ImportError:
+    _lxml_html = None
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -132,10 +153,184 @@ MODALITY_MODIFIERS = {
     'small molecule': 0,
 }
 
+# Keyword groups for FDA designations / special situations
+SUPPLEMENTAL_TERMS = ('sbla', 'snda', 'supplemental', 'label expansion')
+ORPHAN_TERMS = ('orphan', 'rare disease', 'ultra-rare')
+RARE_INDICATORS = ('mucopolysaccharidosis', 'phenylketonuria', 'achondroplasia',
+                   'gaucher', 'menkes', 'leber', 'hunter syndrome', 'fabry', 'pompe')
+ESTABLISHED_DRUGS = ('keytruda', 'opdivo', 'dupixent', 'darzalex', 'palynziq',
+                     'sarclisa', 'filspari', 'vyvgart', 'inqovi', 'sotyktu')
+DESIGNATION_TERMS = ('breakthrough', 'priority review', 'priority',
+                     'accelerated approval', 'accelerated', 'fast track', 'pivotal')
+
+# Layer-1 base rate per catalyst type: (probability, confidence, factor)
+_NDA_BASE = (85, 'Medium', 'PoA base: NDA/BLA first-cycle approval 85% (BIO 2015-2023)')
+_BASE_BY_CAT_TYPE = {
+    'PDUFA': _NDA_BASE,
+    'NDA': _NDA_BASE,
+    'BLA': _NDA_BASE,
+    'AdCom': (75, 'Medium', 'PoA base: Advisory Committee → approval 75%'),
+    'Phase3': (58, 'Low', 'PoA base: Phase 3 → approval 58% (BIO 2015-2023)'),
+    'Phase2': (15, 'Low', 'PoA base: Phase 2 → approval 15% (BIO 2015-2023)'),
+    'Phase1': (6.7, 'Low', 'PoA base: Phase 1 → approval 6.7% (BIO 2015-2023)'),
+}
+_SUPPLEMENTAL_BASE = (93, 'High', 'PoA base: sBLA/sNDA supplemental approval 93% (BIO 2015-2023)')
+_DEFAULT_BASE = (50, 'Low', 'No specific phase base rate')
+_NDA_STAGE_TYPES = frozenset(('PDUFA', 'NDA', 'BLA'))
+
+# ═══════════════════════════════════════════════════════════════
+# Keyword matcher — every table keyword found in one scan of the text.
+# A zero-width lookahead is tried at each offset; longest keywords come
+# first so the capture is the longest hit there, and shorter keywords that
+# are prefixes of it are added back — same result as `kw in text` for all.
+# ═══════════════════════════════════════════════════════════════
+
+_ALL_KEYWORDS = frozenset(
+    [k for k in THERAPEUTIC_AREA_LOA]
+    + [k for k in NDA_APPROVAL_BY_AREA if k != 'default']
+    + list(MODALITY_MODIFIERS)
+    + list(SUPPLEMENTAL_TERMS + ORPHAN_TERMS + RARE_INDICATORS
+           + ESTABLISHED_DRUGS + DESIGNATION_TERMS)
+)
+_KEYWORD_RE = re.compile('(?=(' + '|'.join(
+    re.escape(k) for k in sorted(_ALL_KEYWORDS, key=len, reverse=True)
+) + '))')
+_KEYWORD_PREFIXES: Dict[str, tuple] = {
+    k: tuple(p for p in _ALL_KEYWORDS if p != k and k.startswith(p))
+    for k in _ALL_KEYWORDS
+}
+
+
+def _match_keywords(text: str) -> frozenset:
+    """All keywords from the scoring tables that occur as substrings of text."""
+    hits = set()
+    for kw in _KEYWORD_RE.findall(text):
+        if kw not in hits:
+            hits.add(kw)
+            hits.update(_KEYWORD_PREFIXES[kw])
+    return frozenset(hits)
+
+
+# Finviz fields each scorer reads — the scorers are cached on these values
+_APPROVAL_FUND_FIELDS = ('target_price', 'price', 'analyst_recom_raw',
+                         'insider_trans', 'inst_trans', 'perf_month')
+_SCORE_FUND_FIELDS = ('atr', 'price', 'beta', 'short_float', 'rel_volume', 'avg_volume',
+                      'gap_pct', 'inst_own', 'insider_trans', 'inst_trans',
+                      'analyst_recom_raw', 'analyst_recom', 'target_price', 'perf_week')
+
+
+# Strips sign / percent / thousands separators from Finviz change cells in one pass
+_PCT_STRIP = str.maketrans('', '', '%+,')
+
+# Status / industry terms the biotech move classifier branches on (one scan each)
+_STATUS_RE = re.compile(r'approved|crl|rejected')
+_INDUSTRY_RE = re.compile(r'biotech|drug|pharma')
+
+
+def _screener_rows(html: str, limit: int = 30) -> List[List[str]]:
+    """Stripped cell texts for the first `limit` data rows of a Finviz screener table.
+    lxml + XPath when available (C parser, one pass); BeautifulSoup otherwise."""
+    if _lxml_html is not None:
+        tree = _lxml_html.fromstring(html)
+        tables = tree.xpath('//table[contains(concat(" ", normalize-space(@class), " "), " table-light ")]')
+        if not tables:
+            # Try alternative — the table holding the first percent cell, found in one walk
+            tables = tree.xpath('(//td[contains(text(), "%")])[1]/ancestor::table[1]')
+        if not tables:
+            return []
+        rows = tables[0].xpath('.//tr')[1:limit + 1]  # skip header
+        return [[''.join(t.strip() for t in td.itertext()) for td in row.xpath('.//td')] for row in rows]
+
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, 'html.parser')
+    table = soup.find('table', class_='table-light')
+    if not table:
+        # Try alternative — the table holding the first percent cell, found in one walk
+        cell = soup.find('td', string=lambda s: s and '%' in s)
+        table = cell.find_parent('table') if cell else None
+    if not table:
+        return []
+    rows = table.find_all('tr')[1:limit + 1]  # skip header
+    return [[td.get_text(strip=True) for td in row.find_all('td')] for row in rows]
+
+
+def _nearest_sorted(values: np.ndarray, target) -> int:
+    """Index of the value nearest to target in an ascending array (earlier wins ties)."""
+    pos = int(np.searchsorted(values, target))
+    if pos == 0:
+        return 0
+    if pos == len(values):
+        return pos - 1
+    return pos - 1 if target - values[pos - 1] <= values[pos] - target else pos
+
+
+# Shared pool for blocking yfinance calls (movers, RSI, batch downloads) —
+# sized to the callers' semaphores so no pool is created per request
+_YF_EXECUTOR = ThreadPoolExecutor(max_workers=6, thread_name_prefix='catalyst_yf')
+
+
+def _fund_fingerprint(fundamentals: Dict, fields: tuple) -> tuple:
+    """Hashable (key, value) view of the fundamentals a scorer reads."""
+    return tuple((k, fundamentals[k]) for k in fields if k in fundamentals)
+
+
+# Finviz values are strings ('12.5%', '1.80', '-') — parsed once per distinct
+# value and shared by both scorers; None where float() would have raised.
+@lru_cache(maxsize=4096)
+def _to_float(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _pct_to_float(value) -> Optional[float]:
+    try:
+        return float(value.replace('%', ''))
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _volume_to_float(value) -> Optional[float]:
+    try:
+        return float(value.replace(',', '').replace('K', '000').replace('M', '000000'))
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+class _TokenBucket:
+    """Async token bucket — bursts up to `capacity` calls, then `rate` per second."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = None
+
+    async def acquire(self):
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
 
 class CatalystTrackerService:
-    COMBINED_CACHE_TTL = 300  # 5 minutes
+    SOFT_TTL = 300   # 5 minutes — default freshness; older payloads are served while refreshing
+    HARD_TTL = 1800  # 30 minutes — past this the caller waits for a rebuild
+    DAYS_FORWARD = 90  # Window the caches are always built for; callers get a slice of it
+    DAYS_BACK = 30
     NEWS_CACHE_TTL = 180  # 3 minutes
+    FUND_CACHE_TTL = 300  # 5 minutes
 
     def __init__(self, fda_scraper: FDACalendarScraper, finviz_fundamentals: FinvizFundamentals,
                  tech_scraper: TechCatalystScraper):
@@ -144,13 +339,28 @@ class CatalystTrackerService:
         self.tech_scraper = tech_scraper
         self._fda_cache: Optional[List[Dict]] = None
         self._fda_cache_time: float = 0
+        self._fda_cache_ttl: float = self.SOFT_TTL
+        self._fda_cache_enriched = False
+        # (days_forward, days_back) -> slice of the current FDA cache
+        self._fda_slices: Dict[tuple, List[Dict]] = {}
         self._tech_cache: Optional[List[Dict]] = None
         self._tech_cache_time: float = 0
-        self._news_cache: Dict[str, List[Dict]] = {}
-        self._news_cache_time: Dict[str, float] = {}
+        self._tech_cache_ttl: float = self.SOFT_TTL
+        self._tech_cache_enriched = False
+        self._news_cache = TTLCache(maxsize=500, ttl=self.NEWS_CACHE_TTL)
+        self._fund_cache = TTLCache(maxsize=512, ttl=self.FUND_CACHE_TTL)
         self._fda_lock = None
         self._tech_lock = None
-        self._yf_executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix='cat_news')
+        self._fda_refresh_task: Optional[asyncio.Task] = None
+        self._tech_refresh_task: Optional[asyncio.Task] = None
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._news_bucket = _TokenBucket(rate=3, capacity=3)  # Yahoo search: ~3 req/s
+        # In-flight upstream fetches — concurrent callers await the same task
+        self._news_inflight: Dict[str, asyncio.Task] = {}
+        self._fund_inflight: Dict[frozenset, asyncio.Task] = {}
+        # ticker -> FDA event lookup, rebuilt only when the FDA cache list changes
+        self._fda_map_src: Optional[List[Dict]] = None
+        self._fda_map: Dict[str, Dict] = {}
 
     def _get_fda_lock(self):
         if self._fda_lock is None:
@@ -162,15 +372,133 @@ class CatalystTrackerService:
             self._tech_lock = asyncio.Lock()
         return self._tech_lock
 
-    async def get_catalyst_events(self, days_forward: int = 90, days_back: int = 30,
-                                   enriched: bool = True) -> List[Dict]:
-        """Main method: get FDA catalyst events enriched with fundamentals + news."""
-        now = time.time()
+    def _get_http(self) -> aiohttp.ClientSession:
+        """One pooled session for news and every scraper call — keeps TLS
+        connections and DNS lookups warm across poll cycles."""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(connector=aiohttp.TCPConnector(
+                limit=50, limit_per_host=10, ttl_dns_cache=300, keepalive_timeout=75))
+        return self._http
 
-        # Return cached if fresh
-        if self._fda_cache and (now - self._fda_cache_time) < self.COMBINED_CACHE_TTL:
-            return self._fda_cache
+    async def close(self):
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
 
+    @staticmethod
+    def _single_flight(inflight: Dict, key, make_coro) -> asyncio.Task:
+        """Return the running task for key, or start one. Await it via asyncio.shield
+        so one caller's timeout doesn't cancel the fetch for the others."""
+        task = inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(make_coro())
+            inflight[key] = task
+            task.add_done_callback(lambda _t: inflight.pop(key, None))
+        return task
+
+    async def _get_fundamentals_batch(self, tickers: List[str]) -> Dict[str, Dict]:
+        """Finviz fundamentals — tickers fetched within FUND_CACHE_TTL are served from
+        cache; only the stale rest goes upstream, coalesced across concurrent callers."""
+        results = {}
+        stale = []
+        for ticker in tickers:
+            cached = self._fund_cache.get(ticker)
+            if cached is None:
+                stale.append(ticker)
+            else:
+                results[ticker] = cached
+        if not stale:
+            return results
+
+        async def fetch_stale():
+            fetched = await self.finviz_fundamentals.get_fundamentals_batch(stale, session=self._get_http())
+            for ticker, data in fetched.items():
+                self._fund_cache[ticker] = data
+            return fetched
+
+        task = self._single_flight(self._fund_inflight, frozenset(stale), fetch_stale)
+        results.update(await asyncio.shield(task))
+        return results
+
+    @staticmethod
+    def _tickers_by_proximity(events: List[Dict]) -> List[str]:
+        """Unique tickers ordered by how close their catalyst is, so the capped
+        enrichment set is the events that dominate the sorted output."""
+        ordered = sorted(events, key=lambda e: abs(e.get('days_until') or 9999))
+        return list(dict.fromkeys(e['ticker'] for e in ordered if e.get('ticker')))
+
+    @staticmethod
+    def _apply_order(events: List[Dict], sort_keys: List[tuple]):
+        """Stable in-place sort of events by precomputed keys (parallel list)."""
+        order = sorted(range(len(events)), key=sort_keys.__getitem__)
+        events[:] = [events[i] for i in order]
+
+    @staticmethod
+    def _adaptive_ttl(events: List[Dict]) -> int:
+        """Freshness window from the nearest catalyst — a PDUFA tomorrow can flip on any
+        headline, a calendar that is weeks out barely changes hour to hour."""
+        min_days = min((e['days_until'] for e in events
+                        if e.get('days_until') is not None and e['days_until'] >= 0), default=9999)
+        if min_days <= 3:
+            return 60
+        if min_days <= 14:
+            return 180
+        return 600
+
+    @staticmethod
+    def _index_by_ticker(events: List[Dict]) -> Dict[str, List[Dict]]:
+        by_ticker = defaultdict(list)
+        for event in events:
+            by_ticker[event.get('ticker', '')].append(event)
+        return by_ticker
+
+    @staticmethod
+    def _in_window(events: List[Dict], days_forward: int, days_back: int) -> List[Dict]:
+        """Events with days_until inside [-days_back, days_forward]; undated rows are kept,
+        as the scrapers keep them."""
+        return [e for e in events
+                if e.get('days_until') is None or -days_back <= e['days_until'] <= days_forward]
+
+    def _fda_window(self, days_forward: int, days_back: int) -> List[Dict]:
+        """The caller's view of the FDA cache. Slices are memoized per cache generation so
+        repeat callers get the same list (and _fda_ticker_map can reuse its lookup)."""
+        events = self._fda_cache or []
+        if days_forward >= self.DAYS_FORWARD and days_back >= self.DAYS_BACK:
+            return events
+        key = (days_forward, days_back)
+        if key not in self._fda_slices:
+            self._fda_slices[key] = self._in_window(events, days_forward, days_back)
+        return self._fda_slices[key]
+
+    def _fda_ticker_map(self, events: List[Dict]) -> Dict[str, Dict]:
+        """ticker -> FDA event (last one wins) for mover cross-referencing. Memoized on
+        the identity of the cached event list, so repeat scans reuse it until a refresh."""
+        if events is not self._fda_map_src:
+            self._fda_map = {e['ticker']: e for e in events if e.get('ticker')}
+            self._fda_map_src = events
+        return self._fda_map
+
+    async def get_catalyst_events(self, days_forward: int = 90, days_back: int = 30,
+                                   enriched: bool = True) -> List[Dict]:
+        """Main method: get FDA catalyst events enriched with fundamentals + news.
+
+        The cache always holds the full DAYS_FORWARD/DAYS_BACK window; callers get their
+        window sliced out of it. An unenriched cache does not satisfy an enriched caller."""
+        if self._fda_cache and (self._fda_cache_enriched or not enriched):
+            age = time.time() - self._fda_cache_time
+            if age < self._fda_cache_ttl:
+                return self._fda_window(days_forward, days_back)
+            if age < self.HARD_TTL:
+                # Stale-while-revalidate: serve the old payload, rebuild the full enriched
+                # cache in the background whatever this caller asked for
+                task = self._fda_refresh_task
+                if not self._get_fda_lock().locked() and (task is None or task.done()):
+                    self._fda_refresh_task = asyncio.create_task(self._refresh_fda(enriched=True))
+                return self._fda_window(days_forward, days_back)
+
+        await self._refresh_fda(enriched)
+        return self._fda_window(days_forward, days_back)
+
+    async def _refresh_fda(self, enriched: bool) -> List[Dict]:
         lock = self._get_fda_lock()
         if lock.locked():
             # Return stale cache while another request is processing
@@ -181,81 +509,59 @@ class CatalystTrackerService:
         async with lock:
             # Double-check after acquiring lock
             now = time.time()
-            if self._fda_cache and (now - self._fda_cache_time) < self.COMBINED_CACHE_TTL:
+            if (self._fda_cache and (self._fda_cache_enriched or not enriched)
+                    and (now - self._fda_cache_time) < self._fda_cache_ttl):
                 return self._fda_cache
 
             try:
                 # 1. Fetch FDA events
                 events = await asyncio.wait_for(
-                    self.fda_scraper.get_fda_events(days_forward=days_forward, days_back=days_back),
+                    self.fda_scraper.get_fda_events(days_forward=self.DAYS_FORWARD, days_back=self.DAYS_BACK,
+                                                    session=self._get_http()),
                     timeout=20
                 )
 
+                fundamentals: Dict[str, Dict] = {}
+                news_data: Dict[str, List[Dict]] = {}
                 if enriched and events:
-                    # 2. Extract unique tickers and enrich with Finviz fundamentals
-                    tickers = list(set(e['ticker'] for e in events if e.get('ticker')))
-                    tickers = tickers[:20]  # Limit to top 20 (faster on slow servers)
+                    # 2. Extract unique tickers (nearest catalysts first), then fetch Finviz
+                    #    fundamentals and news for the top 8 side by side
+                    tickers = self._tickers_by_proximity(events)[:20]  # Limit to top 20 (faster on slow servers)
+                    fundamentals, news_data = await self._gather_enrichment(
+                        tickers, news_count=8, fund_timeout=25, news_timeout=10, label='Catalyst')
 
-                    if tickers:
-                        try:
-                            fundamentals = await asyncio.wait_for(
-                                self.finviz_fundamentals.get_fundamentals_batch(tickers),
-                                timeout=25
-                            )
-                            for event in events:
-                                ticker = event.get('ticker', '')
-                                if ticker in fundamentals:
-                                    event['fundamentals'] = fundamentals[ticker]
-                        except asyncio.TimeoutError:
-                            print("Catalyst enrichment TIMEOUT — skipping fundamentals")
-
-                    # 3. Fetch news for top tickers (only 8, in background-friendly way)
-                    top_tickers = tickers[:8]
-                    if top_tickers:
-                        try:
-                            news_data = await asyncio.wait_for(
-                                self._fetch_news_for_tickers(top_tickers),
-                                timeout=10
-                            )
-                            for event in events:
-                                ticker = event.get('ticker', '')
-                                if ticker in news_data:
-                                    event['latest_news'] = news_data[ticker]
-                        except asyncio.TimeoutError:
-                            print("News fetch TIMEOUT — skipping news")
-
-                # 4. Re-calculate approval probability with Finviz data
-                for event in events:
-                    event['approval_probability'] = self._calculate_approval_probability(event)
-
-                # 5. Calculate catalyst score for each event
-                for event in events:
-                    event['catalyst_score'] = self._calculate_catalyst_score(event)
-
-                # Sort by score descending, then by days_until ascending
-                events.sort(key=lambda x: (-x.get('catalyst_score', 0), abs(x.get('days_until') or 9999)))
-
-                self._fda_cache = events
-                self._fda_cache_time = time.time()
-                return events
+                return self._finish_fda(events, fundamentals, news_data, enriched=enriched)
 
             except asyncio.TimeoutError:
-                print("Catalyst tracker OVERALL TIMEOUT")
+                log.warning("Catalyst tracker OVERALL TIMEOUT")
                 return self._fda_cache or []
             except Exception as e:
-                print(f"Catalyst tracker error: {e}")
-                import traceback
-                traceback.print_exc()
+                log.exception("Catalyst tracker error: %s", e)
                 return self._fda_cache or []
 
     async def get_tech_catalyst_events(self, days_forward: int = 90,
                                         enriched: bool = True) -> List[Dict]:
         """Get tech stock catalyst events enriched with fundamentals + news."""
-        now = time.time()
-
-        if self._tech_cache and (now - self._tech_cache_time) < self.COMBINED_CACHE_TTL:
-            return self._tech_cache
-
+        if self._tech_cache and (self._tech_cache_enriched or not enriched):
+            age = time.time() - self._tech_cache_time
+            if age < self._tech_cache_ttl:
+                return self._tech_window(days_forward)
+            if age < self.HARD_TTL:
+                task = self._tech_refresh_task
+                if not self._get_tech_lock().locked() and (task is None or task.done()):
+                    self._tech_refresh_task = asyncio.create_task(self._refresh_tech(enriched=True))
+                return self._tech_window(days_forward)
+
+        await self._refresh_tech(enriched)
+        return self._tech_window(days_forward)
+
+    def _tech_window(self, days_forward: int) -> List[Dict]:
+        events = self._tech_cache or []
+        if days_forward >= self.DAYS_FORWARD:
+            return events
+        return self._in_window(events, days_forward, self.DAYS_BACK)
+
+    async def _refresh_tech(self, enriched: bool) -> List[Dict]:
         lock = self._get_tech_lock()
         if lock.locked():
             if self._tech_cache:
@@ -264,92 +570,178 @@ class CatalystTrackerService:
 
         async with lock:
             now = time.time()
-            if self._tech_cache and (now - self._tech_cache_time) < self.COMBINED_CACHE_TTL:
+            if (self._tech_cache and (self._tech_cache_enriched or not enriched)
+                    and (now - self._tech_cache_time) < self._tech_cache_ttl):
                 return self._tech_cache
 
             try:
                 events = await asyncio.wait_for(
-                    self.tech_scraper.get_tech_catalyst_events(days_forward=days_forward),
+                    self.tech_scraper.get_tech_catalyst_events(days_forward=self.DAYS_FORWARD,
+                                                               session=self._get_http()),
                     timeout=120
                 )
 
+                fundamentals: Dict[str, Dict] = {}
+                news_data: Dict[str, List[Dict]] = {}
                 if enriched and events:
-                    tickers = list(set(e['ticker'] for e in events if e.get('ticker')))
-                    tickers = tickers[:30]
+                    tickers = self._tickers_by_proximity(events)[:30]
+                    fundamentals, news_data = await self._gather_enrichment(
+                        tickers, news_count=15, fund_timeout=55, news_timeout=15, label='Tech')
 
-                    if tickers:
-                        try:
-                            fundamentals = await asyncio.wait_for(
-                                self.finviz_fundamentals.get_fundamentals_batch(tickers),
-                                timeout=55
-                            )
-                            for event in events:
-                                ticker = event.get('ticker', '')
-                                if ticker in fundamentals:
-                                    event['fundamentals'] = fundamentals[ticker]
-                                    # Fill in company name from Finviz if ticker-only
-                                    if event.get('company') == ticker and fundamentals[ticker].get('company_name'):
-                                        event['company'] = fundamentals[ticker]['company_name']
-                        except asyncio.TimeoutError:
-                            print("Tech enrichment TIMEOUT")
-
-                    top_tickers = tickers[:15]
-                    if top_tickers:
-                        try:
-                            news_data = await asyncio.wait_for(
-                                self._fetch_news_for_tickers(top_tickers),
-                                timeout=15
-                            )
-                            for event in events:
-                                ticker = event.get('ticker', '')
-                                if ticker in news_data:
-                                    event['latest_news'] = news_data[ticker]
-                        except asyncio.TimeoutError:
-                            pass
-
-                for event in events:
-                    event['catalyst_score'] = self._calculate_catalyst_score(event)
-
-                events.sort(key=lambda x: (-x.get('catalyst_score', 0), abs(x.get('days_until') or 9999)))
-
-                self._tech_cache = events
-                self._tech_cache_time = time.time()
-                return events
+                return self._finish_tech(events, fundamentals, news_data, enriched=enriched)
 
             except asyncio.TimeoutError:
                 return self._tech_cache or []
             except Exception as e:
-                print(f"Tech catalyst tracker error: {e}")
+                log.warning("Tech catalyst tracker error: %s", e)
                 return self._tech_cache or []
 
+    async def refresh_all(self) -> Dict[str, List[Dict]]:
+        """Rebuild the FDA and tech caches together: both scrapers run concurrently and
+        the union of their tickers shares one Finviz batch and one news fetch."""
+        fda_lock, tech_lock = self._get_fda_lock(), self._get_tech_lock()
+        if fda_lock.locked() or tech_lock.locked():
+            return {'fda': self._fda_cache or [], 'tech': self._tech_cache or []}
+
+        async with fda_lock, tech_lock:
+            http = self._get_http()
+            fda_events, tech_events = await asyncio.gather(
+                asyncio.wait_for(self.fda_scraper.get_fda_events(
+                    days_forward=self.DAYS_FORWARD, days_back=self.DAYS_BACK, session=http), timeout=20),
+                asyncio.wait_for(self.tech_scraper.get_tech_catalyst_events(
+                    days_forward=self.DAYS_FORWARD, session=http), timeout=120),
+                return_exceptions=True,
+            )
+            if isinstance(fda_events, BaseException):
+                log.warning("Catalyst refresh — FDA scrape failed: %r", fda_events)
+                fda_events = None
+            if isinstance(tech_events, BaseException):
+                log.warning("Catalyst refresh — tech scrape failed: %r", tech_events)
+                tech_events = None
+
+            tickers = self._tickers_by_proximity((fda_events or []) + (tech_events or []))[:50]
+            fundamentals, news_data = await self._gather_enrichment(
+                tickers, news_count=15, fund_timeout=55, news_timeout=15, label='Catalyst refresh')
+
+            try:
+                if fda_events is not None:
+                    self._finish_fda(fda_events, fundamentals, news_data)
+                if tech_events is not None:
+                    self._finish_tech(tech_events, fundamentals, news_data)
+            except Exception as e:
+                log.warning("Catalyst refresh error: %s", e)
+
+        return {'fda': self._fda_cache or [], 'tech': self._tech_cache or []}
+
+    async def _gather_enrichment(self, tickers: List[str], news_count: int, fund_timeout: float,
+                                 news_timeout: float, label: str):
+        """(fundamentals, news) for tickers — Finviz and Yahoo fetched concurrently,
+        each side falling back to {} on timeout."""
+        async def fundamentals():
+            if not tickers:
+                return {}
+            try:
+                return await asyncio.wait_for(self._get_fundamentals_batch(tickers), timeout=fund_timeout)
+            except asyncio.TimeoutError:
+                log.warning("%s enrichment TIMEOUT — skipping fundamentals", label)
+                return {}
+
+        async def news():
+            top_tickers = tickers[:news_count]
+            if not top_tickers:
+                return {}
+            try:
+                return await asyncio.wait_for(self._fetch_news_for_tickers(top_tickers), timeout=news_timeout)
+            except asyncio.TimeoutError:
+                log.warning("%s news TIMEOUT — skipping news", label)
+                return {}
+
+        return await asyncio.gather(fundamentals(), news())
+
+    def _finish_fda(self, events: List[Dict], fundamentals: Dict[str, Dict],
+                    news_data: Dict[str, List[Dict]], enriched: bool = True) -> List[Dict]:
+        """Attach enrichment to the matching rows, re-calculate approval probability with
+        Finviz data, score, sort and publish to the FDA cache. With enriched=False the
+        market-signal layers are skipped, even for rows carrying earlier fundamentals."""
+        by_ticker = self._index_by_ticker(events)
+        for ticker, fund in fundamentals.items():
+            for event in by_ticker.get(ticker, ()):
+                event['fundamentals'] = fund
+        for ticker, news in news_data.items():
+            for event in by_ticker.get(ticker, ()):
+                event['latest_news'] = news
+
+        # Sort keys are built in the scoring pass: score descending, then days_until ascending
+        sort_keys = []
+        for event in events:
+            event['approval_probability'] = self._calculate_approval_probability(event, skip_market=not enriched)
+            score = event['catalyst_score'] = self._calculate_catalyst_score(event, skip_market=not enriched)
+            sort_keys.append((-score, abs(event.get('days_until') or 9999)))
+        self._apply_order(events, sort_keys)
+
+        self._fda_cache = events
+        self._fda_cache_time = time.time()
+        self._fda_cache_ttl = self._adaptive_ttl(events)
+        self._fda_cache_enriched = enriched
+        self._fda_slices = {}
+        return events
+
+    def _finish_tech(self, events: List[Dict], fundamentals: Dict[str, Dict],
+                     news_data: Dict[str, List[Dict]], enriched: bool = True) -> List[Dict]:
+        by_ticker = self._index_by_ticker(events)
+        for ticker, fund in fundamentals.items():
+            company_name = fund.get('company_name')
+            for event in by_ticker.get(ticker, ()):
+                event['fundamentals'] = fund
+                # Fill in company name from Finviz if ticker-only
+                if company_name and event.get('company') == ticker:
+                    event['company'] = company_name
+        for ticker, news in news_data.items():
+            for event in by_ticker.get(ticker, ()):
+                event['latest_news'] = news
+
+        sort_keys = []
+        for event in events:
+            score = event['catalyst_score'] = self._calculate_catalyst_score(event, skip_market=not enriched)
+            sort_keys.append((-score, abs(event.get('days_until') or 9999)))
+        self._apply_order(events, sort_keys)
+
+        self._tech_cache = events
+        self._tech_cache_time = time.time()
+        self._tech_cache_ttl = self._adaptive_ttl(events)
+        self._tech_cache_enriched = enriched
+        return events
+
+    YAHOO_NEWS_URL = 'https://query2.finance.yahoo.com/v1/finance/search'
+    YAHOO_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+
     async def _fetch_news_for_tickers(self, tickers: List[str]) -> Dict[str, List[Dict]]:
-        """Fetch latest news for tickers using yfinance with bounded concurrency."""
+        """Fetch latest news for tickers from Yahoo's search API with bounded concurrency."""
         sem = asyncio.Semaphore(3)
         results = {}
+        session = self._get_http()
 
-        async def fetch_one(ticker: str, idx: int):
-            async with sem:
-                # Check news cache
-                now = time.time()
-                if ticker in self._news_cache and (now - self._news_cache_time.get(ticker, 0)) < self.NEWS_CACHE_TTL:
-                    return ticker, self._news_cache[ticker]
+        async def fetch_one(ticker: str):
+            # Cache hits skip the semaphore and the rate limiter entirely
+            cached = self._news_cache.get(ticker)
+            if cached is not None:
+                return ticker, cached
 
-                await asyncio.sleep(idx * 0.15)
+            async with sem:
                 try:
-                    loop = asyncio.get_event_loop()
-                    news = await asyncio.wait_for(
-                        loop.run_in_executor(self._yf_executor, self._fetch_news_sync, ticker),
-                        timeout=4
+                    task = self._single_flight(
+                        self._news_inflight, ticker,
+                        lambda: self._fetch_news_async(session, ticker),
                     )
+                    news = await asyncio.shield(task)
                     self._news_cache[ticker] = news
-                    self._news_cache_time[ticker] = time.time()
                     return ticker, news
                 except asyncio.TimeoutError:
                     return ticker, []
                 except Exception:
                     return ticker, []
 
-        tasks = [fetch_one(t, i) for i, t in enumerate(tickers)]
+        tasks = [fetch_one(t) for t in tickers]
         completed = await asyncio.gather(*tasks, return_exceptions=True)
 
         for item in completed:
@@ -359,48 +751,82 @@ class CatalystTrackerService:
 
         return results
 
-    def _fetch_news_sync(self, ticker: str) -> List[Dict]:
-        """Synchronous yfinance news fetch."""
-        news_items = []
-        try:
-            stock = yf.Ticker(ticker)
-            from concurrent.futures import ThreadPoolExecutor as _TP
-            with _TP(max_workers=1) as _ex:
-                future = _ex.submit(lambda: stock.news or [])
-                raw_news = future.result(timeout=3)
-
-            for item in raw_news[:5]:
-                content = item.get('content', {}) or {}
-                title = str(content.get('title') or '')
-                if not title:
-                    continue
-                provider = content.get('provider', {})
-                publisher = str(provider.get('displayName', '')) if isinstance(provider, dict) else str(provider or '')
-                canonical = content.get('canonicalUrl', {})
-                link = str(canonical.get('url', '')) if isinstance(canonical, dict) else str(canonical or '')
-                if not link:
-                    click = content.get('clickThroughUrl', {})
-                    link = str(click.get('url', '')) if isinstance(click, dict) else str(click or '')
-                pub_date = str(content.get('pubDate') or '')
-
-                # Summary
-                summary = str(content.get('summary') or '')
-                if len(summary) > 300:
-                    summary = summary[:297] + '...'
-
-                news_items.append({
-                    'title': title,
-                    'publisher': publisher,
-                    'link': link,
-                    'pub_date': pub_date,
-                    'summary': summary,
-                })
-        except Exception:
-            pass
+    async def _fetch_news_async(self, session: aiohttp.ClientSession, ticker: str) -> List[Dict]:
+        """Latest 5 headlines for one ticker (same endpoint yfinance's .news wraps)."""
+        params = {'q': ticker, 'quotesCount': 0, 'newsCount': 5,
+                  'enableFuzzyQuery': 'false', 'enableNavLinks': 'false'}
+        await self._news_bucket.acquire()
+        async with session.get(self.YAHOO_NEWS_URL, params=params, headers=self.YAHOO_HEADERS,
+                               timeout=aiohttp.ClientTimeout(total=4)) as resp:
+            if resp.status != 200:
+                return []
+            body = await resp.read()
+        data = _orjson.loads(body) if _orjson is not None else json.loads(body)
 
+        news_items = []
+        for item in (data or {}).get('news', [])[:5]:
+            parsed = self._parse_news_item(item)
+            if parsed:
+                news_items.append(parsed)
         return news_items
 
-    def _calculate_approval_probability(self, event: Dict) -> Dict:
+    @staticmethod
+    def _parse_news_item(item: Dict) -> Optional[Dict]:
+        """Normalize a Yahoo news item — flat search format or nested 'content' format."""
+        content = item.get('content') or item
+        title = content.get('title') or ''
+        if not title:
+            return None
+        provider = content.get('provider', {})
+        publisher = provider.get('displayName', '') if isinstance(provider, dict) else (provider or '')
+        if not publisher:
+            publisher = item.get('publisher') or ''
+        canonical = content.get('canonicalUrl', {})
+        link = canonical.get('url', '') if isinstance(canonical, dict) else (canonical or '')
+        if not link:
+            click = content.get('clickThroughUrl', {})
+            link = click.get('url', '') if isinstance(click, dict) else (click or '')
+        if not link:
+            link = item.get('link') or ''
+        pub_date = content.get('pubDate') or ''
+        if not pub_date and item.get('providerPublishTime'):
+            try:
+                pub_date = datetime.fromtimestamp(int(item['providerPublishTime']), tz=timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+            except (ValueError, TypeError, OverflowError):
+                pass
+
+        # Summary
+        summary = content.get('summary') or ''
+        if len(summary) > 300:
+            summary = summary[:297] + '...'
+
+        return {
+            'title': title,
+            'publisher': publisher,
+            'link': link,
+            'pub_date': pub_date,
+            'summary': summary,
+        }
+
+    def _calculate_approval_probability(self, event: Dict, skip_market: bool = False) -> Dict:
+        """FDA Approval Probability — memoized on the event fields it depends on.
+        skip_market drops the Finviz layer (nothing to parse, shared cache entry)."""
+        result = self._approval_probability(
+            event.get('catalyst_type', ''),
+            event.get('status') or '',
+            event.get('drug_name') or '',
+            event.get('indication') or '',
+            event.get('phase') or '',
+            event.get('company') or '',
+            len(event.get('sources', [])),
+            () if skip_market else _fund_fingerprint(event.get('fundamentals', {}), _APPROVAL_FUND_FIELDS),
+        )
+        return {**result, 'factors': list(result['factors'])}
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _approval_probability(cat_type: str, status: str, drug_name: str, indication: str,
+                              phase: str, company: str, n_sources: int, fund_items: tuple) -> Dict:
         """
         FDA Approval Probability (PoA) — academic data + real market signals.
 
@@ -410,15 +836,9 @@ class CatalystTrackerService:
         Layer 4: FDA designations (breakthrough, priority, orphan)
         Layer 5: Real market signals (analyst targets, insider buying, institutional flow)
         """
-        cat_type = event.get('catalyst_type', '')
-        status = (event.get('status') or '').lower()
-        drug_name = (event.get('drug_name') or '').lower()
-        indication = (event.get('indication') or '').lower()
-        phase = (event.get('phase') or '').lower()
-        company = (event.get('company') or '').lower()
+        status = status.lower()
         full_text = f"{drug_name} {indication} {phase} {cat_type} {company}".lower()
-        sources = event.get('sources', [])
-        fundamentals = event.get('fundamentals', {})
+        fundamentals = dict(fund_items)
 
         probability = 50
         confidence = 'Low'
@@ -434,51 +854,28 @@ class CatalystTrackerService:
         if cat_type == 'Approval':
             return {'probability': 100, 'confidence': 'Confirmed', 'factors': ['Already approved']}
 
+        hits = _match_keywords(full_text)
+
         # ═══ LAYER 1: Phase-based base rate (BIO/PMC 2015-2023) ═══
-        is_supplemental = any(w in full_text for w in ['sbla', 'snda', 'supplemental', 'label expansion'])
+        is_supplemental = not hits.isdisjoint(SUPPLEMENTAL_TERMS)
 
-        if cat_type in ('PDUFA', 'NDA', 'BLA'):
-            if is_supplemental:
-                probability = 93
-                factors.append('PoA base: sBLA/sNDA supplemental approval 93% (BIO 2015-2023)')
-                confidence = 'High'
-            else:
-                probability = 85
-                factors.append('PoA base: NDA/BLA first-cycle approval 85% (BIO 2015-2023)')
-                confidence = 'Medium'
-        elif cat_type == 'AdCom':
-            probability = 75
-            factors.append('PoA base: Advisory Committee → approval 75%')
-            confidence = 'Medium'
-        elif cat_type == 'Phase3':
-            probability = 58
-            factors.append('PoA base: Phase 3 → approval 58% (BIO 2015-2023)')
-            confidence = 'Low'
-            if 'pivotal' in full_text:
-                probability = 62
-                factors[-1] = 'PoA base: pivotal Phase 3 → approval 62%'
-        elif cat_type == 'Phase2':
-            probability = 15
-            factors.append('PoA base: Phase 2 → approval 15% (BIO 2015-2023)')
-            confidence = 'Low'
-        elif cat_type == 'Phase1':
-            probability = 6.7
-            factors.append('PoA base: Phase 1 → approval 6.7% (BIO 2015-2023)')
-            confidence = 'Low'
+        if is_supplemental and cat_type in _NDA_STAGE_TYPES:
+            probability, confidence, base_factor = _SUPPLEMENTAL_BASE
         else:
-            probability = 50
-            factors.append('No specific phase base rate')
-            confidence = 'Low'
+            probability, confidence, base_factor = _BASE_BY_CAT_TYPE.get(cat_type, _DEFAULT_BASE)
+        if cat_type == 'Phase3' and 'pivotal' in hits:
+            probability, base_factor = 62, 'PoA base: pivotal Phase 3 → approval 62%'
+        factors.append(base_factor)
 
         # ═══ LAYER 2: Therapeutic area modifier ═══
         area_modifier_applied = False
 
         # For NDA/BLA stage — use NDA-specific area rates
-        if cat_type in ('PDUFA', 'NDA', 'BLA') and not is_supplemental:
+        if cat_type in _NDA_STAGE_TYPES and not is_supplemental:
             for keyword, rate in NDA_APPROVAL_BY_AREA.items():
                 if keyword == 'default':
                     continue
-                if keyword in full_text:
+                if keyword in hits:
                     diff = rate - 85  # difference from default NDA rate
                     if diff != 0:
                         probability = min(max(probability + diff, 10), 97)
@@ -490,7 +887,7 @@ class CatalystTrackerService:
         # For earlier phases — use overall LOA by area
         if not area_modifier_applied and cat_type in ('Phase1', 'Phase2', 'Phase3'):
             for keyword, loa in THERAPEUTIC_AREA_LOA.items():
-                if keyword in full_text:
+                if keyword in hits:
                     # Calculate the modifier relative to the generic phase rate
                     generic_loa = LOA_BY_PHASE.get(cat_type, 10)
                     if generic_loa > 0:
@@ -507,39 +904,35 @@ class CatalystTrackerService:
 
         # ═══ LAYER 3: Drug modality modifier ═══
         for modality, mod in MODALITY_MODIFIERS.items():
-            if modality in full_text and mod != 0:
+            if modality in hits and mod != 0:
                 probability = min(max(probability + mod, 3), 97)
                 modality_name = modality.replace('_', ' ').title()
                 factors.append(f'Drug modality ({modality_name}): {mod:+d}%')
                 break
 
         # ═══ LAYER 4: FDA designations ═══
-        if any(w in full_text for w in ['breakthrough']):
+        if 'breakthrough' in hits:
             probability = min(probability + 4, 97)
             factors.append('Breakthrough Therapy designation: +4%')
-        elif any(w in full_text for w in ['priority review', 'priority']):
+        elif 'priority' in hits:
             probability = min(probability + 3, 97)
             factors.append('Priority Review: +3%')
-        elif any(w in full_text for w in ['accelerated approval', 'accelerated']):
+        elif 'accelerated' in hits:
             probability = min(probability + 3, 97)
             factors.append('Accelerated Approval pathway: +3%')
-        elif any(w in full_text for w in ['fast track']):
+        elif 'fast track' in hits:
             probability = min(probability + 2, 97)
             factors.append('Fast Track designation: +2%')
 
-        if any(w in full_text for w in ['orphan', 'rare disease', 'ultra-rare']):
+        if not hits.isdisjoint(ORPHAN_TERMS):
             probability = min(probability + 4, 97)
             factors.append('Orphan drug designation: +4% (higher approval rate for rare diseases)')
 
-        rare_indicators = ['mucopolysaccharidosis', 'phenylketonuria', 'achondroplasia',
-                         'gaucher', 'menkes', 'leber', 'hunter syndrome', 'fabry', 'pompe']
-        if any(r in full_text for r in rare_indicators):
+        if not hits.isdisjoint(RARE_INDICATORS):
             probability = min(probability + 3, 97)
             factors.append('Rare genetic disease: high unmet need (+3%)')
 
-        established_drugs = ['keytruda', 'opdivo', 'dupixent', 'darzalex', 'palynziq',
-                           'sarclisa', 'filspari', 'vyvgart', 'inqovi', 'sotyktu']
-        if any(d in full_text for d in established_drugs):
+        if not hits.isdisjoint(ESTABLISHED_DRUGS):
             probability = min(probability + 4, 97)
             factors.append('Established drug — label extension (+4%)')
 
@@ -547,120 +940,105 @@ class CatalystTrackerService:
         has_market_data = False
 
         # Analyst target price vs current
-        try:
-            target = float(fundamentals.get('target_price', '0'))
-            price = float(fundamentals.get('price', '0'))
-            if target > 0 and price > 0:
-                upside = ((target - price) / price) * 100
-                has_market_data = True
-                if upside >= 40:
-                    probability = min(probability + 5, 97)
-                    factors.append(f'Analyst target ${target:.0f} (+{upside:.0f}% upside) — bullish (+5%)')
-                elif upside >= 20:
-                    probability = min(probability + 3, 97)
-                    factors.append(f'Analyst target ${target:.0f} (+{upside:.0f}% upside) (+3%)')
-                elif upside >= 5:
-                    probability = min(probability + 1, 97)
-                    factors.append(f'Analyst target ${target:.0f} (+{upside:.0f}% upside) (+1%)')
-                elif upside < -15:
-                    probability = max(probability - 5, 10)
-                    factors.append(f'Analyst target ${target:.0f} ({upside:.0f}%) — bearish (-5%)')
-                elif upside < -5:
-                    probability = max(probability - 2, 10)
-                    factors.append(f'Analyst target below price ({upside:.0f}%) (-2%)')
-        except (ValueError, TypeError, AttributeError):
-            pass
+        target = _to_float(fundamentals.get('target_price', '0'))
+        price = _to_float(fundamentals.get('price', '0'))
+        if target is not None and price is not None and target > 0 and price > 0:
+            upside = ((target - price) / price) * 100
+            has_market_data = True
+            if upside >= 40:
+                probability = min(probability + 5, 97)
+                factors.append(f'Analyst target ${target:.0f} (+{upside:.0f}% upside) — bullish (+5%)')
+            elif upside >= 20:
+                probability = min(probability + 3, 97)
+                factors.append(f'Analyst target ${target:.0f} (+{upside:.0f}% upside) (+3%)')
+            elif upside >= 5:
+                probability = min(probability + 1, 97)
+                factors.append(f'Analyst target ${target:.0f} (+{upside:.0f}% upside) (+1%)')
+            elif upside < -15:
+                probability = max(probability - 5, 10)
+                factors.append(f'Analyst target ${target:.0f} ({upside:.0f}%) — bearish (-5%)')
+            elif upside < -5:
+                probability = max(probability - 2, 10)
+                factors.append(f'Analyst target below price ({upside:.0f}%) (-2%)')
 
         # Analyst recommendation (1=Strong Buy → 5=Strong Sell)
-        try:
-            recom_val = float(fundamentals.get('analyst_recom_raw', '0'))
-            if recom_val > 0:
-                has_market_data = True
-                if recom_val <= 1.5:
-                    probability = min(probability + 3, 97)
-                    factors.append(f'Analyst consensus: Strong Buy ({recom_val:.1f}/5) (+3%)')
-                elif recom_val <= 2.2:
-                    probability = min(probability + 2, 97)
-                    factors.append(f'Analyst consensus: Buy ({recom_val:.1f}/5) (+2%)')
-                elif recom_val >= 3.5:
-                    probability = max(probability - 3, 10)
-                    factors.append(f'Analyst consensus: Underperform ({recom_val:.1f}/5) (-3%)')
-                elif recom_val >= 3.0:
-                    probability = max(probability - 1, 10)
-                    factors.append(f'Analyst consensus: Hold ({recom_val:.1f}/5) (-1%)')
-        except (ValueError, TypeError, AttributeError):
-            pass
+        recom_val = _to_float(fundamentals.get('analyst_recom_raw', '0'))
+        if recom_val is not None and recom_val > 0:
+            has_market_data = True
+            if recom_val <= 1.5:
+                probability = min(probability + 3, 97)
+                factors.append(f'Analyst consensus: Strong Buy ({recom_val:.1f}/5) (+3%)')
+            elif recom_val <= 2.2:
+                probability = min(probability + 2, 97)
+                factors.append(f'Analyst consensus: Buy ({recom_val:.1f}/5) (+2%)')
+            elif recom_val >= 3.5:
+                probability = max(probability - 3, 10)
+                factors.append(f'Analyst consensus: Underperform ({recom_val:.1f}/5) (-3%)')
+            elif recom_val >= 3.0:
+                probability = max(probability - 1, 10)
+                factors.append(f'Analyst consensus: Hold ({recom_val:.1f}/5) (-1%)')
 
         # Insider transactions
-        try:
-            insider_trans = float(fundamentals.get('insider_trans', '0').replace('%', ''))
-            if insider_trans != 0:
-                has_market_data = True
-                if insider_trans > 10:
-                    probability = min(probability + 4, 97)
-                    factors.append(f'Insider buying +{insider_trans:.0f}% — strong bullish (+4%)')
-                elif insider_trans > 2:
-                    probability = min(probability + 2, 97)
-                    factors.append(f'Insider buying +{insider_trans:.0f}% (+2%)')
-                elif insider_trans < -15:
-                    probability = max(probability - 4, 10)
-                    factors.append(f'Heavy insider selling {insider_trans:.0f}% (-4%)')
-                elif insider_trans < -5:
-                    probability = max(probability - 2, 10)
-                    factors.append(f'Insider selling {insider_trans:.0f}% (-2%)')
-        except (ValueError, TypeError, AttributeError):
-            pass
+        insider_trans = _pct_to_float(fundamentals.get('insider_trans', '0'))
+        if insider_trans is not None and insider_trans != 0:
+            has_market_data = True
+            if insider_trans > 10:
+                probability = min(probability + 4, 97)
+                factors.append(f'Insider buying +{insider_trans:.0f}% — strong bullish (+4%)')
+            elif insider_trans > 2:
+                probability = min(probability + 2, 97)
+                factors.append(f'Insider buying +{insider_trans:.0f}% (+2%)')
+            elif insider_trans < -15:
+                probability = max(probability - 4, 10)
+                factors.append(f'Heavy insider selling {insider_trans:.0f}% (-4%)')
+            elif insider_trans < -5:
+                probability = max(probability - 2, 10)
+                factors.append(f'Insider selling {insider_trans:.0f}% (-2%)')
 
         # Institutional flow
-        try:
-            inst_trans = float(fundamentals.get('inst_trans', '0').replace('%', ''))
-            if inst_trans != 0:
-                has_market_data = True
-                if inst_trans > 10:
-                    probability = min(probability + 3, 97)
-                    factors.append(f'Institutions accumulating +{inst_trans:.0f}% (+3%)')
-                elif inst_trans > 3:
-                    probability = min(probability + 1, 97)
-                    factors.append(f'Institutional buying +{inst_trans:.0f}% (+1%)')
-                elif inst_trans < -10:
-                    probability = max(probability - 3, 10)
-                    factors.append(f'Institutions exiting {inst_trans:.0f}% (-3%)')
-                elif inst_trans < -3:
-                    probability = max(probability - 1, 10)
-                    factors.append(f'Institutional selling {inst_trans:.0f}% (-1%)')
-        except (ValueError, TypeError, AttributeError):
-            pass
+        inst_trans = _pct_to_float(fundamentals.get('inst_trans', '0'))
+        if inst_trans is not None and inst_trans != 0:
+            has_market_data = True
+            if inst_trans > 10:
+                probability = min(probability + 3, 97)
+                factors.append(f'Institutions accumulating +{inst_trans:.0f}% (+3%)')
+            elif inst_trans > 3:
+                probability = min(probability + 1, 97)
+                factors.append(f'Institutional buying +{inst_trans:.0f}% (+1%)')
+            elif inst_trans < -10:
+                probability = max(probability - 3, 10)
+                factors.append(f'Institutions exiting {inst_trans:.0f}% (-3%)')
+            elif inst_trans < -3:
+                probability = max(probability - 1, 10)
+                factors.append(f'Institutional selling {inst_trans:.0f}% (-1%)')
 
         # Monthly stock performance
-        try:
-            perf_month = float(fundamentals.get('perf_month', '0').replace('%', ''))
-            if abs(perf_month) >= 5:
-                has_market_data = True
-                if perf_month >= 20:
-                    probability = min(probability + 3, 97)
-                    factors.append(f'Stock +{perf_month:.0f}% this month — market pricing in approval (+3%)')
-                elif perf_month >= 10:
-                    probability = min(probability + 1, 97)
-                    factors.append(f'Stock +{perf_month:.0f}% this month (+1%)')
-                elif perf_month <= -20:
-                    probability = max(probability - 4, 10)
-                    factors.append(f'Stock {perf_month:.0f}% this month — market concerned (-4%)')
-                elif perf_month <= -10:
-                    probability = max(probability - 2, 10)
-                    factors.append(f'Stock {perf_month:.0f}% this month (-2%)')
-        except (ValueError, TypeError, AttributeError):
-            pass
+        perf_month = _pct_to_float(fundamentals.get('perf_month', '0'))
+        if perf_month is not None and abs(perf_month) >= 5:
+            has_market_data = True
+            if perf_month >= 20:
+                probability = min(probability + 3, 97)
+                factors.append(f'Stock +{perf_month:.0f}% this month — market pricing in approval (+3%)')
+            elif perf_month >= 10:
+                probability = min(probability + 1, 97)
+                factors.append(f'Stock +{perf_month:.0f}% this month (+1%)')
+            elif perf_month <= -20:
+                probability = max(probability - 4, 10)
+                factors.append(f'Stock {perf_month:.0f}% this month — market concerned (-4%)')
+            elif perf_month <= -10:
+                probability = max(probability - 2, 10)
+                factors.append(f'Stock {perf_month:.0f}% this month (-2%)')
 
         # ═══ CONFIDENCE ═══
-        if has_market_data and len(sources) >= 2:
+        if has_market_data and n_sources >= 2:
             confidence = 'High'
-        elif has_market_data or len(sources) >= 2:
+        elif has_market_data or n_sources >= 2:
             confidence = 'Medium'
         else:
             confidence = 'Low'
 
-        if len(sources) >= 2:
-            factors.append(f'Confirmed by {len(sources)} independent sources')
+        if n_sources >= 2:
+            factors.append(f'Confirmed by {n_sources} independent sources')
 
         # Round probability
         probability = int(round(min(max(probability, 3), 97)))
@@ -671,7 +1049,21 @@ class CatalystTrackerService:
             'factors': factors,
         }
 
-    def _calculate_catalyst_score(self, event: Dict) -> int:
+    def _calculate_catalyst_score(self, event: Dict, skip_market: bool = False) -> int:
+        """Trading Opportunity Score — memoized; sets event['score_factors']."""
+        score, factors = self._catalyst_score(
+            event.get('days_until'),
+            len(event.get('sources', [])),
+            event.get('catalyst_type', ''),
+            () if skip_market else _fund_fingerprint(event.get('fundamentals', {}), _SCORE_FUND_FIELDS),
+        )
+        event['score_factors'] = list(factors)
+        return score
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _catalyst_score(days: Optional[int], n_sources: int, cat_type: str,
+                        fund_items: tuple) -> tuple:
         """
         Trading Opportunity Score (0-100) — how attractive is this as a trade.
 
@@ -687,10 +1079,9 @@ class CatalystTrackerService:
         """
         score = 0
         factors = []
-        fundamentals = event.get('fundamentals', {})
+        fundamentals = dict(fund_items)
 
         # ═══ 1. TIMING (0-20 pts) — closer catalyst = more urgent trade setup ═══
-        days = event.get('days_until')
         if days is not None:
             if days == 0:
                 score += 20; factors.append('Catalyst TODAY (+20)')
@@ -711,41 +1102,32 @@ class CatalystTrackerService:
 
         # ═══ 2. VOLATILITY SETUP (0-20 pts) — real ATR, beta, short squeeze ═══
         # ATR — Average True Range (actual daily $ movement)
-        atr_str = fundamentals.get('atr', '')
-        price_str = fundamentals.get('price', '')
-        try:
-            atr = float(atr_str)
-            price = float(price_str)
-            if price > 0:
-                atr_pct = (atr / price) * 100  # ATR as % of price
-                if atr_pct >= 5:
-                    score += 8; factors.append(f'High ATR {atr_pct:.1f}% — volatile (+8)')
-                elif atr_pct >= 3:
-                    score += 6; factors.append(f'ATR {atr_pct:.1f}% (+6)')
-                elif atr_pct >= 2:
-                    score += 4; factors.append(f'ATR {atr_pct:.1f}% (+4)')
-                elif atr_pct >= 1:
-                    score += 2
-        except (ValueError, TypeError, AttributeError):
-            pass
+        atr = _to_float(fundamentals.get('atr', ''))
+        price = _to_float(fundamentals.get('price', ''))
+        if atr is not None and price is not None and price > 0:
+            atr_pct = (atr / price) * 100  # ATR as % of price
+            if atr_pct >= 5:
+                score += 8; factors.append(f'High ATR {atr_pct:.1f}% — volatile (+8)')
+            elif atr_pct >= 3:
+                score += 6; factors.append(f'ATR {atr_pct:.1f}% (+6)')
+            elif atr_pct >= 2:
+                score += 4; factors.append(f'ATR {atr_pct:.1f}% (+4)')
+            elif atr_pct >= 1:
+                score += 2
 
         # Beta — sensitivity to market
-        beta_str = fundamentals.get('beta', '')
-        try:
-            beta = float(beta_str)
+        beta = _to_float(fundamentals.get('beta', ''))
+        if beta is not None:
             if beta >= 2.0:
                 score += 4; factors.append(f'High beta {beta:.1f} (+4)')
             elif beta >= 1.5:
                 score += 3
             elif beta >= 1.0:
                 score += 1
-        except (ValueError, TypeError, AttributeError):
-            pass
 
         # Short float — squeeze potential
-        short_float_str = fundamentals.get('short_float', '')
-        try:
-            short_float = float(short_float_str.replace('%', ''))
+        short_float = _pct_to_float(fundamentals.get('short_float', ''))
+        if short_float is not None:
             if short_float >= 20:
                 score += 8; factors.append(f'Short squeeze setup: {short_float:.0f}% short (+8)')
             elif short_float >= 15:
@@ -754,13 +1136,10 @@ class CatalystTrackerService:
                 score += 4; factors.append(f'Elevated short: {short_float:.0f}% (+4)')
             elif short_float >= 5:
                 score += 2
-        except (ValueError, TypeError, AttributeError):
-            pass
 
         # ═══ 3. VOLUME & LIQUIDITY (0-15 pts) — can you trade it ═══
-        rel_vol_str = fundamentals.get('rel_volume', '')
-        try:
-            rel_vol = float(rel_vol_str)
+        rel_vol = _to_float(fundamentals.get('rel_volume', ''))
+        if rel_vol is not None:
             if rel_vol >= 3.0:
                 score += 8; factors.append(f'Unusual volume {rel_vol:.1f}x (+8)')
             elif rel_vol >= 2.0:
@@ -769,14 +1148,10 @@ class CatalystTrackerService:
                 score += 4; factors.append(f'Above-avg volume {rel_vol:.1f}x (+4)')
             elif rel_vol >= 1.0:
                 score += 2
-        except (ValueError, TypeError):
-            pass
 
         # Average volume — liquidity check
-        avg_vol_str = fundamentals.get('avg_volume', '')
-        try:
-            avg_vol_clean = avg_vol_str.replace(',', '').replace('K', '000').replace('M', '000000')
-            avg_vol = float(avg_vol_clean)
+        avg_vol = _volume_to_float(fundamentals.get('avg_volume', ''))
+        if avg_vol is not None:
             if avg_vol >= 2_000_000:
                 score += 5; factors.append('High liquidity 2M+ avg vol (+5)')
             elif avg_vol >= 500_000:
@@ -785,62 +1160,47 @@ class CatalystTrackerService:
                 score += 2
             else:
                 factors.append('Low liquidity — caution')
-        except (ValueError, TypeError, AttributeError):
-            pass
 
         # Gap — already moving pre-market
         gap_str = fundamentals.get('gap_pct', '')
-        try:
-            gap = abs(float(gap_str.replace('%', '')))
-            if gap >= 5:
-                score += 2; factors.append(f'Gap {gap_str} pre-market (+2)')
-        except (ValueError, TypeError, AttributeError):
-            pass
+        gap = _pct_to_float(gap_str)
+        if gap is not None and abs(gap) >= 5:
+            score += 2; factors.append(f'Gap {gap_str} pre-market (+2)')
 
         # ═══ 4. INSTITUTIONAL SIGNAL (0-15 pts) — smart money ═══
         # Institutional ownership (higher = more analyst coverage, stable)
-        inst_own_str = fundamentals.get('inst_own', '')
-        try:
-            inst_own = float(inst_own_str.replace('%', ''))
+        inst_own = _pct_to_float(fundamentals.get('inst_own', ''))
+        if inst_own is not None:
             if inst_own >= 80:
                 score += 6; factors.append(f'Strong inst. ownership {inst_own:.0f}% (+6)')
             elif inst_own >= 50:
                 score += 4; factors.append(f'Inst. ownership {inst_own:.0f}% (+4)')
             elif inst_own >= 20:
                 score += 2
-        except (ValueError, TypeError, AttributeError):
-            pass
 
         # Insider transactions — are insiders buying ahead of catalyst?
-        insider_trans_str = fundamentals.get('insider_trans', '')
-        try:
-            insider_trans = float(insider_trans_str.replace('%', ''))
+        insider_trans = _pct_to_float(fundamentals.get('insider_trans', ''))
+        if insider_trans is not None:
             if insider_trans > 5:
                 score += 5; factors.append(f'Insider BUYING +{insider_trans:.0f}% (+5)')
             elif insider_trans > 0:
                 score += 3; factors.append(f'Insider buying +{insider_trans:.0f}% (+3)')
             elif insider_trans < -10:
                 score -= 2; factors.append(f'Insider selling {insider_trans:.0f}% (-2)')
-        except (ValueError, TypeError, AttributeError):
-            pass
 
         # Institutional transactions — smart money flow
-        inst_trans_str = fundamentals.get('inst_trans', '')
-        try:
-            inst_trans = float(inst_trans_str.replace('%', ''))
+        inst_trans = _pct_to_float(fundamentals.get('inst_trans', ''))
+        if inst_trans is not None:
             if inst_trans > 5:
                 score += 4; factors.append(f'Institutions accumulating +{inst_trans:.0f}% (+4)')
             elif inst_trans > 0:
                 score += 2
             elif inst_trans < -5:
                 score -= 1; factors.append(f'Institutions reducing {inst_trans:.0f}% (-1)')
-        except (ValueError, TypeError, AttributeError):
-            pass
 
         # ═══ 5. ANALYST & TARGET (0-15 pts) — Wall Street view ═══
-        recom_raw = fundamentals.get('analyst_recom_raw', '')
-        try:
-            recom_val = float(recom_raw)
+        recom_val = _to_float(fundamentals.get('analyst_recom_raw', ''))
+        if recom_val is not None:
             # Finviz: 1.0 = Strong Buy, 2.0 = Buy, 3.0 = Hold, 4.0 = Sell, 5.0 = Strong Sell
             if recom_val <= 1.5:
                 score += 8; factors.append(f'Analyst: Strong Buy ({recom_val:.1f}) (+8)')
@@ -852,7 +1212,7 @@ class CatalystTrackerService:
                 score += 2
             elif recom_val > 3.5:
                 score -= 2; factors.append(f'Analyst: Underperform ({recom_val:.1f}) (-2)')
-        except (ValueError, TypeError, AttributeError):
+        else:
             # Fallback to text
             recom = fundamentals.get('analyst_recom', '')
             if 'Strong Buy' in recom:
@@ -863,52 +1223,43 @@ class CatalystTrackerService:
                 score += 2
 
         # Target price upside
-        try:
-            target = float(fundamentals.get('target_price', '0'))
-            price = float(fundamentals.get('price', '0'))
-            if target > 0 and price > 0:
-                upside = ((target - price) / price) * 100
-                if upside >= 30:
-                    score += 7; factors.append(f'Target ${target:.0f} — {upside:.0f}% upside (+7)')
-                elif upside >= 15:
-                    score += 5; factors.append(f'Target ${target:.0f} — {upside:.0f}% upside (+5)')
-                elif upside >= 5:
-                    score += 3; factors.append(f'Target ${target:.0f} — {upside:.0f}% upside (+3)')
-                elif upside < -10:
-                    score -= 2; factors.append(f'Target ${target:.0f} — {abs(upside):.0f}% downside (-2)')
-        except (ValueError, TypeError, AttributeError):
-            pass
+        target = _to_float(fundamentals.get('target_price', '0'))
+        price = _to_float(fundamentals.get('price', '0'))
+        if target is not None and price is not None and target > 0 and price > 0:
+            upside = ((target - price) / price) * 100
+            if upside >= 30:
+                score += 7; factors.append(f'Target ${target:.0f} — {upside:.0f}% upside (+7)')
+            elif upside >= 15:
+                score += 5; factors.append(f'Target ${target:.0f} — {upside:.0f}% upside (+5)')
+            elif upside >= 5:
+                score += 3; factors.append(f'Target ${target:.0f} — {upside:.0f}% upside (+3)')
+            elif upside < -10:
+                score -= 2; factors.append(f'Target ${target:.0f} — {abs(upside):.0f}% downside (-2)')
 
         # ═══ 6. CONFIRMATION (0-15 pts) — data quality + momentum ═══
         # Multiple source confirmation
-        sources = event.get('sources', [])
-        if len(sources) >= 3:
-            score += 6; factors.append(f'Confirmed by {len(sources)} independent sources (+6)')
-        elif len(sources) >= 2:
-            score += 4; factors.append(f'Confirmed by {len(sources)} sources (+4)')
+        if n_sources >= 3:
+            score += 6; factors.append(f'Confirmed by {n_sources} independent sources (+6)')
+        elif n_sources >= 2:
+            score += 4; factors.append(f'Confirmed by {n_sources} sources (+4)')
         else:
             score += 1
 
         # Catalyst type importance
-        cat_type = event.get('catalyst_type', '')
         type_bonus = {'PDUFA': 5, 'Approval': 4, 'AdCom': 4, 'NDA': 3, 'BLA': 3, 'CRL': 3}
         t_bonus = type_bonus.get(cat_type, 0)
         if t_bonus:
             score += t_bonus
 
         # Recent performance — momentum going into catalyst
-        perf_week_str = fundamentals.get('perf_week', '')
-        try:
-            perf_week = float(perf_week_str.replace('%', ''))
+        perf_week = _pct_to_float(fundamentals.get('perf_week', ''))
+        if perf_week is not None:
             if abs(perf_week) >= 10:
                 score += 4; factors.append(f'Week perf {perf_week:+.1f}% — active (+4)')
             elif abs(perf_week) >= 5:
                 score += 2
-        except (ValueError, TypeError, AttributeError):
-            pass
 
-        event['score_factors'] = factors
-        return max(0, min(100, score))
+        return max(0, min(100, score)), tuple(factors)
 
     # ═══════════════════════════════════════════════════════════
     # FDA MOVERS — Track historical catalyst stock movements
@@ -923,124 +1274,138 @@ class CatalystTrackerService:
         # Get events including past ones
         events = await self.get_catalyst_events(days_forward=90, days_back=days_back, enriched=True)
 
-        # Filter to past events only, deduplicate by (ticker, date)
-        past_events = [e for e in events if e.get('days_until') is not None and e.get('days_until') < 0]
-        seen_keys = set()
-        unique_past = []
-        for e in past_events:
-            key = (e.get('ticker', ''), e.get('catalyst_date', ''))
-            if key not in seen_keys:
-                seen_keys.add(key)
-                unique_past.append(e)
+        # Past events only, first 15 unique (ticker, date) pairs in calendar order
+        past = {}
+        for e in events:
+            days = e.get('days_until')
+            if days is None or days >= 0:
+                continue
+            past.setdefault((e.get('ticker', ''), e.get('catalyst_date', '')), e)
+            if len(past) == 15:
+                break
+        unique_past = list(past.values())
 
         if not unique_past:
             return []
 
-        # Fetch price data for past events
-        sem = asyncio.Semaphore(3)
-        movers = []
-
-        async def analyze_mover(event: Dict):
-            async with sem:
-                ticker = event.get('ticker', '')
-                catalyst_date = event.get('catalyst_date', '')
-                if not ticker or not catalyst_date:
-                    return None
-
-                try:
-                    loop = asyncio.get_event_loop()
-                    result = await asyncio.wait_for(
-                        loop.run_in_executor(
-                            self._yf_executor,
-                            self._get_mover_data_sync,
-                            ticker,
-                            catalyst_date
-                        ),
-                        timeout=6
-                    )
-                    if result:
-                        result['ticker'] = ticker
-                        result['catalyst_date'] = catalyst_date
-                        result['catalyst_type'] = event.get('catalyst_type', '')
-                        result['drug_name'] = event.get('drug_name', '')
-                        result['indication'] = event.get('indication', '')
-                        result['company'] = event.get('company', '')
-                        result['status'] = event.get('status', '')
-                        result['approval_probability'] = event.get('approval_probability', {})
-                        result['fundamentals'] = event.get('fundamentals', {})
-                        return result
-                except (asyncio.TimeoutError, Exception):
-                    pass
-                return None
+        # One batched yfinance download covering every event window, then per-event slicing
+        parsed = []
+        for e in unique_past:
+            if not e.get('ticker') or not e.get('catalyst_date'):
+                continue
+            try:
+                parsed.append((e, datetime.strptime(e['catalyst_date'], '%Y-%m-%d')))
+            except ValueError:
+                continue
+        if not parsed:
+            return []
 
-        tasks = [analyze_mover(e) for e in unique_past[:15]]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            loop = asyncio.get_event_loop()
+            results = await asyncio.wait_for(
+                loop.run_in_executor(_YF_EXECUTOR, self._get_movers_sync, parsed),
+                timeout=20
+            )
+        except (asyncio.TimeoutError, Exception) as e:
+            log.warning("FDA movers download failed: %s", e)
+            return []
 
-        for r in results:
-            if isinstance(r, dict) and r:
-                movers.append(r)
+        movers = []
+        for event, result in results:
+            result['ticker'] = event.get('ticker', '')
+            result['catalyst_date'] = event.get('catalyst_date', '')
+            result['catalyst_type'] = event.get('catalyst_type', '')
+            result['drug_name'] = event.get('drug_name', '')
+            result['indication'] = event.get('indication', '')
+            result['company'] = event.get('company', '')
+            result['status'] = event.get('status', '')
+            result['approval_probability'] = event.get('approval_probability', {})
+            result['fundamentals'] = event.get('fundamentals', {})
+            movers.append(result)
 
         # Sort by absolute move size
         movers.sort(key=lambda x: abs(x.get('catalyst_day_move', 0)), reverse=True)
         return movers
 
-    def _get_mover_data_sync(self, ticker: str, catalyst_date: str) -> Optional[Dict]:
-        """Get price movement data around a catalyst date."""
-        try:
-            cat_dt = datetime.strptime(catalyst_date, '%Y-%m-%d')
-            start = cat_dt - timedelta(days=10)
-            end = min(cat_dt + timedelta(days=5), datetime.now())
+    def _get_movers_sync(self, parsed: List[tuple]) -> List[tuple]:
+        """Download daily bars for all mover tickers in one call and compute each event's move."""
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        windows = [(cat_dt - timedelta(days=10), min(cat_dt + timedelta(days=5), today))
+                   for _, cat_dt in parsed]
+        tickers = list(dict.fromkeys(e['ticker'] for e, _ in parsed))
+
+        data = yf.download(
+            tickers=tickers,
+            start=min(w[0] for w in windows).strftime('%Y-%m-%d'),
+            end=max(w[1] for w in windows).strftime('%Y-%m-%d'),
+            interval='1d',
+            group_by='ticker',
+            progress=False,
+            auto_adjust=True,
+            threads=True,
+            timeout=10,
+        )
+        if data is None or data.empty:
+            return []
+        if data.index.tz is not None:
+            data.index = data.index.tz_localize(None)
 
-            stock = yf.Ticker(ticker)
-            hist = stock.history(start=start.strftime('%Y-%m-%d'),
-                               end=end.strftime('%Y-%m-%d'),
-                               timeout=5)
+        results = []
+        for (event, cat_dt), (start, end) in zip(parsed, windows):
+            ticker = event['ticker']
+            try:
+                hist = data[ticker] if isinstance(data.columns, pd.MultiIndex) else data
+            except KeyError:
+                continue
+            hist = hist[(hist.index >= start) & (hist.index < end)].dropna(subset=['Close'])
+            result = self._get_mover_data(hist, cat_dt, ticker)
+            if result:
+                results.append((event, result))
+        return results
 
+    def _get_mover_data(self, hist: pd.DataFrame, cat_dt: datetime, ticker: str) -> Optional[Dict]:
+        """Get price movement data around a catalyst date from its daily-bar window."""
+        try:
             if hist.empty or len(hist) < 3:
                 return None
 
-            # Find the catalyst day or nearest trading day
-            cat_date_str = cat_dt.strftime('%Y-%m-%d')
-            hist.index = hist.index.tz_localize(None)
-
             # Find nearest trading day to catalyst
-            closest_idx = None
-            min_diff = 999
-            for i, dt in enumerate(hist.index):
-                diff = abs((dt - cat_dt).days)
-                if diff < min_diff:
-                    min_diff = diff
-                    closest_idx = i
-
-            if closest_idx is None or closest_idx == 0:
+            closest_idx = _nearest_sorted(hist.index.asi8, np.datetime64(cat_dt, 'ns').astype(np.int64))
+            if closest_idx == 0:
                 return None
 
-            # Catalyst day data
-            cat_day = hist.iloc[closest_idx]
-            prev_day = hist.iloc[closest_idx - 1]
+            closes = hist['Close'].to_numpy(dtype=float)
+            opens = hist['Open'].to_numpy(dtype=float)
+            highs = hist['High'].to_numpy(dtype=float)
+            lows = hist['Low'].to_numpy(dtype=float)
+            vols = hist['Volume'].to_numpy(dtype=float)
+
+            # Catalyst day vs previous close
+            cat_close = float(closes[closest_idx])
+            prev_close = float(closes[closest_idx - 1])
 
             # Day move
-            cat_day_move = ((cat_day['Close'] - prev_day['Close']) / prev_day['Close']) * 100
+            cat_day_move = (cat_close - prev_close) / prev_close * 100.0
 
             # Gap (open vs prev close)
-            gap_pct = ((cat_day['Open'] - prev_day['Close']) / prev_day['Close']) * 100
+            gap_pct = (float(opens[closest_idx]) - prev_close) / prev_close * 100.0
 
             # Intraday range
-            intraday_range = ((cat_day['High'] - cat_day['Low']) / cat_day['Low']) * 100
+            cat_low = float(lows[closest_idx])
+            intraday_range = (float(highs[closest_idx]) - cat_low) / cat_low * 100.0
 
             # Volume change
-            avg_vol = hist.iloc[:closest_idx]['Volume'].mean() if closest_idx > 0 else 1
-            vol_ratio = cat_day['Volume'] / avg_vol if avg_vol > 0 else 1
+            avg_vol = float(vols[:closest_idx].mean())
+            vol_ratio = float(vols[closest_idx]) / avg_vol if avg_vol > 0 else 1
 
             # Week move (from 5 days before to catalyst day)
-            week_start_idx = max(0, closest_idx - 5)
-            week_move = ((cat_day['Close'] - hist.iloc[week_start_idx]['Close']) / hist.iloc[week_start_idx]['Close']) * 100
+            week_close = float(closes[max(0, closest_idx - 5)])
+            week_move = (cat_close - week_close) / week_close * 100.0
 
             # Post-catalyst move (if data available)
             post_move = 0
-            if closest_idx + 1 < len(hist):
-                last_available = hist.iloc[-1]
-                post_move = ((last_available['Close'] - cat_day['Close']) / cat_day['Close']) * 100
+            if closest_idx + 1 < len(closes):
+                post_move = (float(closes[-1]) - cat_close) / cat_close * 100.0
 
             # Classify the move
             analysis = self._analyze_mover(cat_day_move, gap_pct, vol_ratio, intraday_range)
@@ -1052,12 +1417,12 @@ class CatalystTrackerService:
                 'volume_ratio': round(vol_ratio, 1),
                 'week_move': round(week_move, 2),
                 'post_catalyst_move': round(post_move, 2),
-                'price_before': round(prev_day['Close'], 2),
-                'price_after': round(cat_day['Close'], 2),
+                'price_before': round(prev_close, 2),
+                'price_after': round(cat_close, 2),
                 'analysis': analysis,
             }
         except Exception as e:
-            print(f"Mover data error {ticker}: {e}")
+            log.warning("Mover data error %s: %s", ticker, e)
             return None
 
     def _analyze_mover(self, day_move: float, gap: float, vol_ratio: float, intraday: float) -> Dict:
@@ -1144,27 +1509,21 @@ class CatalystTrackerService:
         Returns empty list if the US market hasn't opened yet (pre-9:30 AM ET).
         Cross-reference with FDA calendar to identify catalyst-driven moves.
         """
-        import aiohttp
-        from bs4 import BeautifulSoup
-
         # Return empty if today's session hasn't started yet
         _, _, _, today_session_active = self._get_trading_session_dates()
         if not today_session_active:
             return []
 
         # Get FDA events for cross-referencing
-        fda_events = await self.get_catalyst_events(days_forward=90, days_back=7, enriched=False)
-        fda_map = {}
-        for e in fda_events:
-            t = e.get('ticker', '')
-            if t:
-                fda_map[t] = e
+        fda_map = self._fda_ticker_map(
+            await self.get_catalyst_events(days_forward=90, days_back=7, enriched=False))
 
         # Scan Finviz for healthcare movers
         filters_up = 'sec_healthcaretechnology,sec_healthcare,ta_change_u3,sh_avgvol_o200,sh_price_o2'
         filters_down = 'sec_healthcaretechnology,sec_healthcare,ta_change_d3,sh_avgvol_o200,sh_price_o2'
 
         all_movers = []
+        change_nums: Dict[str, float] = {}
 
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
@@ -1180,68 +1539,52 @@ class CatalystTrackerService:
             results = []
             url = f"{base_url}?v=111&f={filters}&o={'change' if direction == 'down' else '-change'}"
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=12)) as resp:
-                        if resp.status != 200:
-                            return results
-                        html = await resp.text()
-                        soup = BeautifulSoup(html, 'html.parser')
-
-                        table = soup.find('table', class_='table-light')
-                        if not table:
-                            # Try alternative
-                            tables = soup.find_all('table')
-                            for t in tables:
-                                if t.find('td', string=lambda s: s and '%' in str(s)):
-                                    table = t
-                                    break
-
-                        if not table:
-                            return results
-
-                        rows = table.find_all('tr')[1:]  # skip header
-                        for row in rows[:30]:
-                            cells = row.find_all('td')
-                            if len(cells) < 10:
+                async with self._get_http().get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=12)) as resp:
+                    if resp.status != 200:
+                        return results
+                    html = await resp.text()
+
+                    for cells in _screener_rows(html, limit=30):
+                        if len(cells) < 10:
+                            continue
+                        try:
+                            ticker = cells[1]
+                            company = cells[2]
+                            sector = cells[3]
+                            industry = cells[4]
+                            market_cap = cells[6]
+                            price = cells[8]
+                            change = cells[9]
+                            volume = cells[10] if len(cells) > 10 else ''
+
+                            if not ticker or ticker in {'FDA', 'SEC', 'CEO', 'No.', 'Ticker'}:
+                                continue
+                            # Skip non-ticker values (row numbers, headers)
+                            if not ticker.isalpha() or len(ticker) > 5:
                                 continue
+
+                            # Validate that change looks like a number (skip header rows)
+                            change_clean = change.translate(_PCT_STRIP).strip()
                             try:
-                                ticker = cells[1].get_text(strip=True)
-                                company = cells[2].get_text(strip=True)
-                                sector = cells[3].get_text(strip=True) if len(cells) > 3 else ''
-                                industry = cells[4].get_text(strip=True) if len(cells) > 4 else ''
-                                market_cap = cells[6].get_text(strip=True) if len(cells) > 6 else ''
-                                price = cells[8].get_text(strip=True) if len(cells) > 8 else ''
-                                change = cells[9].get_text(strip=True) if len(cells) > 9 else ''
-                                volume = cells[10].get_text(strip=True) if len(cells) > 10 else ''
-
-                                if not ticker or ticker in {'FDA', 'SEC', 'CEO', 'No.', 'Ticker'}:
-                                    continue
-                                # Skip non-ticker values (row numbers, headers)
-                                if not ticker.isalpha() or len(ticker) > 5:
-                                    continue
-
-                                # Validate that change looks like a number (skip header rows)
-                                change_clean = change.replace('%', '').replace('+', '').replace(',', '').strip()
-                                try:
-                                    float(change_clean)
-                                except ValueError:
-                                    continue
-
-                                results.append({
-                                    'ticker': ticker,
-                                    'company': company,
-                                    'sector': sector,
-                                    'industry': industry,
-                                    'market_cap': market_cap,
-                                    'price': price,
-                                    'change_pct': change,
-                                    'volume': volume,
-                                    'direction': direction,
-                                })
-                            except (IndexError, AttributeError):
+                                change_nums[ticker] = float(change_clean)
+                            except ValueError:
                                 continue
+
+                            results.append({
+                                'ticker': ticker,
+                                'company': company,
+                                'sector': sector,
+                                'industry': industry,
+                                'market_cap': market_cap,
+                                'price': price,
+                                'change_pct': change,
+                                'volume': volume,
+                                'direction': direction,
+                            })
+                        except (IndexError, AttributeError):
+                            continue
             except Exception as e:
-                print(f"Biotech scan error ({direction}): {e}")
+                log.warning("Biotech scan error (%s): %s", direction, e)
             return results
 
         # Scan both directions in parallel
@@ -1252,6 +1595,7 @@ class CatalystTrackerService:
 
         # Merge
         seen = set()
+        sort_keys = []
         for item in up_results + down_results:
             ticker = item['ticker']
             if ticker in seen:
@@ -1277,12 +1621,10 @@ class CatalystTrackerService:
             item['move_reason'] = self._classify_biotech_move(item, fda_event)
 
             all_movers.append(item)
+            sort_keys.append((not item['has_fda_catalyst'], -abs(change_nums.get(ticker, 0.0))))
 
-        # Sort: FDA catalyst movers first, then by absolute change
-        all_movers.sort(key=lambda x: (
-            -int(x.get('has_fda_catalyst', False)),
-            -abs(float(str(x.get('change_pct', '0')).replace('%', '').replace('+', '') or '0'))
-        ))
+        # Sort: FDA catalyst movers first, then by absolute change (parsed once during the scan)
+        self._apply_order(all_movers, sort_keys)
 
         return all_movers
 
@@ -1317,9 +1659,6 @@ class CatalystTrackerService:
 
     async def _get_healthcare_universe(self) -> List[str]:
         """Fetch a broad list of active healthcare tickers from Finviz (no change% filter)."""
-        import aiohttp
-        from bs4 import BeautifulSoup
-
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'text/html',
@@ -1334,34 +1673,19 @@ class CatalystTrackerService:
 
         tickers = []
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=12)) as resp:
-                    if resp.status != 200:
-                        return []
-                    html = await resp.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-
-                    table = soup.find('table', class_='table-light')
-                    if not table:
-                        tables = soup.find_all('table')
-                        for t in tables:
-                            if t.find('td', string=lambda s: s and str(s).isalpha() and len(str(s)) <= 5):
-                                table = t
-                                break
-
-                    if not table:
-                        return []
-
-                    rows = table.find_all('tr')[1:]
-                    for row in rows[:80]:
-                        cells = row.find_all('td')
-                        if len(cells) < 2:
-                            continue
-                        ticker = cells[1].get_text(strip=True)
-                        if ticker and ticker.isalpha() and 1 <= len(ticker) <= 5 and ticker not in {'FDA', 'SEC', 'CEO', 'No.', 'Ticker'}:
-                            tickers.append(ticker)
+            async with self._get_http().get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=12)) as resp:
+                if resp.status != 200:
+                    return []
+                html = await resp.text()
+
+            for cells in _screener_rows(html, limit=80):
+                if len(cells) < 2:
+                    continue
+                ticker = cells[1]
+                if ticker and ticker.isalpha() and 1 <= len(ticker) <= 5 and ticker not in {'FDA', 'SEC', 'CEO', 'No.', 'Ticker'}:
+                    tickers.append(ticker)
         except Exception as e:
-            print(f"Healthcare universe fetch error: {e}")
+            log.warning("Healthcare universe fetch error: %s", e)
 
         return tickers
 
@@ -1369,17 +1693,11 @@ class CatalystTrackerService:
         """Get previous trading session's healthcare movers using yfinance batch download.
         Returns stocks that moved >3% in the previous completed trading session.
         """
-        import pandas as pd
-
         current_session, prev_session, is_market_open, today_session_active = self._get_trading_session_dates()
 
         # Get FDA events for cross-referencing
-        fda_events = await self.get_catalyst_events(days_forward=90, days_back=7, enriched=False)
-        fda_map = {}
-        for e in fda_events:
-            t = e.get('ticker', '')
-            if t:
-                fda_map[t] = e
+        fda_map = self._fda_ticker_map(
+            await self.get_catalyst_events(days_forward=90, days_back=7, enriched=False))
 
         # Get a universe of healthcare tickers from Finviz
         tickers = await self._get_healthcare_universe()
@@ -1399,19 +1717,18 @@ class CatalystTrackerService:
                 )
                 return data
             except Exception as e:
-                print(f"yfinance batch download error: {e}")
+                log.warning("yfinance batch download error: %s", e)
                 return None
 
         loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            try:
-                data = await asyncio.wait_for(
-                    loop.run_in_executor(executor, fetch_batch_data, tickers),
-                    timeout=25
-                )
-            except asyncio.TimeoutError:
-                print("yfinance batch download timed out for yesterday's movers")
-                return []
+        try:
+            data = await asyncio.wait_for(
+                loop.run_in_executor(_YF_EXECUTOR, fetch_batch_data, tickers),
+                timeout=25
+            )
+        except asyncio.TimeoutError:
+            log.warning("yfinance batch download timed out for yesterday's movers")
+            return []
 
         if data is None or data.empty:
             return []
@@ -1426,6 +1743,7 @@ class CatalystTrackerService:
             close_data = close_data.to_frame(name=tickers[0] if tickers else 'UNKNOWN')
 
         movers = []
+        sort_keys = []
         for ticker in close_data.columns:
             col = close_data[ticker].dropna()
             if len(col) < 2:
@@ -1484,11 +1802,9 @@ class CatalystTrackerService:
 
             item['move_reason'] = self._classify_biotech_move(item, fda_event)
             movers.append(item)
+            sort_keys.append((not item['has_fda_catalyst'], -abs(change_pct)))
 
-        movers.sort(key=lambda x: (
-            -int(x.get('has_fda_catalyst', False)),
-            -abs(float(str(x.get('change_pct', '0')).replace('%', '').replace('+', '') or '0'))
-        ))
+        self._apply_order(movers, sort_keys)
         return movers
 
     @staticmethod
@@ -1537,7 +1853,7 @@ class CatalystTrackerService:
             except Exception:
                 pass
         except Exception as e:
-            print(f"RSI sync error {ticker}: {e}")
+            log.warning("RSI sync error %s: %s", ticker, e)
         return {k: v for k, v in result.items() if v is not None}
 
     async def _fetch_rsi_batch(self, tickers: List[str], limit: int = 15) -> Dict[str, Dict]:
@@ -1546,7 +1862,6 @@ class CatalystTrackerService:
             return {}
         tickers = list(dict.fromkeys(tickers))[:limit]
         sem = asyncio.Semaphore(2)
-        rsi_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='rsi')
 
         async def fetch_one(ticker: str):
             async with sem:
@@ -1554,12 +1869,12 @@ class CatalystTrackerService:
                 try:
                     loop = asyncio.get_event_loop()
                     data = await asyncio.wait_for(
-                        loop.run_in_executor(rsi_executor, self._fetch_rsi_sync, ticker),
+                        loop.run_in_executor(_YF_EXECUTOR, self._fetch_rsi_sync, ticker),
                         timeout=12
                     )
                     return ticker, data
                 except asyncio.TimeoutError:
-                    print(f"RSI timeout: {ticker}")
+                    log.warning("RSI timeout: %s", ticker)
                     return ticker, {}
                 except Exception:
                     return ticker, {}
@@ -1571,8 +1886,6 @@ class CatalystTrackerService:
             )
         except asyncio.TimeoutError:
             results = []
-        finally:
-            rsi_executor.shutdown(wait=False)
 
         rsi_map = {}
         for r in results:
@@ -1584,7 +1897,7 @@ class CatalystTrackerService:
 
     def _classify_biotech_move(self, mover: Dict, fda_event: Optional[Dict]) -> Dict:
         """Classify why a biotech stock is moving today."""
-        change_str = str(mover.get('change_pct', '0')).replace('%', '').replace('+', '')
+        change_str = str(mover.get('change_pct', '0')).translate(_PCT_STRIP)
         try:
             change = float(change_str)
         except ValueError:
@@ -1596,7 +1909,7 @@ class CatalystTrackerService:
         if fda_event:
             days = fda_event.get('days_until')
             cat_type = fda_event.get('catalyst_type', '')
-            status = (fda_event.get('status') or '').lower()
+            status_hits = set(_STATUS_RE.findall((fda_event.get('status') or '').lower()))
 
             if days is not None and days == 0:
                 reasons.append(f'{cat_type} decision TODAY')
@@ -1607,10 +1920,10 @@ class CatalystTrackerService:
             elif days is not None and days < 0 and days >= -3:
                 reasons.append(f'Post-{cat_type} reaction (was {abs(days)}d ago)')
                 reason_he.append(f'תגובה אחרי {cat_type} ({abs(days)} ימים)')
-            elif 'approved' in status:
+            elif 'approved' in status_hits:
                 reasons.append('FDA approval announced')
                 reason_he.append('אישור FDA פורסם')
-            elif 'crl' in status or 'rejected' in status:
+            elif status_hits:
                 reasons.append('CRL / Rejection')
                 reason_he.append('מכתב תגובה / דחייה')
             else:
@@ -1625,12 +1938,12 @@ class CatalystTrackerService:
             reasons.append('Major catalyst reaction')
             reason_he.append('תגובה משמעותית לאירוע')
 
-        industry = (mover.get('industry') or '').lower()
-        if 'biotech' in industry:
+        industry_hits = set(_INDUSTRY_RE.findall((mover.get('industry') or '').lower()))
+        if 'biotech' in industry_hits:
             if not fda_event:
                 reasons.append('Biotech — possible data readout or partnership')
                 reason_he.append('ביוטק — ייתכן נתונים קליניים או שיתוף פעולה')
-        elif 'drug' in industry or 'pharma' in industry:
+        elif industry_hits:
             if not fda_event:
                 reasons.append('Pharma — possible regulatory or earnings')
                 reason_he.append('פארמה — ייתכן רגולטורי או דוחות')
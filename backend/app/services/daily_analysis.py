@@ -15,53 +15,71 @@ Precise entry/stop/target levels derived from MA positions.
 
 import asyncio
 import math
-from concurrent.futures import ThreadPoolExecutor
+import os
+import pickle
+import re
+import tempfile
+import threading
+from collections import Counter
 from datetime import datetime
+from operator import itemgetter
 from typing import List, Dict, Optional, Tuple
 
 import aiohttp
+import numpy as np
+import pandas as pd
 import yfinance as yf
-from bs4 import BeautifulSoup
 
 
 # ── Moving Averages ────────────────────────────────────────────────────────────
 
-def _sma(prices: list, period: int) -> Optional[float]:
+def _sma_series(prices: np.ndarray, period: int) -> np.ndarray:
+    """Every full-window SMA in one pass: window sums are differences of a running cumsum."""
     if len(prices) < period:
+        return np.empty(0)
+    c = np.cumsum(np.insert(prices, 0, 0.0))
+    return (c[period:] - c[:-period]) / period
+
+
+def _ma_at(series: np.ndarray, bars_back: int = 0) -> Optional[float]:
+    """SMA value `bars_back` bars before the latest one, None if the series is too short."""
+    if len(series) <= bars_back:
         return None
-    return sum(prices[-period:]) / period
+    return float(series[-1 - bars_back])
+
+
+def _smooth(seed: float, values: np.ndarray, alpha: float) -> np.ndarray:
+    """Recursive smoothing s[i] = s[i-1] + (v[i] - s[i-1]) * alpha, seeded with `seed`.
+    The recurrence is sequential, so it runs over plain floats (no per-element boxing)."""
+    out = np.empty(len(values) + 1)
+    acc = out[0] = seed
+    for i, v in enumerate(values.tolist(), 1):
+        acc += (v - acc) * alpha
+        out[i] = acc
+    return out
 
 
-def _ema(prices: list, period: int) -> list:
+def _ema(prices: np.ndarray, period: int) -> np.ndarray:
+    """EMA seeded with the SMA of the first `period` bars (one value per bar from there)."""
     if len(prices) < period:
-        return []
-    mult = 2 / (period + 1)
-    result = [sum(prices[:period]) / period]
-    for p in prices[period:]:
-        result.append((p - result[-1]) * mult + result[-1])
-    return result
+        return np.empty(0)
+    return _smooth(float(prices[:period].mean()), prices[period:], 2 / (period + 1))
 
 
 # ── Trend Alignment (7 states) ─────────────────────────────────────────────────
 
-def _calc_trend(prices: list) -> Tuple[str, int, float]:
+def _calc_trend(n_bars: int, ma5: Optional[float], ma10: Optional[float], ma20: Optional[float],
+                ma5_5d: Optional[float], ma10_5d: Optional[float]) -> Tuple[str, int, float]:
     """
     Returns (trend_label_he, trend_score 0-30, ma_alignment_score).
-    7 states from ZhuLinsen repo.
+    7 states from ZhuLinsen repo. MAs come precomputed (ma*_5d = value 5 bars ago).
     """
-    if len(prices) < 20:
+    if n_bars < 20:
         return ('ניטרלי', 10, 0.0)
 
-    ma5  = _sma(prices, 5)
-    ma10 = _sma(prices, 10)
-    ma20 = _sma(prices, 20)
-    ma60 = _sma(prices, 60) if len(prices) >= 60 else None
-
     # Check if MAs are expanding (comparing gap now vs 5 days ago)
     expanding = False
-    if len(prices) >= 25:
-        ma5_5d  = _sma(prices[:-5], 5)
-        ma10_5d = _sma(prices[:-5], 10)
+    if n_bars >= 25:
         if ma5 and ma5_5d and ma10 and ma10_5d:
             gap_now = abs(ma5 - ma10)
             gap_5d  = abs(ma5_5d - ma10_5d)
@@ -130,16 +148,16 @@ def _calc_deviation(price: float, ma5: float, ma10: float, ma20: float) -> Tuple
 
 # ── Volume Pattern ─────────────────────────────────────────────────────────────
 
-def _calc_volume_pattern(closes: list, volumes: list) -> Tuple[str, int]:
+def _calc_volume_pattern(closes: np.ndarray, volumes: np.ndarray) -> Tuple[str, int, float]:
     """
     5 patterns from ZhuLinsen (adapted):
-    Returns (pattern_label_he, volume_score 0-15).
+    Returns (pattern_label_he, volume_score 0-15, vol_ratio vs 5-day avg).
     """
     if len(volumes) < 6 or len(closes) < 2:
-        return ('כמות נורמלית', 8)
+        return ('כמות נורמלית', 8, 1.0)
 
-    avg_vol_5d = sum(volumes[-6:-1]) / 5
-    curr_vol   = volumes[-1]
+    avg_vol_5d = float(volumes[-6:-1].mean())
+    curr_vol   = float(volumes[-1])
     vol_ratio  = curr_vol / avg_vol_5d if avg_vol_5d > 0 else 1.0
 
     price_up   = closes[-1] > closes[-2]
@@ -147,15 +165,16 @@ def _calc_volume_pattern(closes: list, volumes: list) -> Tuple[str, int]:
     heavy      = vol_ratio > 1.5
 
     if shrinking and not price_up:
-        return ('כמות מצטמצמת — ירידה בריאה', 15)   # Best: shrinking vol on pullback
+        label, score = 'כמות מצטמצמת — ירידה בריאה', 15   # Best: shrinking vol on pullback
     elif heavy and price_up:
-        return ('כמות כבדה — עלייה חזקה', 13)         # Good: heavy vol on rise
+        label, score = 'כמות כבדה — עלייה חזקה', 13         # Good: heavy vol on rise
     elif shrinking and price_up:
-        return ('כמות חלשה — עלייה צולעת', 6)         # Weak: shrinking vol on rise
+        label, score = 'כמות חלשה — עלייה צולעת', 6         # Weak: shrinking vol on rise
     elif heavy and not price_up:
-        return ('כמות כבדה — ירידה', 2)               # Bad: heavy vol on decline
+        label, score = 'כמות כבדה — ירידה', 2               # Bad: heavy vol on decline
     else:
-        return ('כמות נורמלית', 8)                     # Neutral
+        label, score = 'כמות נורמלית', 8                     # Neutral
+    return (label, score, vol_ratio)
 
 
 # ── MA Support Score ───────────────────────────────────────────────────────────
@@ -174,7 +193,7 @@ def _calc_ma_support(price: float, ma5: Optional[float], ma10: Optional[float],
 
 # ── MACD ───────────────────────────────────────────────────────────────────────
 
-def _calc_macd_score(prices: list) -> Tuple[str, int, dict]:
+def _calc_macd_score(prices: np.ndarray) -> Tuple[str, int, dict]:
     """
     Returns (label_he, score 0-15, raw_data).
     Golden cross above zero = 15pts.
@@ -185,19 +204,18 @@ def _calc_macd_score(prices: list) -> Tuple[str, int, dict]:
     ema12 = _ema(prices, 12)
     ema26 = _ema(prices, 26)
     offset = len(ema12) - len(ema26)
-    ema12a = ema12[offset:]
-    macd_line = [f - s for f, s in zip(ema12a, ema26)]
+    macd_line = ema12[offset:] - ema26
     if len(macd_line) < 12:
         return ('—', 8, {})
     signal_line = _ema(macd_line, 9)
-    if not signal_line:
+    if not len(signal_line):
         return ('—', 8, {})
 
-    dif = macd_line[-1]
-    dea = signal_line[-1]
+    dif = float(macd_line[-1])
+    dea = float(signal_line[-1])
     bar = (dif - dea) * 2
-    prev_dif = macd_line[-2] if len(macd_line) >= 2 else dif
-    prev_dea = signal_line[-2] if len(signal_line) >= 2 else dea
+    prev_dif = float(macd_line[-2]) if len(macd_line) >= 2 else dif
+    prev_dea = float(signal_line[-2]) if len(signal_line) >= 2 else dea
 
     golden_cross = (dif > dea) and (prev_dif <= prev_dea)
     dead_cross   = (dif < dea) and (prev_dif >= prev_dea)
@@ -222,32 +240,32 @@ def _calc_macd_score(prices: list) -> Tuple[str, int, dict]:
 
 # ── RSI (3 periods) ───────────────────────────────────────────────────────────
 
-def _calc_rsi_val(prices: list, period: int) -> Optional[float]:
-    if len(prices) < period + 1:
+def _calc_rsi_val(gains: np.ndarray, losses: np.ndarray, period: int) -> Optional[float]:
+    """RSI over the last period*3 bars, from per-bar gains/losses shared across periods."""
+    if len(gains) < period:
         return None
-    p = prices[-(period * 3):]
-    deltas = [p[i + 1] - p[i] for i in range(len(p) - 1)]
-    gains  = [max(d, 0.0) for d in deltas]
-    losses = [max(-d, 0.0) for d in deltas]
-    ag = sum(gains[:period]) / period
-    al = sum(losses[:period]) / period
-    for i in range(period, len(gains)):
-        ag = (ag * (period - 1) + gains[i]) / period
-        al = (al * (period - 1) + losses[i]) / period
+    gains  = gains[-(period * 3 - 1):]
+    losses = losses[-(period * 3 - 1):]
+    # Wilder smoothing: seed with the simple mean, then alpha = 1/period
+    ag = float(_smooth(float(gains[:period].mean()), gains[period:], 1 / period)[-1])
+    al = float(_smooth(float(losses[:period].mean()), losses[period:], 1 / period)[-1])
     if al == 0:
         return 100.0 if ag > 0 else 50.0
     return round(100 - (100 / (1 + ag / al)), 1)
 
 
-def _calc_rsi_score(prices: list) -> Tuple[str, int, dict]:
+def _calc_rsi_score(prices: np.ndarray) -> Tuple[str, int, dict]:
     """
     RSI-6 (short), RSI-12 (medium), RSI-24 (long).
     Primary driver: RSI-12.
     Returns (label_he, score 0-10, raw_data).
     """
-    r6  = _calc_rsi_val(prices, 6)
-    r12 = _calc_rsi_val(prices, 12)
-    r24 = _calc_rsi_val(prices, 24)
+    deltas = np.diff(prices)
+    gains  = np.maximum(deltas, 0.0)
+    losses = np.maximum(-deltas, 0.0)
+    r6  = _calc_rsi_val(gains, losses, 6)
+    r12 = _calc_rsi_val(gains, losses, 12)
+    r24 = _calc_rsi_val(gains, losses, 24)
     raw = {'rsi6': r6, 'rsi12': r12, 'rsi24': r24}
 
     if r12 is None:
@@ -324,25 +342,26 @@ def _classify_signal(score: int, is_chasing: bool) -> Tuple[str, str]:
 
 # ── Per-ticker sync calculation ────────────────────────────────────────────────
 
-def _analyze_ticker_sync(ticker: str) -> Optional[Dict]:
+def _analyze_ticker_from_df(ticker: str, hist) -> Optional[Dict]:
     try:
-        stock = yf.Ticker(ticker)
-        hist = stock.history(period='90d', interval='1d', timeout=5)
         if hist is None or len(hist) < 22:
             return None
 
-        closes  = list(hist['Close'])
-        volumes = list(hist['Volume'])
-        price   = closes[-1]
-        change_pct = round((closes[-1] - closes[-2]) / closes[-2] * 100, 2) if len(closes) >= 2 else 0.0
+        closes  = hist['Close'].to_numpy(dtype=np.float64)
+        volumes = hist['Volume'].to_numpy(dtype=np.float64)
+        price   = float(closes[-1])
+        change_pct = round((price - float(closes[-2])) / float(closes[-2]) * 100, 2) if len(closes) >= 2 else 0.0
 
-        ma5  = _sma(closes, 5)
-        ma10 = _sma(closes, 10)
-        ma20 = _sma(closes, 20)
-        ma60 = _sma(closes, 60) if len(closes) >= 60 else None
+        ma5_s  = _sma_series(closes, 5)
+        ma10_s = _sma_series(closes, 10)
+        ma5  = _ma_at(ma5_s)
+        ma10 = _ma_at(ma10_s)
+        ma20 = _ma_at(_sma_series(closes, 20))
+        ma60 = _ma_at(_sma_series(closes, 60))
 
         # 1. Trend (30pts)
-        trend_label, trend_score, _ = _calc_trend(closes)
+        trend_label, trend_score, _ = _calc_trend(
+            len(closes), ma5, ma10, ma20, _ma_at(ma5_s, 5), _ma_at(ma10_s, 5))
 
         # 2. Deviation / anti-FOMO (20pts)
         dev_pct, dev_score, is_chasing = _calc_deviation(
@@ -353,7 +372,7 @@ def _analyze_ticker_sync(ticker: str) -> Optional[Dict]:
         )
 
         # 3. Volume pattern (15pts)
-        vol_label, vol_score = _calc_volume_pattern(closes, volumes)
+        vol_label, vol_score, vol_ratio = _calc_volume_pattern(closes, volumes)
 
         # 4. MA Support (10pts)
         ma_support_score = _calc_ma_support(price, ma5, ma10, ma20)
@@ -373,10 +392,6 @@ def _analyze_ticker_sync(ticker: str) -> Optional[Dict]:
         # Levels
         levels = _calc_levels(price, ma5, ma10, ma20, trend_label)
 
-        # Volume ratio for display
-        avg_vol_5d = sum(volumes[-6:-1]) / 5 if len(volumes) >= 6 else 0
-        vol_ratio  = round(volumes[-1] / avg_vol_5d, 2) if avg_vol_5d > 0 else 1.0
-
         return {
             'ticker':       ticker,
             'sector':       _SECTOR_MAP.get(ticker, ''),
@@ -391,7 +406,7 @@ def _analyze_ticker_sync(ticker: str) -> Optional[Dict]:
             'deviation':    dev_pct,       # % from MA5
             'is_chasing':   is_chasing,
             'vol_pattern':  vol_label,
-            'vol_ratio':    vol_ratio,
+            'vol_ratio':    round(vol_ratio, 2),
             'macd_label':   macd_label,
             'macd':         macd_raw,
             'rsi':          rsi_raw,
@@ -413,6 +428,143 @@ def _analyze_ticker_sync(ticker: str) -> Optional[Dict]:
         return None
 
 
+# 90-day daily bars per ticker, persisted under data/ so a cold start only fetches the tail.
+# A ticker whose last cached bar is recent re-downloads just the last 5 sessions (today's
+# bar is still moving) and splices them in; anything older or new gets the full 90 days,
+# as does a ticker whose overlapping bars no longer match (split/dividend re-adjustment).
+# Scans run on executor threads and can overlap (the route stops waiting on a slow one
+# without cancelling it), so loading, mutating and saving the cache hold _HIST_LOCK.
+_HIST_FILE = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "data", "daily_analysis_bars.pkl")
+)
+_HIST_CACHE: Dict[str, pd.DataFrame] = {}
+_HIST_LOADED = False
+_HIST_LOCK = threading.Lock()
+
+
+def _read_history_file() -> Dict[str, pd.DataFrame]:
+    try:
+        if os.path.exists(_HIST_FILE):
+            with open(_HIST_FILE, 'rb') as f:
+                return pickle.load(f)
+    except Exception as e:
+        print(f"DailyAnalysis: bar cache load failed: {e}")
+    return {}
+
+
+def _write_history_file():
+    tmp = None
+    try:
+        hist_dir = os.path.dirname(_HIST_FILE)
+        os.makedirs(hist_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            'wb', dir=hist_dir, prefix=os.path.basename(_HIST_FILE) + '.', suffix='.tmp', delete=False
+        ) as f:
+            tmp = f.name
+            pickle.dump(_HIST_CACHE, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, _HIST_FILE)
+    except Exception as e:
+        print(f"DailyAnalysis: bar cache save failed: {e}")
+        if tmp and os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _download_history(tickers: List[str], period: str) -> Dict[str, pd.DataFrame]:
+    """One batched yfinance download, split into per-ticker frames."""
+    data = yf.download(
+        tickers=tickers,
+        period=period,
+        interval='1d',
+        group_by='ticker',
+        progress=False,
+        auto_adjust=True,
+        threads=True,
+        timeout=10,
+    )
+    if data is None or data.empty:
+        return {}
+
+    multi = getattr(data.columns, 'nlevels', 1) > 1
+    frames = {}
+    for ticker in tickers:
+        try:
+            hist = data[ticker] if multi else data
+        except KeyError:
+            continue
+        hist = hist.dropna(subset=['Close'])
+        if len(hist):
+            if hist.index.tz is not None:
+                hist.index = hist.index.tz_localize(None)
+            frames[ticker] = hist
+    return frames
+
+
+def _same_adjustment(old: pd.DataFrame, tail: pd.DataFrame) -> bool:
+    """True when the fresh tail's completed bars match the cached closes. auto_adjust
+    rescales the whole history after a split or dividend, so a mismatch means the cached
+    bars are on a different price scale and the ticker must be refetched in full."""
+    done = tail.iloc[:-1]  # the last bar may be today's, still moving
+    common = done.index.intersection(old.index)
+    if not len(common):
+        return False
+    fresh = done.loc[common, 'Close'].to_numpy(dtype=float)
+    cached = old.loc[common, 'Close'].to_numpy(dtype=float)
+    return bool(np.allclose(fresh, cached, rtol=5e-4, atol=0.0))
+
+
+def _load_history(tickers: List[str]) -> Dict[str, pd.DataFrame]:
+    with _HIST_LOCK:
+        return _load_history_locked(tickers)
+
+
+def _load_history_locked(tickers: List[str]) -> Dict[str, pd.DataFrame]:
+    global _HIST_LOADED
+    if not _HIST_LOADED:
+        _HIST_CACHE.update(_read_history_file())
+        _HIST_LOADED = True
+
+    today = pd.Timestamp.now().normalize()
+    recent = [t for t in tickers
+              if t in _HIST_CACHE and _HIST_CACHE[t].index[-1] >= today - pd.Timedelta(days=4)]
+    recent_set = set(recent)
+    full = [t for t in tickers if t not in recent_set]
+
+    if recent:
+        for ticker, tail in _download_history(recent, '5d').items():
+            old = _HIST_CACHE[ticker]
+            if _same_adjustment(old, tail):
+                _HIST_CACHE[ticker] = pd.concat([old[old.index < tail.index[0]], tail])
+            else:
+                full.append(ticker)
+    if full:
+        _HIST_CACHE.update(_download_history(full, '90d'))
+
+    # Same 90-calendar-day window a fresh period='90d' download returns
+    cutoff = today - pd.Timedelta(days=90)
+    for ticker in tickers:
+        hist = _HIST_CACHE.get(ticker)
+        if hist is not None and hist.index[0] < cutoff:
+            _HIST_CACHE[ticker] = hist[hist.index >= cutoff]
+    # Drop tickers nothing has refreshed within the window (no longer screened), so the
+    # pickle doesn't grow with every past screener hit — by age, not by this scan's
+    # universe, so a fallback-list scan doesn't throw away the regular tickers' bars
+    for ticker in [t for t, hist in _HIST_CACHE.items() if hist.index[-1] < cutoff]:
+        del _HIST_CACHE[ticker]
+    _write_history_file()
+
+    return {t: _HIST_CACHE[t] for t in tickers if t in _HIST_CACHE}
+
+
+def _analyze_batch_sync(tickers: List[str]) -> List[Dict]:
+    """Batched (day-cached) 90-day history for every ticker, then per-ticker scoring."""
+    results = []
+    for ticker, hist in _load_history(tickers).items():
+        r = _analyze_ticker_from_df(ticker, hist)
+        if r:
+            results.append(r)
+    return results
+
+
 # ── Sector map ────────────────────────────────────────────────────────────────
 
 _SECTOR_MAP: dict = {
@@ -464,7 +616,7 @@ _SECTOR_MAP: dict = {
 
 # ── Ticker universe (reuse tech_signals logic) ────────────────────────────────
 
-_FALLBACK_TICKERS = [
+_FALLBACK_TICKERS: Tuple[str, ...] = (
     'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'META', 'NVDA', 'TSLA', 'AMD',
     'NFLX', 'CRM', 'ORCL', 'ADBE', 'SHOP', 'SNOW', 'DDOG', 'NET',
     'MDB', 'ZS', 'PANW', 'CRWD', 'AFRM', 'COIN', 'HOOD', 'RBLX',
@@ -476,7 +628,12 @@ _FALLBACK_TICKERS = [
     # Biotech
     'MRNA', 'BNTX', 'REGN', 'BIIB', 'VRTX', 'GILD', 'ALNY', 'BMRN',
     'INCY', 'ILMN', 'EXAS', 'RXRX', 'EXEL', 'RARE', 'IONS', 'FOLD',
-]
+)
+
+
+# Ticker text of each <a class="screener-link-primary"> in the Finviz screener table
+_SCREENER_LINK_RE = re.compile(
+    rb'<a\b[^>]*\bclass="[^"]*\bscreener-link-primary\b[^"]*"[^>]*>\s*([^<]*?)\s*</a>')
 
 
 async def _get_liquid_tickers(session: aiohttp.ClientSession) -> List[str]:
@@ -486,30 +643,24 @@ async def _get_liquid_tickers(session: aiohttp.ClientSession) -> List[str]:
         '&o=-volume'
     )
     headers = {'User-Agent': 'Mozilla/5.0 (compatible; StockScanner/1.0)'}
-    tickers = []
+    seen, result = set(), []
     try:
-        async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=12)) as resp:
+        async with session.get(url, headers=headers) as resp:
             if resp.status != 200:
                 raise Exception(f"HTTP {resp.status}")
-            html = await resp.text()
-        soup = BeautifulSoup(html, 'html.parser')
-        for a in soup.select('a.screener-link-primary'):
-            t = a.text.strip()
-            if t and t.isupper() and 1 <= len(t) <= 5:
-                tickers.append(t)
+            html = await resp.read()
+        for m in _SCREENER_LINK_RE.finditer(html):
+            t = m.group(1).decode('ascii', 'ignore')
+            if t and t.isupper() and 1 <= len(t) <= 5 and t not in seen:
+                seen.add(t)
+                result.append(t)
+                if len(result) >= 100:
+                    break
     except Exception as e:
         print(f"DailyAnalysis: Finviz fetch failed: {e}")
 
-    seen, result = set(), []
-    for t in tickers:
-        if t not in seen:
-            seen.add(t)
-            result.append(t)
-        if len(result) >= 100:
-            break
-
     if len(result) < 20:
-        result = _FALLBACK_TICKERS[:]
+        result = list(_FALLBACK_TICKERS)
 
     return result
 
@@ -524,38 +675,28 @@ class DailyAnalysisService:
         MA trend + deviation (anti-FOMO) + volume + MACD + RSI.
         Returns stocks sorted by score descending.
         """
-        async with aiohttp.ClientSession() as session:
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=12)) as session:
             tickers = await _get_liquid_tickers(session)
 
         print(f"DailyAnalysis: scanning {len(tickers)} tickers...")
 
-        sem      = asyncio.Semaphore(4)
-        loop     = asyncio.get_event_loop()
-        executor = ThreadPoolExecutor(max_workers=5)
-
-        async def process_one(ticker: str) -> Optional[Dict]:
-            async with sem:
-                try:
-                    return await asyncio.wait_for(
-                        loop.run_in_executor(executor, _analyze_ticker_sync, ticker),
-                        timeout=12
-                    )
-                except Exception:
-                    return None
-
-        tasks   = [process_one(t) for t in tickers]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        executor.shutdown(wait=False)
+        loop = asyncio.get_event_loop()
+        try:
+            # yf.download bounds each HTTP call (timeout=10); the route caps the whole scan
+            valid = await loop.run_in_executor(None, _analyze_batch_sync, tickers)
+        except Exception as e:
+            print(f"DailyAnalysis: batch download failed: {e}")
+            valid = []
 
-        valid = [r for r in results if isinstance(r, dict)]
-        valid.sort(key=lambda x: x['score'], reverse=True)
+        valid.sort(key=itemgetter('score'), reverse=True)
 
         print(f"DailyAnalysis: {len(valid)} stocks analyzed")
 
         # Summary stats
-        strong_buy = sum(1 for s in valid if s['signal'] == 'STRONG BUY')
-        buy        = sum(1 for s in valid if s['signal'] == 'BUY')
-        sell       = sum(1 for s in valid if s['signal'] == 'SELL')
+        signals    = Counter(s['signal'] for s in valid)
+        strong_buy = signals['STRONG BUY']
+        buy        = signals['BUY']
+        sell       = signals['SELL']
 
         return {
             'stocks':       valid,
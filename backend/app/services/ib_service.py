@@ -1,20 +1,26 @@
 """
 Interactive Brokers integration via ib_insync.
 
-Architecture: each data-fetch creates a short-lived IB connection in a
-plain daemon thread (no asyncio complications). The main IBService object
-tracks connection status and credentials.
+Architecture: the persistent connection (clientId=20) lives on a single
+dedicated "ib-main" thread that owns its event loop; data fetches run there
+against that connection. If it is down or a call fails, the fetch falls back
+to a short-lived IB connection in a plain daemon thread. The main IBService
+object tracks connection status and credentials.
 """
 
+import asyncio
 import logging
 import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
 import itertools
 import time
 import json
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 
+import yfinance as yf
+
 log = logging.getLogger(__name__)
 
 # ── IB Gateway kill-switch ─────────────────────────────────────────────
@@ -39,23 +45,22 @@ def _next_client_id() -> int:
     return 21 + (cid - 21) % 78
 
 
+# Short-lived fallback connections run here: 4 slots for background polling (the
+# semaphore below) plus headroom so user-initiated order calls are never starved
+_IB_FRESH = ThreadPoolExecutor(max_workers=6, thread_name_prefix="ib-fetch")
+
+
 def _run_in_ib_thread(fn, timeout=12, priority=False):
     """
-    Run fn(ib: IB) in a fresh daemon thread with its own IB connection.
+    Run fn(ib: IB) on a pooled worker thread with its own IB connection.
     priority=True bypasses semaphore (for user-initiated order operations).
     Returns the result or None on timeout/error.
     """
-    result_holder = [None]
-    error_holder = [None]
-    done = threading.Event()
-
     def _worker():
-        import asyncio
         if not priority:
             if not _ib_semaphore.acquire(timeout=timeout - 1):
                 log.warning("[IB] semaphore timeout — too many concurrent connections")
-                done.set()
-                return
+                return None
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         ib = _ib.IB()
@@ -74,33 +79,30 @@ def _run_in_ib_thread(fn, timeout=12, priority=False):
             ib.disconnect = _real_disc
 
             if ib.client.isConnected():
-                result_holder[0] = fn(ib)
-            else:
-                error_holder[0] = Exception("IB connection not alive after connect")
+                return fn(ib)
+            raise Exception("IB connection not alive after connect")
         except Exception as e:
-            error_holder[0] = e
             log.error(f"[IB thread] error: {e}")
+            raise
         finally:
             try:
                 ib.disconnect()
             except Exception:
                 pass
             loop.close()
+            asyncio.set_event_loop(None)
             if not priority:
                 _ib_semaphore.release()
-            done.set()
 
-    t = threading.Thread(target=_worker, daemon=True, name="ib-fetch")
-    t.start()
-    done.wait(timeout=timeout)
-    if error_holder[0]:
-        log.warning(f"[IB] fetch failed: {error_holder[0]}")
-    return result_holder[0]
+    try:
+        return _IB_FRESH.submit(_worker).result(timeout=timeout)
+    except Exception as e:
+        log.warning(f"[IB] fetch failed: {e!r}")
+        return None
 
 
 def _ensure_event_loop():
     """Ensure current thread has an event loop (needed for ib_insync operations)."""
-    import asyncio
     try:
         asyncio.get_event_loop()
     except RuntimeError:
@@ -108,6 +110,31 @@ def _ensure_event_loop():
         asyncio.set_event_loop(loop)
 
 
+class _PersistentDown(Exception):
+    """Persistent connection found dead before the call ran (safe to retry elsewhere)."""
+
+
+# Single thread that owns the persistent IB connection and its event loop —
+# ib_insync is not thread-safe, so every call on that connection goes through here
+_IB_MAIN = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ib-main",
+                              initializer=_ensure_event_loop)
+
+
+def _close_ib(ib):
+    """Disconnect ib and force-close its socket if disconnect didn't. Run on ib-main."""
+    try:
+        ib.disconnect()
+    except Exception:
+        pass
+    try:
+        if hasattr(ib, 'client') and ib.client:
+            sock = getattr(ib.client, '_socket', None)
+            if sock:
+                sock.close()
+    except Exception:
+        pass
+
+
 class IBService:
     def __init__(self):
         self._connected = False
@@ -117,14 +144,27 @@ class IBService:
         self._port = 4002
         self._lock = threading.Lock()
         self._ib: Optional[_ib.IB] = None
+        # Bounded pool for the blocking IB / yfinance work behind the async getters —
+        # one slot per read endpoint plus headroom for order placement / cancels
+        self._pool = ThreadPoolExecutor(max_workers=6, thread_name_prefix="ib")
         # Cache to avoid creating a new IB connection on every auto-refresh
-        self._positions_cache: List[Dict] = []
-        self._positions_cache_time: float = 0
-        self._account_cache: Dict = {}
-        self._account_cache_time: float = 0
-        self._orders_cache: List[Dict] = []
-        self._orders_cache_time: float = 0
-        self._CACHE_TTL = 20  # seconds
+        # Cached results are published as immutable (monotonic time, data) snapshots:
+        # a single attribute assignment, so readers never see a new list with an old time.
+        self._positions_snapshot: Tuple[float, List[Dict]] = (0.0, [])
+        self._account_snapshot: Tuple[float, Dict] = (0.0, {})
+        self._orders_snapshot: Tuple[float, List[Dict]] = (0.0, [])
+        self._execs_snapshot: Tuple[float, int, List[Dict]] = (0.0, 0, [])  # (time, days, fills)
+        # Cache TTLs (seconds) per endpoint, matched to how fast the data moves
+        self._TTL = {"positions": 5, "account": 15, "orders": 3, "executions": 60}
+        # yfinance quotes for held symbols: sym -> (last, prev_close, monotonic time)
+        self._price_cache: Dict[str, tuple] = {}
+        self._PRICE_TTL = 10  # seconds
+        # In-flight refreshes per endpoint — concurrent callers await the same task
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Background task keeping positions/account warm while connected and being read
+        self._refresh_task = None
+        self._last_read: Dict[str, float] = {"positions": 0.0, "account": 0.0}
+        self._REFRESH_IDLE = 60  # seconds without a read before the loop stops refreshing
         # Disconnect tracking
         self._disconnect_time: Optional[float] = None  # epoch when disconnect was first detected
         self._last_heartbeat_ok: float = 0
@@ -181,14 +221,11 @@ class IBService:
     # ── helpers ──────────────────────────────────────────────────────────
 
     def _make_persistent(self, host, port, client_id):
-        """Create/replace the persistent IB connection (clientId=20)."""
-        done = threading.Event()
+        """Create/replace the persistent IB connection (clientId=20) on the ib-main thread,
+        whose event loop stays alive so later fetches can reuse the connection."""
         result = [None]
 
         def _run():
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
             try:
                 ib = _ib.IB()
                 ib.RequestTimeout = 2
@@ -235,17 +272,79 @@ class IBService:
                         pass
             except Exception as e:
                 log.error(f"[IB connect] {e}")
-            finally:
-                loop.close()
-                done.set()
-
-        t = threading.Thread(target=_run, daemon=True, name="ib-connect")
-        t.start()
-        done.wait(timeout=20)
-        if not done.is_set():
+
+        fut = _IB_MAIN.submit(_run)
+        try:
+            fut.result(timeout=20)
+        except Exception:
             log.warning("[IB connect] thread timed out")
+            if not fut.cancel():
+                # Already running — if it connects after all, nobody adopts that
+                # connection; close it so clientId stays free for the next attempt
+                def _drop_orphan(_f):
+                    if result[0] is not None:
+                        log.warning("[IB connect] late connection after timeout — closing it")
+                        _IB_MAIN.submit(_close_ib, result[0][0])
+                fut.add_done_callback(_drop_orphan)
+            return None
         return result[0]
 
+    def _invalidate(self, *endpoints: str):
+        """Mark cached snapshots stale (keeping the data as a fallback) so the next read refetches."""
+        for ep in endpoints:
+            attr = "_execs_snapshot" if ep == "executions" else f"_{ep}_snapshot"
+            snap = getattr(self, attr)
+            setattr(self, attr, (0.0,) + snap[1:])
+
+    def _single_flight(self, key: str, make_coro):
+        """Return the running task for key, or start one — concurrent refreshes of the
+        same endpoint share a single IB round-trip. Await it via asyncio.shield so one
+        caller's cancellation doesn't abort the fetch for the others."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(make_coro())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(key, None))
+        return task
+
+    def _call_ib(self, fn, timeout=12, priority=False):
+        """
+        Run fn(ib: IB) on the persistent connection (ib-main thread). Falls back to a
+        fresh short-lived connection if it is down; reads also fall back when the call
+        errors or times out. priority (order) calls never do — fn may already have run.
+        """
+        ib = self._ib
+        if ib is not None and self._connected:
+            def _on_persistent():
+                if not ib.client.isConnected():
+                    raise _PersistentDown()
+                return fn(ib)
+            fut = _IB_MAIN.submit(_on_persistent)
+            try:
+                return fut.result(timeout=timeout)
+            except FuturesTimeout:
+                if fut.cancel():
+                    # Never started (ib-main busy) — safe to run it on a fresh connection
+                    log.warning("[IB] persistent call queued too long — using fresh connection")
+                else:
+                    # Still running on ib-main: the connection is wedged. Stop routing work
+                    # to it, and don't retry orders — fn may yet complete there.
+                    log.warning("[IB] persistent call timed out mid-flight — marking connection unhealthy")
+                    with self._lock:
+                        self._connected = False
+                        if self._disconnect_time is None:
+                            self._disconnect_time = time.time()
+                    if priority:
+                        return None
+            except _PersistentDown:
+                log.warning("[IB] persistent connection not alive — using fresh connection")
+            except Exception as e:
+                if priority:
+                    log.warning(f"[IB] persistent order call failed: {e!r}")
+                    return None
+                log.warning(f"[IB] persistent call failed ({e!r}) — using fresh connection")
+        return _run_in_ib_thread(fn, timeout=timeout, priority=priority)
+
     # ── Connection ────────────────────────────────────────────────────────
 
     def is_connected(self) -> bool:
@@ -304,18 +403,11 @@ class IBService:
             if was_connected and self._disconnect_time is None:
                 self._disconnect_time = time.time()
         if old_ib:
+            # The connection's event loop lives on ib-main — close it there, not from here
             try:
-                old_ib.disconnect()
-            except Exception:
-                pass
-            # Force-close the underlying socket if disconnect didn't work
-            try:
-                if hasattr(old_ib, 'client') and old_ib.client:
-                    sock = getattr(old_ib.client, '_socket', None)
-                    if sock:
-                        sock.close()
-            except Exception:
-                pass
+                _IB_MAIN.submit(_close_ib, old_ib).result(timeout=5)
+            except FuturesTimeout:
+                log.warning("[IB] ib-main busy — disconnect queued behind the running call")
 
     async def connect(self, host="127.0.0.1", port=4002, client_id=20) -> Dict:
         if IB_DISABLED:
@@ -323,13 +415,12 @@ class IBService:
         if not _IB_AVAILABLE:
             return {"connected": False, "error": "ib_insync לא מותקן"}
 
+        loop = asyncio.get_running_loop()
         # Disconnect stale connection first — frees clientId
-        self._force_disconnect()
+        await loop.run_in_executor(self._pool, self._force_disconnect)
 
-        import asyncio
-        loop = asyncio.get_running_loop()
         result = await loop.run_in_executor(
-            None, lambda: self._make_persistent(host, port, client_id)
+            self._pool, lambda: self._make_persistent(host, port, client_id)
         )
         if result is None:
             return {"connected": False, "error": "חיבור נכשל (timeout)"}
@@ -346,29 +437,63 @@ class IBService:
             self._ever_connected = True
             self._disconnect_time = None
             self._last_heartbeat_ok = time.time()
+        self._stop_refresh()
+        self._refresh_task = asyncio.create_task(self._refresh_loop())
         return {"connected": True, "account": self._account, "host": host, "port": port}
 
     async def disconnect(self) -> Dict:
-        self._force_disconnect()
+        self._stop_refresh()
+        await asyncio.get_running_loop().run_in_executor(self._pool, self._force_disconnect)
         return {"disconnected": True}
 
+    def _stop_refresh(self):
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+    async def _refresh_loop(self):
+        """
+        Refresh positions (and account summary, once it is about to expire) one second
+        before their TTL runs out, so API reads are served from a warm cache instead of
+        waiting on IB. An endpoint nobody has read for _REFRESH_IDLE seconds is left to
+        expire — the next read fetches on demand and re-arms the refresh.
+        Exits when the connection drops; connect() starts a new one.
+        """
+        interval = self._TTL["positions"] - 1
+        while self.is_connected():
+            now = time.monotonic()
+            jobs = []
+            if now - self._last_read["positions"] < self._REFRESH_IDLE:
+                jobs.append(self.get_positions(refresh=True))
+            if (now - self._last_read["account"] < self._REFRESH_IDLE
+                    and now - self._account_snapshot[0] >= self._TTL["account"] - 1 - interval):
+                jobs.append(self.get_account_summary(refresh=True))
+            results = await asyncio.gather(*jobs, return_exceptions=True)
+            for r in results:
+                if isinstance(r, Exception):
+                    log.warning(f"[IB refresh] {r!r}")
+            await asyncio.sleep(interval)
+
     # ── Account Summary ───────────────────────────────────────────────────
 
-    async def get_account_summary(self) -> Dict:
+    async def get_account_summary(self, refresh: bool = False) -> Dict:
+        if not refresh:
+            self._last_read["account"] = time.monotonic()
         if not self.is_connected():
-            if self._account_cache:
-                return self._account_cache
+            if self._account_snapshot[1]:
+                return self._account_snapshot[1]
             return {"error": "לא מחובר ל-IB"}
 
         # Serve from cache if fresh
-        if time.time() - self._account_cache_time < self._CACHE_TTL and self._account_cache:
-            return self._account_cache
+        cached_at, cached = self._account_snapshot
+        if not refresh and cached and time.monotonic() - cached_at < self._TTL["account"]:
+            return cached
 
         account = self._account
 
         def _fetch(ib: "_ib.IB"):
-            ib.reqAccountUpdates(True)
-            ib.sleep(2)
+            # Blocks until IB sends accountDownloadEnd — no fixed sleep needed
+            ib.reqAccountUpdates(account)
             vals = {}
             for v in ib.accountValues():
                 if v.currency == "USD" and v.tag in (
@@ -388,40 +513,45 @@ class IBService:
                 "account": account,
             }
 
-        import asyncio
-        loop = asyncio.get_running_loop()
-        result = await loop.run_in_executor(None, lambda: _run_in_ib_thread(_fetch, timeout=15))
-        if result:
-            self._account_cache = result
-            self._account_cache_time = time.time()
-        return result or self._account_cache or {"error": "timeout"}
+        async def _load():
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._pool, lambda: self._call_ib(_fetch, timeout=15))
+            if result:
+                self._account_snapshot = (time.monotonic(), result)
+            return result or self._account_snapshot[1] or {"error": "timeout"}
+
+        return await asyncio.shield(self._single_flight("account", _load))
 
     # ── Positions ─────────────────────────────────────────────────────────
 
-    async def get_positions(self) -> List[Dict]:
+    async def get_positions(self, refresh: bool = False, top: Optional[int] = None) -> List[Dict]:
+        """Positions sorted by |market value|; top limits the result to the N largest."""
+        if not refresh:
+            self._last_read["positions"] = time.monotonic()
+        positions = await self._get_positions(refresh)
+        # The snapshot is sorted once per refresh, so the top N is just its head
+        return positions[:top] if top else positions
+
+    async def _get_positions(self, refresh: bool) -> List[Dict]:
         if not self.is_connected():
             # Return stale cache if available (keeps UI populated during disconnect)
-            if self._positions_cache:
-                return self._positions_cache
-            return []
+            return self._positions_snapshot[1]
 
         # Serve from cache if fresh (avoid new IB connection on every refresh)
-        if time.time() - self._positions_cache_time < self._CACHE_TTL and self._positions_cache:
-            return self._positions_cache
+        cached_at, cached = self._positions_snapshot
+        if not refresh and cached and time.monotonic() - cached_at < self._TTL["positions"]:
+            return cached
 
         def _fetch_raw(ib: "_ib.IB"):
             """Get raw positions from IB."""
-            ib.reqPositions()
-            ib.sleep(3)
+            ib.reqPositions()  # returns once positionEnd arrives
             raw = ib.positions()
-            log.info(f"[IB] got {len(raw)} positions")
+            log.debug(f"[IB] got {len(raw)} positions")
             return [(pos.contract.symbol, pos.contract.currency, pos.position, pos.avgCost, pos.account)
                     for pos in raw if pos.position != 0]
 
-        def _enrich_with_yfinance(raw_positions):
-            """Fetch yfinance prices outside IB thread — doesn't hold semaphore."""
-            import yfinance as yf
-            tickers_needed = [sym for sym, *_ in raw_positions]
+        def _fetch_prices(tickers_needed):
+            """Download last price / previous close via yfinance and store them in _price_cache."""
             yf_prices: Dict[str, float] = {}
             yf_prev_close: Dict[str, float] = {}
 
@@ -453,7 +583,7 @@ class IBService:
                         group_by="ticker", prepost=True,
                     )
                     if data is not None and not data.empty:
-                        log.info(f"[IB] yfinance columns: {data.columns.tolist()[:6]}, nlevels={data.columns.nlevels}")
+                        log.debug(f"[IB] yfinance columns: {data.columns.tolist()[:6]}, nlevels={data.columns.nlevels}")
                         for tk in tickers_needed:
                             try:
                                 close_col = _extract_close(data, tk, len(tickers_needed))
@@ -492,11 +622,44 @@ class IBService:
                                 prev = cs[cs.index.date < today]
                                 if not prev.empty:
                                     yf_prev_close[tk] = float(prev.iloc[-1])
-                                log.info(f"[IB] yfinance fallback OK for {tk}: {yf_prices[tk]}")
+                                log.debug(f"[IB] yfinance fallback OK for {tk}: {yf_prices[tk]}")
                     except Exception as e:
                         log.warning(f"[IB] yfinance fallback failed for {tk}: {e}")
 
-                log.info(f"[IB] yfinance prices: {yf_prices}")
+                log.debug(f"[IB] yfinance prices: {yf_prices}")
+                fetched_at = time.monotonic()
+                for tk in tickers_needed:
+                    if tk in yf_prices:
+                        self._price_cache[tk] = (yf_prices[tk], yf_prev_close.get(tk, 0.0), fetched_at)
+
+            return yf_prices, yf_prev_close
+
+        def _prefetch_prices(symbols):
+            """Warm _price_cache for the symbols we expect to hold (runs alongside the IB fetch)."""
+            now = time.monotonic()
+            stale = [sym for sym in symbols
+                     if not (sym in self._price_cache and now - self._price_cache[sym][2] < self._PRICE_TTL)]
+            if stale:
+                _fetch_prices(stale)
+
+        def _enrich_with_yfinance(raw_positions):
+            """Fetch yfinance prices outside IB thread — doesn't hold semaphore."""
+            yf_prices: Dict[str, float] = {}
+            yf_prev_close: Dict[str, float] = {}
+            # Reuse quotes fetched within _PRICE_TTL; only download the stale symbols
+            now = time.monotonic()
+            tickers_needed = []
+            for sym, *_ in raw_positions:
+                cached = self._price_cache.get(sym)
+                if cached and now - cached[2] < self._PRICE_TTL:
+                    yf_prices[sym] = cached[0]
+                    if cached[1]:
+                        yf_prev_close[sym] = cached[1]
+                else:
+                    tickers_needed.append(sym)
+            fetched, fetched_prev = _fetch_prices(tickers_needed)
+            yf_prices.update(fetched)
+            yf_prev_close.update(fetched_prev)
 
             result = []
             for sym, currency, qty, avg, acct in raw_positions:
@@ -516,29 +679,37 @@ class IBService:
                 })
             return sorted(result, key=lambda x: abs(x.get("market_value") or 0), reverse=True)
 
-        import asyncio
-        loop = asyncio.get_running_loop()
-        # Step 1: get raw positions from IB
-        raw = await loop.run_in_executor(None, lambda: _run_in_ib_thread(_fetch_raw, timeout=12))
-        if raw is None:
-            return self._positions_cache
-        # Step 2: enrich with yfinance (no semaphore, separate thread)
-        result = await loop.run_in_executor(None, lambda: _enrich_with_yfinance(raw))
-        if result is not None:
-            self._positions_cache = result
-            self._positions_cache_time = time.time()
-        return result if result is not None else self._positions_cache
+        async def _load():
+            loop = asyncio.get_running_loop()
+            # Quote the symbols we held last time while IB is still answering reqPositions
+            predicted = [p["ticker"] for p in self._positions_snapshot[1]]
+            prefetch = loop.run_in_executor(self._pool, _prefetch_prices, predicted) if predicted else None
+            # Step 1: get raw positions from IB
+            raw = await loop.run_in_executor(self._pool, lambda: self._call_ib(_fetch_raw, timeout=12))
+            if prefetch is not None:
+                await prefetch
+            if raw is None:
+                return self._positions_snapshot[1]
+            # Step 2: enrich with yfinance — only symbols not covered by the prefetch are downloaded
+            result = await loop.run_in_executor(self._pool, _enrich_with_yfinance, raw)
+            if result is None:
+                return self._positions_snapshot[1]
+            self._positions_snapshot = (time.monotonic(), result)
+            return result
+
+        return await asyncio.shield(self._single_flight("positions", _load))
 
     # ── Open Orders ───────────────────────────────────────────────────────
 
     async def get_open_orders(self) -> List[Dict]:
         if not self.is_connected():
-            if self._orders_cache:
-                return self._orders_cache
+            if self._orders_snapshot[1]:
+                return self._orders_snapshot[1]
             return []
 
-        if time.time() - self._orders_cache_time < self._CACHE_TTL:
-            return self._orders_cache
+        cached_at, cached = self._orders_snapshot
+        if time.monotonic() - cached_at < self._TTL["orders"]:
+            return cached
 
         def _fetch(ib: "_ib.IB"):
             trades = ib.reqAllOpenOrders()
@@ -569,13 +740,15 @@ class IBService:
                 })
             return result
 
-        import asyncio
-        loop = asyncio.get_running_loop()
-        result = await loop.run_in_executor(None, lambda: _run_in_ib_thread(_fetch, timeout=12))
-        if result is not None:
-            self._orders_cache = result
-            self._orders_cache_time = time.time()
-        return result if result is not None else self._orders_cache
+        async def _load():
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._pool, lambda: self._call_ib(_fetch, timeout=12))
+            if result is None:
+                return self._orders_snapshot[1]
+            self._orders_snapshot = (time.monotonic(), result)
+            return result
+
+        return await asyncio.shield(self._single_flight("orders", _load))
 
     # ── Executions ────────────────────────────────────────────────────────
 
@@ -583,6 +756,10 @@ class IBService:
         if not self.is_connected():
             return []
 
+        cached_at, cached_days, cached = self._execs_snapshot
+        if days == cached_days and time.monotonic() - cached_at < self._TTL["executions"]:
+            return cached
+
         def _fetch(ib: "_ib.IB"):
             since = (datetime.now() - timedelta(days=days)).strftime("%Y%m%d %H:%M:%S")
             ef = _ib.ExecutionFilter(time=since)
@@ -608,9 +785,16 @@ class IBService:
                 })
             return sorted(result, key=lambda x: x["date"], reverse=True)
 
-        import asyncio
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, lambda: _run_in_ib_thread(_fetch, timeout=15)) or []
+        async def _load():
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._pool, lambda: self._call_ib(_fetch, timeout=15))
+            if result is not None:
+                self._execs_snapshot = (time.monotonic(), days, result)
+                return result
+            _, cached_days, cached = self._execs_snapshot
+            return cached if days == cached_days else []
+
+        return await asyncio.shield(self._single_flight(f"executions:{days}", _load))
 
     # ── Place Order ───────────────────────────────────────────────────────
 
@@ -648,12 +832,10 @@ class IBService:
                 "tif": tif,
             }
 
-        import asyncio
         loop = asyncio.get_running_loop()
-        result = await loop.run_in_executor(None, lambda: _run_in_ib_thread(_do, timeout=20, priority=True))
+        result = await loop.run_in_executor(self._pool, lambda: self._call_ib(_do, timeout=20, priority=True))
         if result and "order_id" in result:
-            self._orders_cache_time = 0
-            self._positions_cache_time = 0
+            self._invalidate("orders", "positions", "executions")
             # Log to local trade history
             self._save_trade_log({
                 "time": datetime.now().isoformat(),
@@ -684,11 +866,10 @@ class IBService:
             ib.sleep(0.5)
             return {"cancelled": True, "order_id": order_id}
 
-        import asyncio
         loop = asyncio.get_running_loop()
-        result = await loop.run_in_executor(None, lambda: _run_in_ib_thread(_do, timeout=12, priority=True))
+        result = await loop.run_in_executor(self._pool, lambda: self._call_ib(_do, timeout=12, priority=True))
         if result and result.get("cancelled"):
-            self._orders_cache_time = 0
+            self._invalidate("orders")
         return result or {"error": "timeout"}
 
     async def cancel_all_orders(self) -> Dict:
@@ -701,11 +882,10 @@ class IBService:
             ib.sleep(2)
             return {"cancelled": True}
 
-        import asyncio
         loop = asyncio.get_running_loop()
-        result = await loop.run_in_executor(None, lambda: _run_in_ib_thread(_do, timeout=15, priority=True))
+        result = await loop.run_in_executor(self._pool, lambda: self._call_ib(_do, timeout=15, priority=True))
         if result:
-            self._orders_cache_time = 0
+            self._invalidate("orders")
         return result or {"error": "timeout"}
 
 
@@ -1,4 +1,4 @@
-from typing import List
+from typing import AsyncIterator, List
 from app.scrapers.finviz import FinvizScraper
 from app.scrapers.yahoo import YahooFinanceScraper
 from app.scrapers.marketwatch import MarketWatchScraper
@@ -15,11 +15,63 @@ from app.scrapers.ipo_tracker import IPOTracker
 from app.scrapers import ScraperResult
 from app.config import settings
 import asyncio
+import logging
+import os
+import pickle
+import tempfile
+import time
+
+log = logging.getLogger(__name__)
+
+# Normalized results per source: key -> (epoch time, List[ScraperResult]).
+# Module-level because callers build a fresh IngestionService for every scan; also
+# persisted to disk so a restart within a source's TTL doesn't re-hit every site.
+_SRC_CACHE_FILE = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "data", "scraper_cache.pkl")
+)
+_src_cache: dict = {}
+_src_cache_loaded = False
+_src_cache_dirty = False
+
+
+def _read_src_cache() -> dict:
+    try:
+        if os.path.exists(_SRC_CACHE_FILE):
+            with open(_SRC_CACHE_FILE, 'rb') as f:
+                return pickle.load(f)
+    except Exception as e:
+        log.warning("Scraper cache load failed: %s", e)
+    return {}
+
+
+def _write_src_cache(snapshot: dict):
+    # Scheduled and manually triggered scans can save at the same time — each writes
+    # its own temp file so os.replace never moves a half-written pickle into place
+    tmp = None
+    try:
+        cache_dir = os.path.dirname(_SRC_CACHE_FILE)
+        os.makedirs(cache_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            'wb', dir=cache_dir, prefix=os.path.basename(_SRC_CACHE_FILE) + '.', suffix='.tmp', delete=False
+        ) as f:
+            tmp = f.name
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, _SRC_CACHE_FILE)
+    except Exception as e:
+        log.warning("Scraper cache save failed: %s", e)
+        if tmp and os.path.exists(tmp):
+            os.remove(tmp)
 
 
 class IngestionService:
     """Orchestrates data ingestion from multiple sources"""
 
+    SCRAPE_CONCURRENCY = 6  # scrapers allowed on the network at once
+    SCRAPE_TIMEOUT = 20  # seconds per scraper before it is dropped from the scan
+    # How long a source's results are reused, matched to how often it changes
+    NEWS_TTL = 300
+    SOURCE_TTL = {"ipos": 24 * 3600, "momentum": 60, "price_movers": 60, "social": 120}
+
     def __init__(self):
         # Original scrapers
         self.finviz = FinvizScraper(cookie=settings.finviz_cookie)
@@ -43,51 +95,105 @@ class IngestionService:
     async def scrape_all_sources(self) -> List[ScraperResult]:
         """Scrape all configured sources in parallel for maximum efficiency"""
         all_results = []
+        unique_tickers = set()
+        seen = set()  # (source, url or title) — sources often repeat the same item
 
-        print("\n=== Starting comprehensive market scan ===")
-        print("Scraping from 13+ sources in parallel...\n")
+        log.info("=== Starting comprehensive market scan ===")
+        log.info("Scraping from 13+ sources in parallel...")
 
-        # Run all scrapers in parallel for speed
-        tasks = [
-            self._scrape_with_label("Finviz", self.finviz.scrape()),
-            self._scrape_with_label("Yahoo Finance", self.yahoo.scrape()),
-            self._scrape_with_label("MarketWatch", self.marketwatch.scrape()),
-            self._scrape_with_label("Seeking Alpha", self._convert_to_scraper_result(self.seeking_alpha.get_trending_stocks(), "seeking_alpha")),
-            self._scrape_with_label("Benzinga", self._convert_to_scraper_result(self.benzinga.get_all_benzinga_data(), "benzinga")),
-            self._scrape_with_label("TradingView", self._convert_to_scraper_result(self.tradingview.get_all_tradingview_data(), "tradingview")),
-            self._scrape_with_label("CNBC", self._convert_to_scraper_result(self.cnbc.get_all_cnbc_data(), "cnbc")),
-            self._scrape_with_label("Barron's", self._convert_to_scraper_result(self.barrons.get_all_barrons_data(), "barrons")),
-            self._scrape_with_label("Google Finance", self._convert_to_scraper_result(self.google_finance.get_all_google_finance_data(), "google_finance")),
-            self._scrape_with_label("Social Trending", self._convert_to_scraper_result(self.social_trending.get_trending_stocks(), "social")),
-            self._scrape_with_label("Momentum Scanner", self._convert_to_scraper_result(self.momentum_scanner.scan_momentum_opportunities(), "momentum")),
-            self._scrape_with_label("Price Monitor", self._convert_to_scraper_result(self.price_monitor.get_top_movers_today(), "price_movers")),
-            self._scrape_with_label("IPO Tracker", self._convert_to_scraper_result(self.ipo_tracker.get_upcoming_ipos(), "ipos")),
-        ]
+        async for result in self.iter_all_sources():
+            for item in result:
+                key = (item.source, item.url or item.title)
+                if key in seen:
+                    continue
+                seen.add(key)
+                all_results.append(item)
+                unique_tickers.add(item.tickers[0] if item.tickers else 'N/A')
+
+        log.info("✅ Total items scraped: %d", len(all_results))
+        log.info("📊 Unique tickers found: %d", len(unique_tickers))
+        log.info("=== Scan complete ===")
 
-        # Execute all in parallel
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return all_results
 
-        # Collect results
-        for result in results:
-            if isinstance(result, list):
-                all_results.extend(result)
-            elif isinstance(result, Exception):
-                print(f"  ⚠️  Error in scraper: {result}")
+    async def iter_all_sources(self) -> AsyncIterator[List[ScraperResult]]:
+        """Yield each source's results as soon as that scraper finishes (fastest first)"""
+        global _src_cache_loaded, _src_cache_dirty
+        loop = asyncio.get_running_loop()
+        if not _src_cache_loaded:
+            _src_cache.update(await loop.run_in_executor(None, _read_src_cache))
+            _src_cache_loaded = True
 
-        print(f"\n✅ Total items scraped: {len(all_results)}")
-        print(f"📊 Unique tickers found: {len(set(item.tickers[0] if item.tickers else 'N/A' for item in all_results))}")
-        print("=== Scan complete ===\n")
+        # Run scrapers in parallel, at most SCRAPE_CONCURRENCY at a time, each with its own timeout
+        sem = asyncio.Semaphore(self.SCRAPE_CONCURRENCY)
 
-        return all_results
+        async def _guarded(label: str, coro) -> List[ScraperResult]:
+            async with sem:
+                try:
+                    return await asyncio.wait_for(self._scrape_with_label(label, coro), timeout=self.SCRAPE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    log.warning("✗ %s: timed out after %ss", label, self.SCRAPE_TIMEOUT)
+                    return []
+
+        def _src(label: str, key: str, factory):
+            ttl = self.SOURCE_TTL.get(key, self.NEWS_TTL)
+            return _guarded(label, self._cached(key, ttl, factory))
+
+        def _dict_src(label: str, key: str, fetch):
+            return _src(label, key, lambda: self._convert_to_scraper_result(fetch(), key))
+
+        tasks = [
+            _src("Finviz", "finviz", self.finviz.scrape),
+            _src("Yahoo Finance", "yahoo", self.yahoo.scrape),
+            _src("MarketWatch", "marketwatch", self.marketwatch.scrape),
+            _dict_src("Seeking Alpha", "seeking_alpha", self.seeking_alpha.get_trending_stocks),
+            _dict_src("Benzinga", "benzinga", self.benzinga.get_all_benzinga_data),
+            _dict_src("TradingView", "tradingview", self.tradingview.get_all_tradingview_data),
+            _dict_src("CNBC", "cnbc", self.cnbc.get_all_cnbc_data),
+            _dict_src("Barron's", "barrons", self.barrons.get_all_barrons_data),
+            _dict_src("Google Finance", "google_finance", self.google_finance.get_all_google_finance_data),
+            _dict_src("Social Trending", "social", self.social_trending.get_trending_stocks),
+            _dict_src("Momentum Scanner", "momentum", self.momentum_scanner.scan_momentum_opportunities),
+            _dict_src("Price Monitor", "price_movers", self.price_monitor.get_top_movers_today),
+            _dict_src("IPO Tracker", "ipos", self.ipo_tracker.get_upcoming_ipos),
+        ]
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    result = await next_done
+                except Exception as e:
+                    log.warning("⚠️  Error in scraper: %s", e)
+                    continue
+                if result:
+                    yield result
+        finally:
+            # Also persist when the consumer stops iterating early
+            if _src_cache_dirty:
+                _src_cache_dirty = False
+                await loop.run_in_executor(None, _write_src_cache, dict(_src_cache))
+
+    async def _cached(self, key: str, ttl: float, coro_factory) -> List[ScraperResult]:
+        """Serve a source from _src_cache while younger than ttl, else run it and store the result.
+        Empty results (usually a failed scrape) are not cached so the next scan retries."""
+        global _src_cache_dirty
+        hit = _src_cache.get(key)
+        if hit and time.time() - hit[0] < ttl:
+            return hit[1]
+        results = await coro_factory()
+        if results:
+            _src_cache[key] = (time.time(), results)
+            _src_cache_dirty = True
+        return results
 
     async def _scrape_with_label(self, label: str, coro) -> List[ScraperResult]:
-        """Helper to scrape with status printing"""
+        """Helper to scrape with status logging"""
         try:
             results = await coro
-            print(f"✓ {label}: {len(results)} items")
+            log.info("✓ %s: %d items", label, len(results))
             return results
         except Exception as e:
-            print(f"✗ {label}: Error - {str(e)[:50]}")
+            log.warning("✗ %s: Error - %s", label, str(e)[:50])
             return []
 
     async def _convert_to_scraper_result(self, data_coro, source: str) -> List[ScraperResult]:
@@ -97,6 +203,7 @@ class IngestionService:
         try:
             data = await data_coro
             results = []
+            now = datetime.now()  # default timestamp for items without a parseable published_at
 
             for item in data:
                 try:
@@ -106,13 +213,18 @@ class IngestionService:
 
                     # Parse published_at
                     published_at = item.get('published_at')
-                    if isinstance(published_at, str):
+                    # fromisoformat is C-implemented and accepts a trailing 'Z' on Python 3.11+
+                    if isinstance(published_at, str) and published_at:
                         try:
-                            published_at = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-                        except:
-                            published_at = datetime.now()
+                            published_at = datetime.fromisoformat(published_at)
+                        except ValueError:
+                            published_at = now
                     elif not isinstance(published_at, datetime):
-                        published_at = datetime.now()
+                        published_at = now
+
+                    summary = item.get('summary') or item.get('reason') or ''
+                    if len(summary) > 500:
+                        summary = summary[:500]
 
                     # Create ScraperResult
                     results.append(
@@ -121,7 +233,7 @@ class IngestionService:
                             title=item.get('title', f"{ticker} trending"),
                             url=item.get('url', ''),
                             published_at=published_at,
-                            summary=item.get('summary', item.get('reason', ''))[:500],
+                            summary=summary,
                             tickers=tickers,
                         )
                     )
@@ -130,5 +242,5 @@ class IngestionService:
 
             return results
         except Exception as e:
-            print(f"Error converting {source} data: {e}")
+            log.warning("Error converting %s data: %s", source, e)
             return []
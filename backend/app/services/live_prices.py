@@ -1,95 +1,214 @@
 import yfinance as yf
-from typing import Dict, List
+from typing import Dict, List, Optional
 from datetime import datetime
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import time
+from concurrent.futures import ThreadPoolExecutor, wait as futures_wait
+
+from app.services.ttl_cache import TTLCache
+
+# stock.info lookups for a batch run side by side on this pool
+_INFO_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="yf-info")
+
+# stock.info fields that change rarely — cached for PROFILE_TTL instead of refetched per quote
+_PROFILE_KEYS = ("sector", "industry", "longBusinessSummary", "longName", "shortName", "marketCap")
+
+
+def _ticker_frame(data, ticker: str):
+    """One ticker's OHLCV frame out of a group_by='ticker' yf.download result."""
+    if data is None or data.empty:
+        return None
+    if data.columns.nlevels >= 2:
+        if ticker not in data.columns.get_level_values(0):
+            return None
+        return data[ticker]
+    return data
 
 
 class LivePriceService:
     """Fetches live stock prices, volume, and anomaly detection"""
 
+    QUOTE_TTL = 5  # seconds — price/volume, for real-time feel
+    PROFILE_TTL = 3600  # sector / industry / name / summary / market cap
+
     def __init__(self):
-        self.cache = {}
-        self.cache_expiry = {}
+        self._quotes = TTLCache(maxsize=4096, ttl=self.QUOTE_TTL)
+        self._profiles = TTLCache(maxsize=4096, ttl=self.PROFILE_TTL)
+        # ticker -> running batch fetch that covers it; concurrent callers await the same one
+        self._inflight: Dict[str, asyncio.Task] = {}
 
     async def get_stock_data(self, ticker: str) -> Dict:
         """
         Get real-time stock data for a ticker
         Returns: price, change, volume, volume_anomaly
         """
-        # Check cache (5 second expiry for real-time feel)
-        now = datetime.now()
-        if ticker in self.cache and ticker in self.cache_expiry:
-            if (now - self.cache_expiry[ticker]).total_seconds() < 5:
-                return self.cache[ticker]
+        data = await self._get_many([ticker])
+        return data.get(ticker) or self._empty_data()
+
+    async def _get_many(self, tickers: List[str]) -> Dict[str, Dict]:
+        """Stock data for several tickers — cache hits are served directly, tickers
+        already being fetched join that fetch, and the rest go out in one batch."""
+        result = {}
+        pending: Dict[asyncio.Task, List[str]] = {}
+        to_fetch = []
+        for ticker in tickers:
+            cached = self._quotes.get(ticker)
+            if cached is not None:
+                result[ticker] = cached
+            elif ticker in self._inflight:
+                pending.setdefault(self._inflight[ticker], []).append(ticker)
+            else:
+                to_fetch.append(ticker)
+
+        if to_fetch:
+            task = asyncio.ensure_future(self._fetch_and_cache(to_fetch))
+            for ticker in to_fetch:
+                self._inflight[ticker] = task
+            task.add_done_callback(lambda t, keys=tuple(to_fetch): self._clear_inflight(keys, t))
+            pending[task] = to_fetch
 
+        for task, keys in pending.items():
+            # shield: one caller's cancellation must not abort the fetch for the others
+            fetched = await asyncio.shield(task)
+            for ticker in keys:
+                if ticker in fetched:
+                    result[ticker] = fetched[ticker]
+        return result
+
+    def _clear_inflight(self, keys, task):
+        for ticker in keys:
+            if self._inflight.get(ticker) is task:
+                del self._inflight[ticker]
+
+    async def _fetch_and_cache(self, tickers: List[str]) -> Dict[str, Dict]:
+        profiles = {t: self._profiles.get(t) for t in tickers}
         try:
             # Run yfinance in executor with timeout to avoid blocking
             loop = asyncio.get_event_loop()
-            stock_data = await asyncio.wait_for(
-                loop.run_in_executor(None, self._fetch_stock_data, ticker),
-                timeout=10
+            fetched, new_profiles = await asyncio.wait_for(
+                loop.run_in_executor(None, self._fetch_batch, tickers, profiles),
+                timeout=15
             )
-
-            # Cache result
-            self.cache[ticker] = stock_data
-            self.cache_expiry[ticker] = now
-
-            return stock_data
         except asyncio.TimeoutError:
-            print(f"Timeout fetching {ticker}")
-            return self._empty_data()
+            print(f"Timeout fetching {', '.join(tickers)}")
+            return {}
         except Exception as e:
-            print(f"Error fetching {ticker}: {e}")
-            return self._empty_data()
+            print(f"Error fetching {', '.join(tickers)}: {e}")
+            return {}
+
+        # Cache result
+        for ticker, profile in new_profiles.items():
+            self._profiles[ticker] = profile
+        for ticker, stock_data in fetched.items():
+            self._quotes[ticker] = stock_data
+        return fetched
+
+    def _fetch_batch(self, tickers: List[str], profiles: Dict[str, Optional[Dict]]):
+        """
+        Sync: quotes for all tickers from two batched yf.download calls (daily bars for
+        previous close / volume, 1m bars with pre/post-market for the latest price).
+        Company profile fields come from stock.info, fetched concurrently for tickers
+        without a cached profile. Returns (stock data by ticker, newly fetched profiles).
+        """
+        # Everything must finish inside the caller's 15s wait_for, or the whole batch is lost
+        deadline = time.monotonic() + 12
+        profile_futs = {t: _INFO_POOL.submit(self._fetch_info, t)
+                        for t in tickers if profiles.get(t) is None}
 
-    def _fetch_stock_data(self, ticker: str) -> Dict:
-        """Sync function to fetch stock data (with timeout on stock.info)"""
+        daily = intraday = None
         try:
-            stock = yf.Ticker(ticker)
-
-            # Get current price and volume — stock.info can hang, use timeout
-            try:
-                with ThreadPoolExecutor(max_workers=1) as ex:
-                    info = ex.submit(lambda: stock.info or {}).result(timeout=6)
-            except Exception:
-                info = {}
-
-            # Get the most current price (pre-market, regular, or post-market)
-            current_price = (
-                info.get('preMarketPrice') or  # Pre-market price (priority)
-                info.get('currentPrice') or
-                info.get('regularMarketPrice') or
-                info.get('postMarketPrice') or
-                0
-            )
+            daily = yf.download(tickers, period='3mo', interval='1d', group_by='ticker',
+                                auto_adjust=False, progress=False, threads=True, timeout=10)
+            intraday = yf.download(tickers, period='1d', interval='1m', group_by='ticker',
+                                   prepost=True, auto_adjust=False, progress=False,
+                                   threads=True, timeout=10)
+        except Exception as e:
+            print(f"Batch download failed for {len(tickers)} tickers: {e}")
 
-            prev_close = info.get('previousClose', current_price)
+        # stock.info can hang — one shared deadline for all profiles, so a slow lookup
+        # only blanks its own ticker's profile fields instead of the whole batch
+        if profile_futs:
+            futures_wait(profile_futs.values(), timeout=max(0.0, deadline - time.monotonic()))
 
-            # Calculate daily change
-            # Try to get pre-calculated change first, otherwise calculate manually
-            change_percent = (
-                info.get('preMarketChangePercent') or
-                info.get('regularMarketChangePercent') or
-                info.get('postMarketChangePercent')
+        result = {}
+        new_profiles = {}
+        for ticker in tickers:
+            info = profiles.get(ticker)
+            if info is None:
+                fut = profile_futs[ticker]
+                info = fut.result() if fut.done() else {}
+                if info:
+                    new_profiles[ticker] = {k: info[k] for k in _PROFILE_KEYS if k in info}
+            result[ticker] = self._build_stock_data(
+                ticker, _ticker_frame(daily, ticker), _ticker_frame(intraday, ticker), info
             )
+        return result, new_profiles
+
+    @staticmethod
+    def _fetch_info(ticker: str) -> Dict:
+        try:
+            return yf.Ticker(ticker).info or {}
+        except Exception:
+            return {}
+
+    def _build_stock_data(self, ticker: str, daily, intraday, info: Dict) -> Dict:
+        """Assemble the stock payload from batched bars, falling back to stock.info fields."""
+        try:
+            current_price = prev_close = 0.0
+            current_volume = avg_volume = 0
+            day_high = day_low = 0.0
 
-            if change_percent is None:
-                # Calculate manually if not provided
-                if prev_close and prev_close > 0:
-                    change_dollar = current_price - prev_close
-                    change_percent = (change_dollar / prev_close) * 100
-                else:
-                    change_dollar = 0
-                    change_percent = 0
+            bars = daily.dropna(subset=['Close']) if daily is not None else None
+            if bars is not None and not bars.empty:
+                # Most current price: last 1m bar incl. pre/post-market, else last daily close
+                current_price = float(bars['Close'].iloc[-1])
+                live_day = bars.index[-1].date()
+                if intraday is not None:
+                    closes = intraday['Close'].dropna()
+                    if not closes.empty:
+                        current_price = float(closes.iloc[-1])
+                        live_day = closes.index[-1].date()
+
+                bar_days = bars.index.date
+                prior = bars[bar_days < live_day]
+                today = bars[bar_days == live_day]
+                if not prior.empty:
+                    prev_close = float(prior['Close'].iloc[-1])
+                    avg_volume = float(prior['Volume'].mean())  # ~3-month average
+                if not today.empty:
+                    current_volume = int(today['Volume'].iloc[-1])
+                    day_high = float(today['High'].iloc[-1])
+                    day_low = float(today['Low'].iloc[-1])
+
+            # Fall back to stock.info for anything the bars didn't provide
+            if not current_price:
+                current_price = (
+                    info.get('preMarketPrice') or  # Pre-market price (priority)
+                    info.get('currentPrice') or
+                    info.get('regularMarketPrice') or
+                    info.get('postMarketPrice') or
+                    0
+                )
+            if not prev_close:
+                prev_close = info.get('previousClose', current_price)
+            if not current_volume:
+                current_volume = info.get('volume', 0) or info.get('regularMarketVolume', 0)
+            if not avg_volume:
+                avg_volume = info.get('averageVolume', 0) or info.get('averageDailyVolume10Day', 0)
+            if not day_high:
+                day_high = info.get('dayHigh', 0) or info.get('regularMarketDayHigh', 0) or 0
+            if not day_low:
+                day_low = info.get('dayLow', 0) or info.get('regularMarketDayLow', 0) or 0
+
+            # Calculate daily change
+            if prev_close and prev_close > 0:
+                change_dollar = current_price - prev_close
+                change_percent = (change_dollar / prev_close) * 100
             else:
-                # If we have the percentage, calculate the dollar change
-                change_dollar = (change_percent / 100) * prev_close if prev_close else 0
+                change_dollar = 0
+                change_percent = 0
 
             # Volume analysis
-            current_volume = info.get('volume', 0) or info.get('regularMarketVolume', 0)
-            avg_volume = info.get('averageVolume', 0) or info.get('averageDailyVolume10Day', 0)
-
             volume_ratio = 0
             volume_anomaly = False
             if avg_volume and avg_volume > 0:
@@ -109,8 +228,6 @@ class LivePriceService:
 
             # Extra fields for search results
             market_cap = info.get('marketCap', 0) or 0
-            day_high = info.get('dayHigh', 0) or info.get('regularMarketDayHigh', 0) or 0
-            day_low = info.get('dayLow', 0) or info.get('regularMarketDayLow', 0) or 0
 
             return {
                 "price": round(current_price, 2) if current_price else 0,
@@ -131,7 +248,7 @@ class LivePriceService:
                 "updated_at": datetime.now().astimezone().isoformat()
             }
         except Exception as e:
-            print(f"Error in _fetch_stock_data for {ticker}: {e}")
+            print(f"Error building stock data for {ticker}: {e}")
             return self._empty_data()
 
     def _empty_data(self) -> Dict:
@@ -184,20 +301,8 @@ class LivePriceService:
         # Get unique tickers
         tickers = list(set([s['ticker'] for s in stocks if s.get('ticker')]))
 
-        # Fetch all data in parallel (limit to 10 at a time to avoid rate limits)
-        tasks = []
-        for ticker in tickers[:20]:  # Limit to top 20 tickers
-            tasks.append(self.get_stock_data(ticker))
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Create lookup dict
-        price_data = {}
-        for ticker, result in zip(tickers[:20], results):
-            if isinstance(result, dict):
-                price_data[ticker] = result
-            else:
-                price_data[ticker] = self._empty_data()
+        # Fetch all data in one batch (limit to top 20 tickers)
+        price_data = await self._get_many(tickers[:20])
 
         # Enrich stocks
         enriched_stocks = []
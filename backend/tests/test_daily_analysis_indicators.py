@@ -0,0 +1,152 @@
+"""
+מבחני התאמה לאינדיקטורים של daily_analysis — גרסת NumPy מול הנוסחאות המקוריות (רשימות).
+הרצה: מהתיקייה backend: pytest tests/test_daily_analysis_indicators.py -v
+"""
+import math
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("pandas")
+pytest.importorskip("yfinance")
+pytest.importorskip("aiohttp")
+
+# Backend root on path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services import daily_analysis as da
+
+
+# ── Reference: the original list-based formulas ───────────────────────────────
+
+def _ref_sma(prices: list, period: int):
+    if len(prices) < period:
+        return None
+    return sum(prices[-period:]) / period
+
+
+def _ref_ema(prices: list, period: int) -> list:
+    if len(prices) < period:
+        return []
+    mult = 2 / (period + 1)
+    result = [sum(prices[:period]) / period]
+    for p in prices[period:]:
+        result.append((p - result[-1]) * mult + result[-1])
+    return result
+
+
+def _ref_macd(prices: list):
+    ema12 = _ref_ema(prices, 12)
+    ema26 = _ref_ema(prices, 26)
+    offset = len(ema12) - len(ema26)
+    macd_line = [f - s for f, s in zip(ema12[offset:], ema26)]
+    return macd_line, _ref_ema(macd_line, 9)
+
+
+def _ref_rsi_val(prices: list, period: int):
+    if len(prices) < period + 1:
+        return None
+    p = prices[-(period * 3):]
+    deltas = [p[i + 1] - p[i] for i in range(len(p) - 1)]
+    gains  = [max(d, 0.0) for d in deltas]
+    losses = [max(-d, 0.0) for d in deltas]
+    ag = sum(gains[:period]) / period
+    al = sum(losses[:period]) / period
+    for i in range(period, len(gains)):
+        ag = (ag * (period - 1) + gains[i]) / period
+        al = (al * (period - 1) + losses[i]) / period
+    if al == 0:
+        return 100.0 if ag > 0 else 50.0
+    return round(100 - (100 / (1 + ag / al)), 1)
+
+
+# ── Fixed price series ────────────────────────────────────────────────────────
+
+def _uptrend(n=90):
+    return [100 + 10 * math.sin(i / 7) + 0.3 * i + (i % 5) * 0.7 for i in range(n)]
+
+
+def _downtrend(n=90):
+    return [80 - 0.25 * i + 4 * math.cos(i / 3) - (i % 4) * 0.5 for i in range(n)]
+
+
+SERIES = {
+    "up": _uptrend(),
+    "down": _downtrend(),
+    "short": _uptrend(30),   # too short for MA60 / MACD
+}
+
+
+@pytest.mark.parametrize("name", SERIES)
+@pytest.mark.parametrize("period", [5, 10, 20, 60])
+def test_sma_latest_and_5_bars_back(name, period):
+    closes = SERIES[name]
+    series = da._sma_series(np.array(closes), period)
+
+    expected = _ref_sma(closes, period)
+    got = da._ma_at(series)
+    if expected is None:
+        assert got is None
+    else:
+        assert got == pytest.approx(expected, rel=1e-12)
+
+    # ma*_5d: the SMA as it stood 5 bars ago
+    expected_5d = _ref_sma(closes[:-5], period)
+    got_5d = da._ma_at(series, 5)
+    if expected_5d is None:
+        assert got_5d is None
+    else:
+        assert got_5d == pytest.approx(expected_5d, rel=1e-12)
+
+
+@pytest.mark.parametrize("name", SERIES)
+@pytest.mark.parametrize("period", [9, 12, 26])
+def test_ema_seeded_with_sma(name, period):
+    closes = SERIES[name]
+    expected = _ref_ema(closes, period)
+    got = da._ema(np.array(closes), period)
+    assert len(got) == len(expected)
+    assert list(got) == pytest.approx(expected, rel=1e-12)
+
+
+@pytest.mark.parametrize("name", ["up", "down"])
+def test_macd_matches_reference(name):
+    closes = SERIES[name]
+    macd_line, signal_line = _ref_macd(closes)
+    dif, dea = macd_line[-1], signal_line[-1]
+
+    _, _, raw = da._calc_macd_score(np.array(closes))
+    assert raw['dif'] == pytest.approx(round(dif, 4), abs=1e-4)
+    assert raw['dea'] == pytest.approx(round(dea, 4), abs=1e-4)
+    assert raw['bar'] == pytest.approx(round((dif - dea) * 2, 4), abs=1e-4)
+
+
+def test_macd_needs_40_bars():
+    assert da._calc_macd_score(np.array(SERIES["short"])) == ('—', 8, {})
+
+
+@pytest.mark.parametrize("name", SERIES)
+def test_rsi_window_matches_reference(name):
+    closes = SERIES[name]
+    _, _, raw = da._calc_rsi_score(np.array(closes))
+    for period in (6, 12, 24):
+        expected = _ref_rsi_val(closes, period)
+        got = raw[f'rsi{period}']
+        if expected is None:
+            assert got is None
+        else:
+            assert got == pytest.approx(expected, abs=0.1)
+
+
+def test_rsi_flat_and_rising_edges():
+    flat = np.array([50.0] * 40)
+    rising = np.array([50.0 + i for i in range(40)])
+    deltas = np.diff(flat)
+    assert da._calc_rsi_val(np.maximum(deltas, 0.0), np.maximum(-deltas, 0.0), 12) == 50.0
+    deltas = np.diff(rising)
+    assert da._calc_rsi_val(np.maximum(deltas, 0.0), np.maximum(-deltas, 0.0), 12) == 100.0
+    # Fewer than period deltas → no value, as before
+    deltas = np.diff(rising[:12])
+    assert da._calc_rsi_val(np.maximum(deltas, 0.0), np.maximum(-deltas, 0.0), 12) is None
@@ -0,0 +1,99 @@
+"""
+מבחנים ל-TTLCache — תפוגה, פינוי LRU ו-ttl לכל רשומה.
+הרצה: מהתיקייה backend: pytest tests/test_ttl_cache.py -v
+"""
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# Backend root on path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services import ttl_cache
+from app.services.ttl_cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for the cache module."""
+    now = [1000.0]
+    monkeypatch.setattr(ttl_cache, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def test_get_before_and_after_expiry(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("a", 1)
+    clock[0] += 9.9
+    assert cache.get("a") == 1
+    clock[0] += 0.1
+    assert cache.get("a") is None
+    assert cache.get("a", "missing") == "missing"
+    assert len(cache) == 0  # expired entry is removed on read
+
+
+def test_per_call_ttl_overrides_default(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("short", 1, ttl=2)
+    cache.set("long", 2, ttl=60)
+    clock[0] += 5
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+    clock[0] += 56
+    assert cache.get("long") is None
+
+
+def test_lru_eviction_at_maxsize(clock):
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "a" is now most recently used
+    cache.set("c", 3)
+    assert len(cache) == 2
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_set_refreshes_deadline_and_recency(clock):
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    clock[0] += 8
+    cache["a"] = 11  # rewrite: new deadline, most recently used
+    cache.set("c", 3)
+    assert "b" not in cache
+    clock[0] += 8
+    assert cache["a"] == 11
+
+
+def test_contains_and_getitem_on_expired_key(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache["a"] = 1
+    assert "a" in cache
+    assert cache["a"] == 1
+    clock[0] += 10
+    assert "a" not in cache
+    with pytest.raises(KeyError):
+        cache["a"]
+    with pytest.raises(KeyError):
+        cache["never-set"]
+
+
+def test_falsy_values_are_hits(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache["empty"] = {}
+    assert "empty" in cache
+    assert cache["empty"] == {}
+
+
+def test_pop_and_clear(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.pop("a") == 1
+    assert cache.pop("a", "gone") == "gone"
+    cache.clear()
+    assert len(cache) == 0